@@ -0,0 +1,168 @@
+#! /usr/bin/env python3
+
+# ------------------------------------------------------------
+# background.py
+# Frame-budgeted animated lofi background for the Lofi Sudoku Game
+# By: Beck Bishp
+# Last Updated: 10/18/2026
+# ------------------------------------------------------------
+
+import math
+import random
+import time
+
+import pygame
+
+from constants import BLACK, FPS, SKY_TOP_COLOR, SKY_BOTTOM_COLOR, STAR_COLOR, MOON_COLOR
+from constants import FAR_SKYLINE_COLOR, NEAR_SKYLINE_COLOR, LIT_WINDOW_COLOR, MOTE_COLOR
+from constants import BACKGROUND_SEED, BACKGROUND_MOTES, BACKGROUND_BUDGET
+from constants import BACKGROUND_SLOW_FRAMES, BACKGROUND_RECOVER_SECONDS
+from profiler import profiler
+
+# Quality levels from best to cheapest: (motes shown, seconds between
+# animation frames). At the last level the picture stands still.
+QUALITY_LEVELS = (
+    (True, 1 / FPS),
+    (False, 1 / FPS),
+    (False, 2 / FPS),
+    (False, 4 / FPS),
+    (False, None),
+)
+
+# Scroll speed of each skyline layer in pixels per second (far, near)
+LAYER_SPEEDS = (4, 11)
+
+
+def _skyline(size, rng, color, heights, widths, window_chance):
+    """A layer of building silhouettes as wide as the window that tiles sideways."""
+    width, height = size
+    layer = pygame.Surface(size).convert()
+    layer.fill(BLACK)
+    x = 0
+    while x < width:
+        building = pygame.Rect(x, 0, rng.randint(*widths), int(height * rng.uniform(*heights)))
+        building.bottom = height
+        windows = [(wx, wy) for wx in range(building.x + 4, building.right - 5, 7)
+                   for wy in range(building.y + 6, height - 8, 9) if rng.random() < window_chance]
+        # A building past the right edge is drawn again at the left, so
+        # the two copies blitted side by side meet without a seam
+        for shift in (0, -width):
+            layer.fill(color, building.move(shift, 0))
+            for wx, wy in windows:
+                layer.fill(LIT_WINDOW_COLOR, (wx + shift, wy, 3, 4))
+        x = building.right + rng.randint(0, 6)
+    layer.set_colorkey(BLACK, pygame.RLEACCEL)
+    return layer
+
+
+# ------------------------------------------------------------
+# LofiBackground Class
+# ------------------------------------------------------------
+
+class LofiBackground:
+    """Night city skyline that scrolls slowly behind the game.
+
+    Everything is rendered once when the background is built: the sky (with
+    its stars and moon) and two skyline layers as convert()ed surfaces as
+    wide as the window. A frame is then two blits per layer at offsets taken
+    from the clock, so the motion keeps its speed when frames are skipped.
+    The result is kept in scene for the caller to put under the UI.
+
+    The animation keeps to a time budget: end_frame() is told how long each
+    pass of the main loop took, and the quality level steps down (no motes,
+    fewer animation frames, then a still picture) while frames run over
+    BACKGROUND_BUDGET of the frame time, and back up after
+    BACKGROUND_RECOVER_SECONDS of cheap frames. That is wall time, not a
+    frame count: once the picture stands still the loop only wakes for input
+    or every IDLE_TIMEOUT_MS, and quality still has to come back.
+    """
+
+    def __init__(self, size):
+        self.budget = BACKGROUND_BUDGET / FPS
+        self.level = 0
+        self.slow_frames = 0
+        self.fast_since = None    # When the current run of cheap frames began
+        self.started = time.perf_counter()
+        self.build(size)
+
+    def build(self, size):
+        """Render the layers for a window size."""
+        width, height = size
+        rng = random.Random(BACKGROUND_SEED)
+
+        self.sky = pygame.Surface(size).convert()
+        for y in range(height):
+            t = y / max(height - 1, 1)
+            self.sky.fill([round(a + (b - a) * t) for a, b in zip(SKY_TOP_COLOR, SKY_BOTTOM_COLOR)],
+                          (0, y, width, 1))
+        for _ in range(width * height // 2500):
+            self.sky.fill(STAR_COLOR, (rng.randrange(width), rng.randrange(height * 2 // 3), 1, 1))
+        pygame.draw.circle(self.sky, MOON_COLOR, (width * 4 // 5, height // 6), max(height // 25, 4))
+
+        self.layers = [
+            (_skyline(size, rng, FAR_SKYLINE_COLOR, (0.25, 0.45), (22, 46), 0.12), LAYER_SPEEDS[0]),
+            (_skyline(size, rng, NEAR_SKYLINE_COLOR, (0.12, 0.30), (30, 60), 0.2), LAYER_SPEEDS[1]),
+        ]
+
+        self.mote = pygame.Surface((3, 3)).convert()
+        self.mote.fill(BLACK)
+        self.mote.fill(MOTE_COLOR, (1, 0, 1, 3))
+        self.mote.fill(MOTE_COLOR, (0, 1, 3, 1))
+        self.mote.set_colorkey(BLACK, pygame.RLEACCEL)
+        # (x, y, rising speed in px/s, sway phase)
+        self.motes = [(rng.uniform(0, width), rng.uniform(0, height), rng.uniform(4, 12), rng.uniform(0, math.tau))
+                      for _ in range(BACKGROUND_MOTES)]
+
+        self.size = size
+        self.scene = pygame.Surface(size).convert()
+        self.last_drawn = None
+
+    @property
+    def animating(self):
+        """Whether the picture still moves at the current quality level."""
+        return QUALITY_LEVELS[self.level][1] is not None
+
+    @profiler.timed("draw_background")
+    def update(self, now=None):
+        """Redraw scene if the animation is due a new frame. Returns True if it changed."""
+        now = time.perf_counter() if now is None else now
+        show_motes, interval = QUALITY_LEVELS[self.level]
+        if self.last_drawn is not None and (interval is None or now - self.last_drawn < interval):
+            return False
+        self.last_drawn = now
+
+        elapsed = now - self.started
+        scene = self.scene
+        width, height = self.size
+        scene.blit(self.sky, (0, 0))
+        for layer, speed in self.layers:
+            offset = int(elapsed * speed) % width
+            scene.blit(layer, (-offset, 0))
+            scene.blit(layer, (width - offset, 0))
+        if show_motes:
+            for x, y, speed, phase in self.motes:
+                scene.blit(self.mote, (int(x + 6 * math.sin(elapsed * 0.6 + phase)) % width,
+                                       int(y - elapsed * speed) % height))
+        return True
+
+    def end_frame(self, seconds, now=None):
+        """Adapt the quality level to how long the last pass of the main loop
+        took, in seconds (not counting the time spent waiting for the next frame)."""
+        now = time.perf_counter() if now is None else now
+        if seconds > self.budget:
+            self.fast_since = None
+            self.slow_frames += 1
+            if self.slow_frames >= BACKGROUND_SLOW_FRAMES and self.level < len(QUALITY_LEVELS) - 1:
+                self.level += 1
+                self.slow_frames = 0
+            return
+        self.slow_frames = 0
+        if seconds < self.budget / 2:
+            if self.fast_since is None:
+                self.fast_since = now
+            elif now - self.fast_since >= BACKGROUND_RECOVER_SECONDS and self.level > 0:
+                self.level -= 1
+                self.fast_since = now
+                self.last_drawn = None
+        else:
+            self.fast_since = None
@@ -0,0 +1,190 @@
+#! /usr/bin/env python3
+
+# ------------------------------------------------------------
+# batch_validator.py
+# Vectorized validation of whole stacks of boards with NumPy
+# By: Beck Bishp
+# Last Updated: 10/18/2026
+#
+# Usage:
+#   python batch_validator.py [puzzle_bank.bin]     # audit every puzzle in a bank
+#
+# Needs NumPy, which the game itself does not (uv sync --extra batch).
+# ------------------------------------------------------------
+#
+# A stack is an (N, size, size) uint8 array, 0 for blanks. Each check
+# returns a boolean mask with one entry per board, so a million boards are
+# checked with a handful of array operations instead of a Python loop per
+# cell. Digits become bits, and a unit has no repeats exactly when the sum
+# of its bits equals their OR (a repeated digit carries into another bit).
+# Values past the board size (e.g. a corrupt nibble of 10-15 in a 9x9
+# bank record) make a board invalid before any bits are compared.
+
+import argparse
+import math
+import sys
+import time
+from collections import namedtuple
+from functools import cache
+
+import numpy as np
+
+from board import Board, geometry
+from constants import PUZZLE_BANK_PATH, DIFFICULTY_NAMES, DIFFICULTY_TIERS
+from puzzle_bank import PuzzleBank
+
+CHUNK_SIZE = 1 << 16    # Boards checked at once, to bound the temporary arrays
+
+PairCheck = namedtuple("PairCheck", "puzzle_valid solution_valid solution_complete agrees ok")
+PlayerCheck = namedtuple("PlayerCheck", "valid complete correct")
+
+
+# ------------------------------------------------------------
+# Building Stacks
+# ------------------------------------------------------------
+
+def as_stack(boards):
+    """Turn Boards, lists of rows, or an array into an (N, size, size) uint8 stack."""
+    if isinstance(boards, np.ndarray):
+        stack = boards.astype(np.uint8, copy=False)
+    else:
+        boards = [board if isinstance(board, Board) else Board.from_rows(board) for board in boards]
+        if not boards:
+            raise ValueError("no boards to stack")
+        cells = b"".join(bytes(board.cells) for board in boards)
+        stack = np.frombuffer(cells, dtype=np.uint8).reshape(len(boards), -1)
+    if stack.ndim == 2:
+        # (N, cells) rows, as read straight from a bank
+        size = math.isqrt(stack.shape[1])
+        stack = stack.reshape(-1, size, size)
+    else:
+        stack = stack.reshape(-1, stack.shape[-2], stack.shape[-1])
+    return stack
+
+
+def bank_stacks(bank, tier):
+    """A bank tier as (puzzles, solutions) stacks, split from its nibble-packed records."""
+    records = np.frombuffer(bank.records(tier), dtype=np.uint8).reshape(-1, 9, 9)
+    return records >> 4, records & 0x0F
+
+
+# ------------------------------------------------------------
+# Checks
+# ------------------------------------------------------------
+
+def _chunked(check, *stacks):
+    # Runs check over CHUNK_SIZE boards at a time and joins the masks
+    count = len(stacks[0])
+    if count <= CHUNK_SIZE:
+        return check(*stacks)
+    return np.concatenate([check(*(stack[i:i + CHUNK_SIZE] for stack in stacks))
+                           for i in range(0, count, CHUNK_SIZE)])
+
+
+@cache
+def _unit_index(box):
+    # (3 * size, size) cell indices of every row, column and box
+    return np.array(geometry(box).units, dtype=np.intp)
+
+
+def _units_valid(stack):
+    size = stack.shape[-1]
+    flat = stack.reshape(len(stack), -1)
+    # Digit d becomes bit d - 1 and a blank becomes 0. 9x9 units fit in 16
+    # bits; larger ones need 32 so that a sum with repeats cannot wrap around
+    dtype = np.uint16 if size <= 9 else np.uint32
+    in_range = (flat <= size).all(axis=1)
+    # Out of range values become blanks so their shifts stay in the dtype
+    bits = np.left_shift(1, np.where(flat <= size, flat, 0), dtype=dtype) >> 1
+    units = bits[:, _unit_index(math.isqrt(size))]
+    return in_range & (np.add.reduce(units, axis=2, dtype=dtype) == np.bitwise_or.reduce(units, axis=2)).all(axis=1)
+
+
+def units_valid(stack):
+    """Mask of boards with no digit repeated in any row, column or box (blanks
+    allowed), and no value past the board size."""
+    return _chunked(_units_valid, as_stack(stack))
+
+
+def complete(stack):
+    """Mask of boards with every cell filled with a digit from 1 up to the board size."""
+    stack = as_stack(stack)
+    flat = stack.reshape(len(stack), -1)
+    return ((flat >= 1) & (flat <= stack.shape[-1])).all(axis=1)
+
+
+def agrees(puzzles, solutions):
+    """Mask of pairs where every given of the puzzle matches the solution."""
+    puzzles, solutions = as_stack(puzzles), as_stack(solutions)
+    return ((puzzles == 0) | (puzzles == solutions)).reshape(len(puzzles), -1).all(axis=1)
+
+
+def check_pairs(puzzles, solutions):
+    """Check a stack of puzzles against their solutions. Returns a PairCheck of masks.
+
+    ok is set where the solution is a complete, valid grid that keeps all
+    of the puzzle's givens, i.e. it really solves the puzzle. (Whether it
+    is the only solution needs a solver.)
+    """
+    puzzles, solutions = as_stack(puzzles), as_stack(solutions)
+    if puzzles.shape != solutions.shape:
+        raise ValueError(f"puzzle stack {puzzles.shape} and solution stack {solutions.shape} differ")
+    puzzle_valid = units_valid(puzzles)
+    solution_valid = units_valid(solutions)
+    solution_complete = complete(solutions)
+    givens_match = agrees(puzzles, solutions)
+    ok = puzzle_valid & solution_valid & solution_complete & givens_match
+    return PairCheck(puzzle_valid, solution_valid, solution_complete, givens_match, ok)
+
+
+def check_players(puzzles, players, solutions):
+    """Check player boards (0 on the givens) as the game does. Returns a PlayerCheck of masks.
+
+    valid: no repeats with the givens filled in; complete: every open cell
+    filled (BoardState.is_complete); correct: every open cell matches the
+    solution (BoardState.is_solved).
+    """
+    puzzles, players, solutions = as_stack(puzzles), as_stack(players), as_stack(solutions)
+    boards = np.where(puzzles != 0, puzzles, players)
+    flat = lambda a: a.reshape(len(a), -1)
+    open_cells = flat(puzzles == 0)
+    correct = (~open_cells | (flat(players) == flat(solutions))).all(axis=1)
+    return PlayerCheck(units_valid(boards), complete(boards), correct)
+
+
+# ------------------------------------------------------------
+# Bank Audit
+# ------------------------------------------------------------
+
+def audit_bank(path):
+    """Check every puzzle in a bank. Returns {tier: (puzzles, failed indices)}."""
+    results = {}
+    with PuzzleBank(path) as bank:
+        for tier in range(bank.tiers):
+            if not bank.count(tier):
+                results[tier] = (0, np.empty(0, dtype=np.int64))
+                continue
+            report = check_pairs(*bank_stacks(bank, tier))
+            results[tier] = (bank.count(tier), np.flatnonzero(~report.ok))
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Check every puzzle in a puzzle bank with NumPy.")
+    parser.add_argument("bank", nargs="?", default=PUZZLE_BANK_PATH)
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    results = audit_bank(args.bank)
+    elapsed = time.perf_counter() - start
+
+    labels = {difficulty: name for name, difficulty in DIFFICULTY_NAMES.items()}
+    total = sum(count for count, _ in results.values())
+    bad = 0
+    for tier, (count, failed) in results.items():
+        bad += len(failed)
+        name = labels[DIFFICULTY_TIERS[tier]] if tier < len(DIFFICULTY_TIERS) else f"tier {tier}"
+        sample = ", ".join(map(str, failed[:10]))
+        print(f"{name}: {count} puzzles, {len(failed)} failed" + (f" (e.g. {sample})" if sample else ""))
+    print(f"checked {total} puzzles in {elapsed:.2f}s ({total / elapsed if elapsed else 0:,.0f} puzzles/sec)")
+    sys.exit(1 if bad else 0)
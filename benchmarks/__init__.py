@@ -0,0 +1,5 @@
+# ------------------------------------------------------------
+# benchmarks
+# Performance scripts for the Lofi Sudoku Game.
+# Run from the project root, e.g. `python -m benchmarks.solvers`
+# ------------------------------------------------------------
@@ -0,0 +1,101 @@
+#! /usr/bin/env python3
+
+# ------------------------------------------------------------
+# benchmarks/legacy.py
+# Immediate-mode drawing and full-scan checks the game used to run
+# By: Beck Bishp
+# Last Updated: 10/18/2026
+#
+# The game now draws with the retained BoardRenderer and keeps its counts
+# in BoardState. These are the versions that scanned or redrew every cell
+# each frame, kept only so the benchmark suite can time them against the
+# replacements.
+# ------------------------------------------------------------
+
+import pygame
+
+from board import SYMBOLS
+from constants import WHITE, PLAYER_NUMBER_COLOR, INCORRECT_COLOR, BOX_SIZE
+from layout import DEFAULT_LAYOUT
+from text_cache import text_cache
+
+
+# ------------------------------------------------------------
+# Board Checks
+# ------------------------------------------------------------
+
+def is_board_complete(puzzle_board, player_board):
+    """Check if all cells are filled (no empty cells remaining)."""
+    for original, player in zip(puzzle_board.cells, player_board.cells):
+        if not original and not player:
+            return False
+    return True
+
+
+def check_solution(puzzle_board, player_board, solution_board):
+    """Check if the player's solution is correct."""
+    for original, player, solution in zip(puzzle_board.cells, player_board.cells, solution_board.cells):
+        if not original and player != solution:
+            return False
+    return True
+
+
+def is_cell_correct(row, col, puzzle_board, player_board, solution_board):
+    """Check if a specific player's entered cell is correct."""
+    if not puzzle_board[row, col]:
+        player_value = player_board[row, col]
+        if player_value:
+            return player_value == solution_board[row, col]
+    return True
+
+
+# ------------------------------------------------------------
+# Drawing Functions
+# ------------------------------------------------------------
+
+def draw_puzzle(surface, puzzle_board, player_board, solution_board, font, show_hints=True,
+                layout=DEFAULT_LAYOUT):
+    """Draw the puzzle numbers onto the grid."""
+    cell_size, (margin_x, margin_y) = layout.board(puzzle_board.box)
+
+    for row in range(puzzle_board.size):
+        for col in range(puzzle_board.size): 
+            original_value = puzzle_board[row, col] 
+            player_value = player_board[row, col]
+
+            if original_value:
+                value = original_value
+                color = WHITE
+            elif player_value:
+                value = player_value
+                if show_hints:
+                    if is_cell_correct(row, col, puzzle_board, player_board, solution_board):
+                        color = PLAYER_NUMBER_COLOR
+                    else:
+                        color = INCORRECT_COLOR
+                else:
+                    color = PLAYER_NUMBER_COLOR  # No hints - always green
+            else:
+                continue
+
+            text_surface = text_cache.render(font, SYMBOLS[value], True, color)
+            text_rect = text_surface.get_rect()
+            cell_center_x = margin_x + col * cell_size + cell_size // 2
+            cell_center_y = margin_y + row * cell_size + cell_size // 2
+            text_rect.center = (cell_center_x, cell_center_y)
+            surface.blit(text_surface, text_rect)
+
+
+def draw_grid(surface, box=BOX_SIZE, layout=DEFAULT_LAYOUT):
+    """Draws the sudoku grid on the surface."""
+    cell_size, (margin_x, margin_y) = layout.board(box)
+    size = box * box
+    board_px = cell_size * size
+
+    for i in range(size + 1):
+        line_width = 4 if i % box == 0 else 1
+        x = margin_x + i * cell_size 
+        pygame.draw.line(surface, WHITE, (x, margin_y), (x, margin_y + board_px), line_width)
+        
+        y = margin_y + i * cell_size
+        pygame.draw.line(surface, WHITE, (margin_x, y), (margin_x + board_px, y), line_width)
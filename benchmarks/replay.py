@@ -0,0 +1,194 @@
+#! /usr/bin/env python3
+
+# ------------------------------------------------------------
+# benchmarks/replay.py
+# Replays scripted or random event streams through the headless game core
+# By: Beck Bishp
+# Last Updated: 10/18/2026
+#
+# Usage:
+#   python -m benchmarks.replay --events 1000000             # random stream, timed
+#   python -m benchmarks.replay --events 200000 --check      # fuzz: verify state after every step
+#   python -m benchmarks.replay --script moves.json          # [["select", [0, 2]], ["digit", 5], ...]
+# ------------------------------------------------------------
+
+import argparse
+import json
+import random
+import sys
+import time
+from collections import Counter
+
+from constants import EASY_DIFFICULTY, MEDIUM_DIFFICULTY, HARD_DIFFICULTY, BOX_SIZES
+from constants import STATE_MENU, STATE_PLAYING, STATE_LOADING, STATE_GAME_OVER
+from game_core import GameCore, GameEvent
+from game_core import SET_DIFFICULTY, SET_BOX_SIZE, TOGGLE_HINTS, START, PLAY_ID, RESUME, SELECT, DIGIT, CLEAR
+from game_core import UNDO, REDO, TOGGLE_NOTES, SHOW_SOLUTION, NEW_GAME, PLAY_AGAIN, MENU
+from puzzle_ids import make_puzzle_id, puzzle_cache
+
+# Every game in a replay uses this one puzzle, so scripts (and the random
+# stream's "solve it" bursts) know the answer.
+REPLAY_ID = make_puzzle_id(MEDIUM_DIFFICULTY, 2026)
+
+
+# ------------------------------------------------------------
+# Event Streams
+# ------------------------------------------------------------
+
+def solve_events(puzzle_board, solution_board):
+    """Events that fill in every open cell correctly, winning the game."""
+    events = []
+    for idx in range(len(puzzle_board.cells)):
+        if not puzzle_board.cells[idx]:
+            events.append(GameEvent(SELECT, divmod(idx, puzzle_board.size)))
+            events.append(GameEvent(DIGIT, solution_board.cells[idx]))
+    return events
+
+
+def random_events(count, rng, puzzle_board, solution_board):
+    """A random event stream. It does not look at the game state, so most
+    events are ignored by whatever state the game happens to be in, just
+    like stray input. Now and then it plays a full winning game."""
+    kinds = [SELECT, DIGIT, CLEAR, UNDO, REDO, TOGGLE_NOTES, START, RESUME, PLAY_AGAIN, SHOW_SOLUTION,
+             NEW_GAME, MENU, SET_DIFFICULTY, SET_BOX_SIZE, TOGGLE_HINTS, PLAY_ID]
+    weights = [30, 35, 8, 6, 3, 3, 5, 2, 4, 1, 2, 1, 2, 1, 1, 1]
+    size = puzzle_board.size
+    difficulties = (EASY_DIFFICULTY, MEDIUM_DIFFICULTY, HARD_DIFFICULTY)
+    winning = solve_events(puzzle_board, solution_board)
+
+    events = []
+    while len(events) < count:
+        if rng.random() < 0.002:
+            events.extend(winning)
+            continue
+        kind = rng.choices(kinds, weights)[0]
+        if kind == SELECT:
+            value = (rng.randrange(size), rng.randrange(size)) if rng.random() < 0.95 else None
+        elif kind == DIGIT:
+            # Now and then a digit too big for the board, as a letter key gives
+            value = rng.randint(1, size) if rng.random() < 0.98 else size + 1
+        elif kind == SET_DIFFICULTY:
+            value = rng.choice(difficulties)
+        elif kind == SET_BOX_SIZE:
+            value = rng.choice(BOX_SIZES)
+        elif kind == PLAY_ID:
+            value = REPLAY_ID if rng.random() < 0.5 else rng.choice(["", "X-1", "M-", "#m-1z"])
+        else:
+            value = None
+        events.append(GameEvent(kind, value))
+    return events[:count]
+
+
+def load_script(path):
+    """Read a JSON list of [kind, value] pairs."""
+    with open(path) as f:
+        return [GameEvent(kind, tuple(value) if isinstance(value, list) else value)
+                for kind, value in json.load(f)]
+
+
+# ------------------------------------------------------------
+# Invariant Checks
+# ------------------------------------------------------------
+
+def check(core):
+    """Raise AssertionError if the core's state is inconsistent."""
+    assert core.state in (STATE_MENU, STATE_LOADING, STATE_PLAYING, STATE_GAME_OVER), core.state
+    board_state = core.board_state
+    if board_state is None:
+        return
+    puzzle, player, solution = board_state.puzzle_board, board_state.player_board, board_state.solution_board
+    size, box = puzzle.size, puzzle.box
+    filled = mismatches = 0
+    for idx in range(len(puzzle.cells)):
+        value = player.cells[idx]
+        if puzzle.cells[idx]:
+            assert not value, f"given cell {divmod(idx, size)} was overwritten"
+        elif value:
+            filled += 1
+            mismatches += value != solution.cells[idx]
+    assert board_state.filled == filled, (board_state.filled, filled)
+    assert board_state.mismatches == mismatches, (board_state.mismatches, mismatches)
+
+    if not core.solution_revealed:
+        # The moves up to the log's position, played on an empty board,
+        # give the player's board
+        moves = board_state.moves
+        replayed = bytearray(len(puzzle.cells))
+        for i in range(0, moves.position * 3, 3):
+            idx, old, new = moves.entries[i:i + 3]
+            assert replayed[idx] == old, f"move {i // 3} at {divmod(idx, size)} expected {old}"
+            replayed[idx] = new
+        assert replayed == player.cells, "the move log does not match the board"
+
+    grid = board_state.grid
+    for row in range(size):
+        for col in range(size):
+            value = puzzle[row, col] or player[row, col]
+            assert 0 <= value <= size, (row, col, value)
+            assert grid.values[row][col] == value, (row, col)
+            unit = (row // box, col // box)
+            expected = sum(1 for r in range(size) for c in range(size)
+                           if (puzzle[r, c] or player[r, c]) == value and (r == row or c == col or
+                                                                       (r // box, c // box) == unit)) > 1
+            assert not value or grid.is_conflict(row, col) == expected, (row, col)
+
+    if core.selected_cell is not None:
+        assert not puzzle[core.selected_cell], "a given cell is selected"
+    if core.game_won:
+        assert board_state.is_solved() and not core.solution_revealed
+
+
+# ------------------------------------------------------------
+# Runner
+# ------------------------------------------------------------
+
+def replay(events, batch=16, checked=False):
+    """Feed events to a fresh GameCore, batch events per step(). Returns stats."""
+    boards = puzzle_cache.get(REPLAY_ID)
+    core = GameCore(lambda difficulty, box: boards + (REPLAY_ID,), puzzle_cache.get)
+    states = Counter()
+    wins = 0
+
+    start = time.perf_counter()
+    for i in range(0, len(events), batch):
+        won = core.game_won
+        state = core.step(events[i:i + batch])
+        states[state] += 1
+        wins += core.game_won and not won
+        if checked:
+            try:
+                check(core)
+            except AssertionError as error:
+                raise AssertionError(f"after events {i}..{i + batch - 1} "
+                                     f"{events[i:i + batch]}: {error}") from None
+    elapsed = time.perf_counter() - start
+    return {"events": len(events), "steps": sum(states.values()), "seconds": elapsed,
+            "events_per_sec": len(events) / elapsed if elapsed else float("inf"),
+            "states": dict(states), "wins": wins}
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Replay event streams through the headless game core.")
+    parser.add_argument("--events", type=int, default=500000, help="length of the random stream")
+    parser.add_argument("--seed", type=int, default=1, help="seed for the random stream")
+    parser.add_argument("--script", metavar="PATH", help="replay a JSON event script instead")
+    parser.add_argument("--batch", type=int, default=16, help="events per step() call")
+    parser.add_argument("--check", action="store_true", help="verify the game state after every step")
+    args = parser.parse_args()
+
+    if args.script:
+        events = load_script(args.script)
+    else:
+        puzzle_board, solution_board = puzzle_cache.get(REPLAY_ID)
+        events = random_events(args.events, random.Random(args.seed), puzzle_board, solution_board)
+
+    try:
+        stats = replay(events, args.batch, args.check)
+    except AssertionError as error:
+        print(f"invariant broken (seed {args.seed}): {error}")
+        sys.exit(1)
+
+    print(f"{stats['events']} events in {stats['steps']} steps, {stats['seconds']:.3f}s "
+          f"({stats['events_per_sec']:,.0f} events/sec)")
+    print("steps ending in: " + ", ".join(f"{state} {count}" for state, count in stats["states"].items()))
+    print(f"wins: {stats['wins']}")
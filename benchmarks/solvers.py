@@ -0,0 +1,141 @@
+#! /usr/bin/env python3
+
+# ------------------------------------------------------------
+# benchmarks/solvers.py
+# Compares the Sudoku solvers on easy and adversarial boards
+# By: Beck Bishp
+# Last Updated: 10/18/2026
+#
+# Usage: python -m benchmarks.solvers [--repeat N] [--timeout SECONDS]
+# ------------------------------------------------------------
+
+import argparse
+import multiprocessing
+import statistics
+import time
+
+import dlx
+import solver
+
+
+# ------------------------------------------------------------
+# Test Boards
+# ------------------------------------------------------------
+
+def parse(text):
+    """Turn an 81 character string ('0' or '.' for blanks) into a 9x9 board."""
+    digits = [0 if ch in "0." else int(ch) for ch in text]
+    return [digits[i:i + 9] for i in range(0, 81, 9)]
+
+
+CASES = {
+    "easy": parse("530070000600195000098000060800060003400803001700020006060000280000419005000080079"),
+    "hard": parse("800000000003600000070090200050007000000045700000100030001000068008500010090000400"),
+    "17-clue": parse("000000010400000000020000000000050407008000300001090000300400200050100000000806000"),
+    "empty": parse("0" * 81),
+    "no solution": parse("000005080000601043000000000010500000000106000300000005530000061000000004000000000"),
+}
+
+
+# ------------------------------------------------------------
+# Solvers
+# ------------------------------------------------------------
+
+def backtracker_solve(grid):
+    """The original generate_solved_grid backtracker, kept as a reference."""
+    grid = [[value or 0 for value in row] for row in grid]
+
+    def is_valid(grid, row, col, num):
+        if num in grid[row]:
+            return False
+        if num in [grid[i][col] for i in range(9)]:
+            return False
+        box_row, box_col = 3 * (row // 3), 3 * (col // 3)
+        for i in range(box_row, box_row + 3):
+            for j in range(box_col, box_col + 3):
+                if grid[i][j] == num:
+                    return False
+        return True
+
+    def solve(grid):
+        for row in range(9):
+            for col in range(9):
+                if grid[row][col] == 0:
+                    for num in range(1, 10):
+                        if is_valid(grid, row, col, num):
+                            grid[row][col] = num
+                            if solve(grid):
+                                return True
+                            grid[row][col] = 0
+                    return False
+        return True
+
+    return grid if solve(grid) else None
+
+
+def py_sudoku_solve(grid):
+    """Solve with the py-sudoku library used by create_puzzle_from_library."""
+    from sudoku import Sudoku
+    board = [[value or None for value in row] for row in grid]
+    return Sudoku(3, 3, board=board).solve().board
+
+
+SOLVERS = {
+    "dlx": dlx.solve,
+    "bitmask": solver.solve,
+    "backtracker": backtracker_solve,
+    "py-sudoku": py_sudoku_solve,
+}
+
+
+# ------------------------------------------------------------
+# Benchmark Runner
+# ------------------------------------------------------------
+
+def _time_solver(solver_name, case_name, repeat):
+    solve = SOLVERS[solver_name]
+    grid = CASES[case_name]
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        solve(grid)
+        timings.append(time.perf_counter() - start)
+    return timings
+
+
+def run(repeat=5, timeout=10.0):
+    """Time every solver on every board. Returns {(solver, case): timings or None}.
+
+    Each solver/board pair runs in its own worker process so a pathological
+    case can be cut off after timeout seconds instead of hanging the run.
+    """
+    results = {}
+    for case_name in CASES:
+        for solver_name in SOLVERS:
+            with multiprocessing.Pool(1) as pool:
+                job = pool.apply_async(_time_solver, (solver_name, case_name, repeat))
+                try:
+                    results[solver_name, case_name] = job.get(timeout)
+                except multiprocessing.TimeoutError:
+                    results[solver_name, case_name] = None
+    return results
+
+
+def report(results):
+    """Print a table of median and worst times in milliseconds."""
+    print(f"{'board':<14}{'solver':<14}{'median ms':>12}{'max ms':>12}")
+    for (solver_name, case_name), timings in results.items():
+        if timings is None:
+            print(f"{case_name:<14}{solver_name:<14}{'timeout':>12}{'-':>12}")
+            continue
+        median = statistics.median(timings) * 1000
+        worst = max(timings) * 1000
+        print(f"{case_name:<14}{solver_name:<14}{median:>12.3f}{worst:>12.3f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Compare Sudoku solver latency.")
+    parser.add_argument("--repeat", type=int, default=5, help="timed runs per solver and board")
+    parser.add_argument("--timeout", type=float, default=10.0, help="seconds before a solver/board pair is abandoned")
+    args = parser.parse_args()
+    report(run(args.repeat, args.timeout))
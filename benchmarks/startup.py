@@ -0,0 +1,81 @@
+#! /usr/bin/env python3
+
+# ------------------------------------------------------------
+# benchmarks/startup.py
+# Measures time-to-first-frame and time-to-first-puzzle of the game
+# By: Beck Bishp
+# Last Updated: 10/18/2026
+#
+# Usage:
+#   python -m benchmarks.startup                 # 10 launches of each kind
+#   python -m benchmarks.startup --runs 30
+# ------------------------------------------------------------
+#
+# Each run launches main.py headless with --timings and reads the
+# milestones it prints, then ends the process. Menu launches measure the
+# first frame; launches with --puzzle go straight to a puzzle, which also
+# gives the time to the first puzzle on screen. Launches run in an empty
+# temporary directory, so they neither read nor replace the autosave or
+# puzzle bank of the checkout.
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import threading
+
+from constants import MEDIUM_DIFFICULTY
+from puzzle_ids import make_puzzle_id
+
+MAIN = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "main.py")
+LAUNCH_ID = make_puzzle_id(MEDIUM_DIFFICULTY, 2026)
+RUN_TIMEOUT = 30   # Seconds before a launch that never reports is given up on
+
+
+def launch(milestones, extra_args=()):
+    """Run the game once and return {milestone: ms} as printed by --timings."""
+    env = dict(os.environ, SDL_VIDEODRIVER="dummy", SDL_AUDIODRIVER="dummy")
+    timings = {}
+    with tempfile.TemporaryDirectory() as cwd:
+        process = subprocess.Popen([sys.executable, MAIN, "--timings", *extra_args], env=env, text=True,
+                                   stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, cwd=cwd)
+        # A launch that hangs is killed, which ends the read loop below
+        watchdog = threading.Timer(RUN_TIMEOUT, process.kill)
+        watchdog.start()
+        try:
+            for line in process.stdout:
+                # "startup: first frame 123 ms"
+                if line.startswith("startup: "):
+                    name, _, value = line[len("startup: "):].rpartition(" ms")[0].rpartition(" ")
+                    timings[name] = float(value)
+                if all(milestone in timings for milestone in milestones):
+                    break
+        finally:
+            watchdog.cancel()
+            process.kill()
+            process.wait()
+    return timings
+
+
+def run(runs):
+    """Median and worst time of each milestone over runs launches of each kind."""
+    samples = {}
+    for extra_args, milestones in (((), ("first frame",)),
+                                   (("--puzzle", LAUNCH_ID), ("first frame", "first puzzle"))):
+        label = "menu" if not extra_args else "--puzzle"
+        for _ in range(runs):
+            for name, ms in launch(milestones, extra_args).items():
+                samples.setdefault(f"{name} ({label})", []).append(ms)
+    return {name: (statistics.median(values), max(values)) for name, values in samples.items()}
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Measure the game's time to first frame and first puzzle.")
+    parser.add_argument("--runs", type=int, default=10, help="launches of each kind")
+    args = parser.parse_args()
+
+    print(f"{'milestone':<30}{'p50 ms':>10}{'max ms':>10}")
+    for name, (median, worst) in run(args.runs).items():
+        print(f"{name:<30}{median:>10.1f}{worst:>10.1f}")
@@ -0,0 +1,264 @@
+#! /usr/bin/env python3
+
+# ------------------------------------------------------------
+# benchmarks/suite.py
+# Headless benchmark suite for generation, validation and rendering
+# By: Beck Bishp
+# Last Updated: 10/18/2026
+#
+# Usage:
+#   python -m benchmarks.suite                        # run and print
+#   python -m benchmarks.suite --save baseline.json   # record a baseline
+#   python -m benchmarks.suite --compare baseline.json --threshold 0.25
+#
+# Every benchmark draws its puzzles from its own random.Random(seed), so runs
+# with the same --seed time the same work. The seed is saved with the
+# baseline, and a compare run uses it unless --seed is given.
+# ------------------------------------------------------------
+
+import os
+
+# Must be set before pygame is imported anywhere
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import argparse
+import json
+import random
+import statistics
+import sys
+import time
+
+import pygame
+
+import main
+from benchmarks import legacy
+from board_renderer import BoardRenderer
+from board import Board
+from board_state import BoardState
+from candidates import CandidateGrid
+from constants import EASY_DIFFICULTY, MEDIUM_DIFFICULTY, HARD_DIFFICULTY
+from constants import SURFACE_WIDTH, SURFACE_HEIGHT
+from generate_puzzle import create_puzzle, create_puzzle_from_library, create_puzzle_variant, generate_solved_grid
+from generate_puzzle import generate_boards
+
+try:
+    import batch_validator
+except ImportError:     # NumPy is optional, the batch benchmark is skipped without it
+    batch_validator = None
+
+DEFAULT_SEED = 1
+
+
+# ------------------------------------------------------------
+# Benchmark Setup
+# ------------------------------------------------------------
+
+def _setup_display():
+    pygame.display.init()
+    pygame.font.init()
+    surface = pygame.display.set_mode((SURFACE_WIDTH, SURFACE_HEIGHT))
+    fonts = {
+        "title": pygame.font.Font('freesansbold.ttf', 32),
+        "puzzle": pygame.font.Font('freesansbold.ttf', 21),
+        "button": pygame.font.Font('freesansbold.ttf', 18),
+    }
+    return surface, fonts
+
+
+def _half_filled(puzzle_board, solution_board):
+    """A player board with every other open cell filled in correctly."""
+    player_board = Board(box=puzzle_board.box)
+    for i in range(0, len(puzzle_board.cells), 2):
+        if not puzzle_board.cells[i]:
+            player_board.cells[i] = solution_board.cells[i]
+    return player_board
+
+
+def _full_filled(puzzle_board, solution_board):
+    """A player board that completes the puzzle, so the checks scan every cell."""
+    return Board(0 if given else answer for given, answer in zip(puzzle_board.cells, solution_board.cells))
+
+
+def build_benchmarks(seed=DEFAULT_SEED):
+    """Return {name: (callable, default iterations)}.
+
+    The inputs and every benchmark that generates puzzles use their own
+    random.Random(seed), so the work does not depend on which others run.
+    """
+    surface, fonts = _setup_display()
+    solution_board = generate_solved_grid(random.Random(seed))
+    puzzle_board = create_puzzle(solution_board, 45, rng=random.Random(seed))
+    player_full = _full_filled(puzzle_board, solution_board)
+    player_half = _half_filled(puzzle_board, solution_board)
+
+    difficulty_buttons = [
+        main.Button(40 + i * 140, 150, 120, 45, name, fonts["button"], selected=(i == 1))
+        for i, name in enumerate(("Easy", "Medium", "Hard"))
+    ]
+    board_state = BoardState(puzzle_board, solution_board)
+    size = puzzle_board.size
+    open_cell = next(divmod(i, size) for i, given in enumerate(puzzle_board.cells) if not given)
+    for row in range(size):
+        for col in range(size):
+            board_state.set(row, col, player_full[row, col])
+    half_state = BoardState(puzzle_board, solution_board)
+    for row in range(size):
+        for col in range(size):
+            half_state.set(row, col, player_half[row, col])
+    renderer = BoardRenderer(fonts["puzzle"], main.get_board_position())
+    renderer.reset(surface, puzzle_board)
+    renderer.draw_board(surface, half_state, None)
+
+    # Worst case for pencil marks: every open cell marked with every digit,
+    # and an empty candidate grid so none of them are hidden
+    notes_state = BoardState(puzzle_board, solution_board)
+    notes_state.grid = CandidateGrid(Board(box=puzzle_board.box))
+    for row in range(size):
+        for col in range(size):
+            for digit in range(1, size + 1):
+                notes_state.toggle_note(row, col, digit)
+    notes_renderer = BoardRenderer(fonts["puzzle"], main.get_board_position())
+    notes_renderer.reset(surface, puzzle_board)
+
+    def draw_all_notes():
+        notes_renderer.invalidate()
+        notes_renderer.draw_board(surface, notes_state, None)
+
+    hints_button = main.Button(150, 230, 200, 45, "Hints: ON", fonts["button"])
+    start_button = main.Button(170, 320, 160, 50, "Start Game", fonts["button"])
+
+    benchmarks = {
+        "generate_solved_grid": (lambda rng=random.Random(seed): generate_solved_grid(rng), 200),
+        "create_puzzle": (lambda rng=random.Random(seed): create_puzzle(solution_board, 45, rng=rng), 50),
+        "create_puzzle_variant": (
+            lambda rng=random.Random(seed): create_puzzle_variant(puzzle_board, solution_board, rng), 5000),
+        "is_board_complete": (lambda: legacy.is_board_complete(puzzle_board, player_full), 5000),
+        "check_solution": (lambda: legacy.check_solution(puzzle_board, player_full, solution_board), 5000),
+        "BoardState.is_solved": (board_state.is_solved, 5000),
+        "draw_grid": (lambda: legacy.draw_grid(surface), 500),
+        "draw_puzzle": (lambda: legacy.draw_puzzle(surface, puzzle_board, player_half, solution_board,
+                                                 fonts["puzzle"], True), 500),
+        "BoardRenderer.draw_board[idle]": (lambda: renderer.draw_board(surface, half_state, None), 500),
+        "BoardRenderer.draw_board[all notes]": (draw_all_notes, 200),
+        "BoardState.set": (lambda: board_state.set(*open_cell, board_state.player_board[open_cell] % size + 1),
+                           5000),
+        "draw_menu": (lambda: main.draw_menu(surface, fonts["title"], fonts["button"], difficulty_buttons,
+                                             hints_button, start_button), 500),
+    }
+    for name, difficulty in (("easy", EASY_DIFFICULTY), ("medium", MEDIUM_DIFFICULTY), ("hard", HARD_DIFFICULTY)):
+        benchmarks[f"create_puzzle_from_library[{name}]"] = (
+            lambda difficulty=difficulty, rng=random.Random(seed):
+                create_puzzle_from_library(difficulty, rng.getrandbits(32)), 5)
+    # The bigger boards, generated the way the puzzle pool does
+    for box, iterations in ((4, 20), (5, 5)):
+        benchmarks[f"generate_boards[{box * box}x{box * box} hard]"] = (
+            lambda box=box, rng=random.Random(seed): generate_boards(HARD_DIFFICULTY, rng, box), iterations)
+    if batch_validator is not None:
+        puzzles = batch_validator.as_stack([puzzle_board] * 100_000)
+        solutions = batch_validator.as_stack([solution_board] * 100_000)
+        benchmarks["batch_validator.check_pairs[100k]"] = (
+            lambda: batch_validator.check_pairs(puzzles, solutions), 10)
+    return benchmarks
+
+
+# ------------------------------------------------------------
+# Runner
+# ------------------------------------------------------------
+
+def measure(func, iterations):
+    """Time func over iterations calls and summarize the latency in milliseconds."""
+    func()  # warm-up (imports, caches)
+    timings = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+
+    cuts = statistics.quantiles(timings, n=100, method="inclusive")
+    total = sum(timings)
+    return {
+        "iterations": iterations,
+        "p50_ms": cuts[49] * 1000,
+        "p95_ms": cuts[94] * 1000,
+        "p99_ms": cuts[98] * 1000,
+        "ops_per_sec": iterations / total if total else float("inf"),
+    }
+
+
+def run(only=None, scale=1.0, seed=DEFAULT_SEED):
+    """Run every benchmark (or those whose name contains only)."""
+    results = {}
+    for name, (func, iterations) in build_benchmarks(seed).items():
+        if only and only not in name:
+            continue
+        results[name] = measure(func, max(2, int(iterations * scale)))
+    return results
+
+
+def report(results, baseline=None, metric="p50_ms"):
+    """Print a results table, with the change against a baseline if given."""
+    header = f"{'benchmark':<36}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}{'ops/sec':>12}"
+    if baseline:
+        header += f"{'change':>10}"
+    print(header)
+    for name, stats in results.items():
+        line = (f"{name:<36}{stats['p50_ms']:>10.3f}{stats['p95_ms']:>10.3f}"
+                f"{stats['p99_ms']:>10.3f}{stats['ops_per_sec']:>12.1f}")
+        if baseline and name in baseline:
+            line += f"{change(stats, baseline[name], metric):>+10.1%}"
+        print(line)
+
+
+def change(stats, base, metric="p50_ms"):
+    """Relative change of metric against the baseline (positive = slower)."""
+    if base[metric] == 0:
+        return 0.0
+    return stats[metric] / base[metric] - 1
+
+
+def regressions(results, baseline, threshold, metric="p50_ms"):
+    """Names of benchmarks that got slower than the baseline by more than threshold."""
+    return [
+        name for name, stats in results.items()
+        if name in baseline and change(stats, baseline[name], metric) > threshold
+    ]
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark puzzle generation, validation and drawing.")
+    parser.add_argument("--only", help="run only benchmarks whose name contains this text")
+    parser.add_argument("--scale", type=float, default=1.0, help="multiply every iteration count")
+    parser.add_argument("--save", metavar="PATH", help="write the results as a JSON baseline")
+    parser.add_argument("--compare", metavar="PATH", help="compare against a JSON baseline")
+    parser.add_argument("--threshold", type=float, default=0.25,
+                        help="allowed slowdown before a benchmark counts as a regression (0.25 = 25%%)")
+    parser.add_argument("--metric", choices=("p50_ms", "p95_ms", "p99_ms"), default="p50_ms")
+    parser.add_argument("--seed", type=int,
+                        help=f"seed for the generated puzzles (default: the baseline's, else {DEFAULT_SEED})")
+    args = parser.parse_args()
+
+    baseline = None
+    baseline_seed = None
+    if args.compare:
+        with open(args.compare) as f:
+            saved = json.load(f)
+        baseline = saved["benchmarks"]
+        baseline_seed = saved["seed"]
+    seed = args.seed if args.seed is not None else baseline_seed if baseline_seed is not None else DEFAULT_SEED
+    if baseline_seed is not None and seed != baseline_seed:
+        print(f"note: seed {seed} differs from the baseline's seed {baseline_seed}")
+
+    results = run(args.only, args.scale, seed)
+    report(results, baseline, args.metric)
+
+    if args.save:
+        with open(args.save, "w") as f:
+            json.dump({"seed": seed, "benchmarks": results}, f, indent=2)
+        print(f"baseline saved to {args.save} (seed {seed})")
+
+    if baseline:
+        failed = regressions(results, baseline, args.threshold, args.metric)
+        if failed:
+            print(f"regressed by more than {args.threshold:.0%}: {', '.join(failed)}")
+            sys.exit(1)
@@ -0,0 +1,179 @@
+#! /usr/bin/env python3
+
+# ------------------------------------------------------------
+# board.py
+# Compact Sudoku board (4x4 up to 25x25) shared by the generator, solvers and game
+# By: Beck Bishp
+# Last Updated: 10/18/2026
+# ------------------------------------------------------------
+
+from collections import namedtuple
+from functools import cache
+
+from constants import BOX_SIZE, BOX_SIZES
+
+
+# ------------------------------------------------------------
+# Lookup Tables
+# ------------------------------------------------------------
+
+# A board is box x box boxes of box x box cells, so size = box * box rows,
+# columns and digits. Cells are indexed 0..size * size - 1 in row-major order.
+Geometry = namedtuple("Geometry", "box size cells row_of col_of box_of rows cols boxes units peers")
+
+
+@cache
+def geometry(box):
+    """Index tables for a board with box x box boxes (box=3 is the usual 9x9)."""
+    size = box * box
+    cells = size * size
+    row_of = [i // size for i in range(cells)]
+    col_of = [i % size for i in range(cells)]
+    box_of = [(i // (size * box)) * box + (i % size) // box for i in range(cells)]
+    rows = [[r * size + c for c in range(size)] for r in range(size)]
+    cols = [[r * size + c for r in range(size)] for c in range(size)]
+    boxes = [[(b // box * box + i // box) * size + b % box * box + i % box for i in range(size)]
+             for b in range(size)]
+    units = rows + cols + boxes
+    peers = [
+        sorted(set(rows[row_of[idx]] + cols[col_of[idx]] + boxes[box_of[idx]]) - {idx})
+        for idx in range(cells)
+    ]
+    return Geometry(box, size, cells, row_of, col_of, box_of, rows, cols, boxes, units, peers)
+
+
+def box_size_for(cells):
+    """The box size of a board with this many cells. Raises ValueError."""
+    for box in BOX_SIZES:
+        if box ** 4 == cells:
+            return box
+    raise ValueError(f"no supported board has {cells} cells")
+
+
+# The standard 9x9 tables, used by code that only deals with 9x9 boards
+ROW_OF, COL_OF, BOX_OF = geometry(3).row_of, geometry(3).col_of, geometry(3).box_of
+ROWS, COLS, BOXES = geometry(3).rows, geometry(3).cols, geometry(3).boxes
+UNITS, PEERS = geometry(3).units, geometry(3).peers
+
+# Cell values as characters: '0' for blank, '1'-'9', then 'A' for 10 up to
+# 'P' for 25, as on 16x16 and 25x25 boards
+SYMBOLS = "0123456789ABCDEFGHIJKLMNOP"
+
+# bytes.translate tables between cell values and their characters
+_TO_ASCII = bytes.maketrans(bytes(range(len(SYMBOLS))), SYMBOLS.encode("ascii"))
+_FROM_ASCII = bytes.maketrans(SYMBOLS.encode("ascii"), bytes(range(len(SYMBOLS))))
+
+
+# ------------------------------------------------------------
+# Board Class
+# ------------------------------------------------------------
+
+class Board:
+    """A Sudoku board stored as one flat bytearray, 0 for blank cells.
+
+    board[row, col] reads or writes a single cell. board[row] (and iterating
+    over the board) gives a writable memoryview of that row, so code written
+    for lists of lists, board[row][col], keeps working without copying.
+
+    box is the box width (3 for 9x9, 4 for 16x16, ...) and size the number
+    of rows, columns and digits. Given cells, the size follows from their count.
+    """
+
+    __slots__ = ("cells", "box", "size", "_view")
+
+    def __init__(self, cells=None, box=BOX_SIZE):
+        if cells is None:
+            self.cells = bytearray(box ** 4)
+        else:
+            self.cells = bytearray(cells)
+            box = box_size_for(len(self.cells))
+        self.box = box
+        self.size = box * box
+        self._view = memoryview(self.cells)
+
+    @classmethod
+    def from_rows(cls, grid):
+        """Convert a list of lists (None or 0 for blanks), e.g. py-sudoku's .board."""
+        return cls(value or 0 for row in grid for value in row)
+
+    @classmethod
+    def from_text(cls, text):
+        """Parse one character per cell (see SYMBOLS), with '0' or '.' for blanks.
+
+        The board size follows from the length: 16, 81, 256 or 625 characters.
+        Raises ValueError.
+        """
+        text = text.strip().upper().replace(".", "0")
+        box = box_size_for(len(text))
+        if any(char not in SYMBOLS[:box * box + 1] for char in text):
+            raise ValueError(f"a {box * box}x{box * box} board only has the digits "
+                             f"{SYMBOLS[1:box * box + 1]} ('0' or '.' for blanks)")
+        return cls(text.encode("ascii").translate(_FROM_ASCII))
+
+    def to_text(self):
+        """The board as one character per cell, '0' for blanks."""
+        return bytes(self.cells).translate(_TO_ASCII).decode("ascii")
+
+    def copy(self):
+        return Board(self.cells)
+
+    def to_rows(self):
+        """A list of lists, for code outside the game that expects one."""
+        size = self.size
+        return [list(self.cells[i:i + size]) for i in range(0, len(self.cells), size)]
+
+    # --- Cell access ---
+
+    def __getitem__(self, key):
+        if isinstance(key, tuple):
+            row, col = key
+            return self.cells[row * self.size + col]
+        size = self.size
+        return self._view[key * size:key * size + size]
+
+    def __setitem__(self, key, value):
+        row, col = key
+        self.cells[row * self.size + col] = value or 0
+
+    def __len__(self):
+        return self.size
+
+    def __iter__(self):
+        view, size = self._view, self.size
+        return (view[i:i + size] for i in range(0, len(self.cells), size))
+
+    # --- Zero-copy views ---
+
+    def row(self, row):
+        return self[row]
+
+    def col(self, col):
+        return self._view[col::self.size]
+
+    def box_rows(self, box):
+        """The box as box-cell row views (memoryviews cannot slice 2D)."""
+        width, size = self.box, self.size
+        start = (box // width) * width * size + (box % width) * width
+        view = self._view
+        return [view[start + i * size:start + i * size + width] for i in range(width)]
+
+    # --- Checks ---
+
+    def is_filled(self):
+        return 0 not in self.cells
+
+    def blanks(self):
+        return self.cells.count(0)
+
+    def __eq__(self, other):
+        return isinstance(other, Board) and self.cells == other.cells
+
+    __hash__ = None
+
+    def __reduce__(self):
+        # memoryviews cannot be pickled, so send the cells alone (for the
+        # process pool) and rebuild the view on the other side
+        return Board, (bytes(self.cells),)
+
+    def __repr__(self):
+        return f"Board({bytes(self.cells)!r})"
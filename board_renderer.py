@@ -0,0 +1,193 @@
+#! /usr/bin/env python3
+
+# ------------------------------------------------------------
+# board_renderer.py
+# Retained-mode (dirty rectangle) renderer for the playing screen
+# By: Beck Bishp
+# Last Updated: 10/18/2026
+# ------------------------------------------------------------
+
+import pygame
+
+from constants import WHITE, BLACK, BOX_SIZE, CELL_SIZE
+from constants import HIGHLIGHT_COLOR, PLAYER_NUMBER_COLOR, INCORRECT_COLOR
+from constants import CONFLICT_COLOR, NOTE_COLOR, NOTE_FONT_SIZE, MIN_NOTE_SLOT
+from profiler import profiler
+from text_cache import DigitAtlas
+
+
+class BoardRenderer:
+    """Draws the playing screen by only repainting what changed.
+
+    When a puzzle starts, everything that stays put (title, given digits)
+    is rendered once onto a background surface and the grid lines onto an
+    overlay. Each frame only the cells the board state marked dirty and the
+    old and new selection are looked at, and a cell is repainted only if its
+    value, color, highlight, conflict flag or pencil marks changed; each
+    widget only if its key changed. An idle frame touches no cells. draw_*
+    methods return the rects they touched so the caller can pass just those
+    to pygame.display.update().
+
+    A renderer is laid out for one board size (box) and cell size; font
+    should suit the cell size. Pencil marks sit in a box x box grid inside
+    each cell and are left out when cells are too small to read them.
+    """
+
+    def __init__(self, font, origin, note_font=None, cell_size=CELL_SIZE, box=BOX_SIZE):
+        self.box = box
+        self.size = box * box
+        self.cell_size = cell_size
+        self.board_px = cell_size * self.size
+        self.note_slot = cell_size // box
+        if note_font is None:
+            # NOTE_FONT_SIZE suits the 12 px slots of a 9x9 board at CELL_SIZE
+            note_font = pygame.font.Font('freesansbold.ttf',
+                                         max(NOTE_FONT_SIZE * self.note_slot // (CELL_SIZE // 3), 1))
+        self.digits = DigitAtlas(font, (WHITE, PLAYER_NUMBER_COLOR, INCORRECT_COLOR), self.size)
+        self.note_digits = DigitAtlas(note_font, (NOTE_COLOR,), self.size)
+        self.origin = origin
+        self.puzzle_board = None
+        self.background = None
+        self.lines = None
+        self.cell_keys = None
+        self.widget_keys = {}
+        self.board_state = None     # What the last frame showed
+        self.selected_cell = None
+        self.show_hints = None
+        self.needs_full_redraw = True
+
+    def invalidate(self):
+        """Force a full repaint on the next frame (e.g. after another screen was shown)."""
+        self.needs_full_redraw = True
+
+    def reset(self, surface, puzzle_board, static_blits=()):
+        """Pre-render the background for a new puzzle.
+
+        static_blits is a list of (surface, rect) pairs, such as the title,
+        that never change while the puzzle is on screen.
+        """
+        margin_x, margin_y = self.origin
+        self.puzzle_board = puzzle_board
+
+        self.background = pygame.Surface(surface.get_size()).convert()
+        self.background.fill(BLACK)
+        for text_surface, rect in static_blits:
+            self.background.blit(text_surface, rect)
+        for row in range(self.size):
+            for col in range(self.size):
+                value = puzzle_board[row, col]
+                if value:
+                    self._blit_digit(self.background, row, col, value, WHITE)
+
+        # Grid lines live on their own overlay so a highlighted cell can be
+        # filled and still have its borders drawn on top.
+        self.lines = pygame.Surface(surface.get_size()).convert()
+        self.lines.fill(BLACK)
+        self.lines.set_colorkey(BLACK)
+        box_line = 4 if self.cell_size >= 24 else 2
+        for i in range(self.size + 1):
+            line_width = box_line if i % self.box == 0 else 1
+            x = margin_x + i * self.cell_size
+            pygame.draw.line(self.lines, WHITE, (x, margin_y), (x, margin_y + self.board_px), line_width)
+            y = margin_y + i * self.cell_size
+            pygame.draw.line(self.lines, WHITE, (margin_x, y), (margin_x + self.board_px, y), line_width)
+        self.background.blit(self.lines, (0, 0))
+
+        self.needs_full_redraw = True
+
+    @profiler.timed("draw_board")
+    def draw_board(self, surface, board_state, selected_cell, show_hints=True):
+        """Repaint the cells that changed since the last frame. Returns dirty rects."""
+        dirty = []
+        if self.needs_full_redraw:
+            surface.blit(self.background, (0, 0))
+            dirty.append(surface.get_rect())
+            self.cell_keys = [[None] * self.size for _ in range(self.size)]
+            self.widget_keys = {}
+            self.needs_full_redraw = False
+            self.board_state = None
+
+        changed = board_state.take_dirty()
+        if board_state is not self.board_state or show_hints != self.show_hints:
+            # Another game or hints switched: any cell may look different
+            cells = [(row, col) for row in range(self.size) for col in range(self.size)]
+        else:
+            cells = changed
+            if selected_cell != self.selected_cell:
+                cells.update(cell for cell in (self.selected_cell, selected_cell) if cell is not None)
+        self.board_state = board_state
+        self.selected_cell = selected_cell
+        self.show_hints = show_hints
+
+        for row, col in cells:
+            key = self._cell_key(board_state, row, col, selected_cell, show_hints)
+            if key != self.cell_keys[row][col]:
+                self.cell_keys[row][col] = key
+                dirty.append(self._draw_cell(surface, row, col, *key))
+        return dirty
+
+    def draw_widget(self, surface, name, rect, key, draw):
+        """Repaint a UI element only when its key changes.
+
+        draw is called with the surface after the background under rect has
+        been restored. Returns a list with the dirty rect, or an empty list.
+        """
+        if self.widget_keys.get(name) == key:
+            return []
+        self.widget_keys[name] = key
+        rect = pygame.Rect(rect)
+        surface.blit(self.background, rect, rect)
+        draw(surface)
+        return [rect]
+
+    def clear_widget(self, surface, name, rect):
+        """Restore the background under a UI element that is no longer shown."""
+        return self.draw_widget(surface, name, rect, None, lambda surface: None)
+
+    def _cell_key(self, board_state, row, col, selected_cell, show_hints):
+        # Everything that decides how a cell looks
+        conflict = board_state.is_conflict(row, col)
+        given = self.puzzle_board[row, col]
+        if given:
+            return (given, WHITE, False, conflict, 0)
+        value = board_state.player_board[row, col] or 0
+        color = PLAYER_NUMBER_COLOR
+        if value and show_hints and value != board_state.solution_board[row, col]:
+            color = INCORRECT_COLOR
+        return (value, color, selected_cell == (row, col), conflict,
+                board_state.visible_notes(row, col))
+
+    def _cell_rect(self, row, col):
+        margin_x, margin_y = self.origin
+        cell_size = self.cell_size
+        return pygame.Rect(margin_x + col * cell_size, margin_y + row * cell_size, cell_size, cell_size)
+
+    def _draw_cell(self, surface, row, col, value, color, highlighted, conflict, notes):
+        rect = self._cell_rect(row, col)
+        surface.blit(self.background, rect, rect)
+        fill = HIGHLIGHT_COLOR if highlighted else CONFLICT_COLOR if conflict else None
+        if fill:
+            pygame.draw.rect(surface, fill, rect)
+            surface.blit(self.lines, rect, rect)
+        # Given digits are part of the background and only need redrawing
+        # when the fill has covered them
+        if value and (fill or not self.puzzle_board[row, col]):
+            self._blit_digit(surface, row, col, value, color)
+        elif notes and self.note_slot >= MIN_NOTE_SLOT:
+            self._blit_notes(surface, rect, notes)
+        return rect
+
+    def _blit_notes(self, surface, rect, notes):
+        # Digit d sits in the ((d - 1) % box, (d - 1) // box) slot of a box x box grid
+        slot, box = self.note_slot, self.box
+        for digit in range(1, self.size + 1):
+            if notes & (1 << digit):
+                text_surface = self.note_digits.get(digit, NOTE_COLOR)
+                center = (rect.x + (digit - 1) % box * slot + slot // 2 + 1,
+                          rect.y + (digit - 1) // box * slot + slot // 2 + 1)
+                surface.blit(text_surface, text_surface.get_rect(center=center))
+
+    def _blit_digit(self, surface, row, col, value, color):
+        text_surface = self.digits.get(value, color)
+        text_rect = text_surface.get_rect(center=self._cell_rect(row, col).center)
+        surface.blit(text_surface, text_rect)
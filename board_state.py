@@ -0,0 +1,164 @@
+#! /usr/bin/env python3
+
+# ------------------------------------------------------------
+# board_state.py
+# Incremental player board state for the Lofi Sudoku Game
+# By: Beck Bishp
+# Last Updated: 10/18/2026
+# ------------------------------------------------------------
+
+from board import Board
+from candidates import CandidateGrid
+from move_log import MoveLog
+
+
+class BoardState:
+    """The player's progress on one puzzle.
+
+    Keeps a count of filled cells and of filled cells that disagree with the
+    solution. Every change goes through set(), which updates both counts in
+    O(1), so checking for a win never has to scan the board. The same call
+    keeps the candidate grid (used for pencil marks and conflicts) current.
+
+    Player moves go through move() instead, which also records them in the
+    move log for undo() and redo(). changes counts the changes to the
+    board or the pencil marks since the puzzle was started or its progress
+    loaded, so a saver can tell when there is news.
+
+    dirty holds the cells that may look different since take_dirty() was
+    last called: a new digit can change the conflicts and pencil marks of
+    every peer, so set() marks those too. A renderer only redraws these.
+    """
+
+    def __init__(self, puzzle_board, solution_board):
+        self.puzzle_board = puzzle_board        # Boards, see board.py
+        self.solution_board = solution_board
+        self.player_board = Board(box=puzzle_board.box)
+        self.open_cells = puzzle_board.blanks()
+        self.filled = 0        # Open cells the player has filled in
+        self.mismatches = 0    # Filled cells that differ from the solution
+        self.size = puzzle_board.size
+        self.notes = [[0] * self.size for _ in range(self.size)]   # Pencil marks, bit d = digit d
+        self.grid = CandidateGrid(puzzle_board)
+        self.moves = MoveLog()
+        self.changes = 0
+        self.dirty = set()     # (row, col) of cells to redraw
+
+    def take_dirty(self):
+        """Return the cells changed since the last call and start a new set."""
+        dirty, self.dirty = self.dirty, set()
+        return dirty
+
+    def is_given(self, row, col):
+        """True if the cell was filled in by the puzzle itself."""
+        return bool(self.puzzle_board[row, col])
+
+    def set(self, row, col, value):
+        """Set an open cell to value (0 or None clears it)."""
+        if self.is_given(row, col):
+            return
+        value = value or 0
+        old = self.player_board[row, col]
+        if old == value:
+            return
+
+        answer = self.solution_board[row, col]
+        if old:
+            self.filled -= 1
+            if old != answer:
+                self.mismatches -= 1
+        if value:
+            self.filled += 1
+            if value != answer:
+                self.mismatches += 1
+        self.player_board[row, col] = value
+        self.grid.set(row, col, value)
+        self.changes += 1
+        self._mark_peers(row, col)
+
+    def move(self, row, col, value):
+        """set() as a player move, recorded in the move log."""
+        old = self.player_board[row, col]
+        self.set(row, col, value)
+        new = self.player_board[row, col]
+        if new != old:
+            self.moves.record(row * self.size + col, old, new)
+
+    def undo(self):
+        """Take back the last move. Returns the (row, col) it changed, or None."""
+        move = self.moves.undo()
+        if move is None:
+            return None
+        idx, old, _ = move
+        row, col = divmod(idx, self.size)
+        self.set(row, col, old)
+        return row, col
+
+    def redo(self):
+        """Make the last undone move again. Returns the (row, col) it changed, or None."""
+        move = self.moves.redo()
+        if move is None:
+            return None
+        idx, _, new = move
+        row, col = divmod(idx, self.size)
+        self.set(row, col, new)
+        return row, col
+
+    def load_progress(self, player_board, notes, moves):
+        """Put back saved progress: the player's digits, pencil marks (one
+        int per cell, row by row) and move log."""
+        for idx, value in enumerate(player_board.cells):
+            if value:
+                self.set(*divmod(idx, self.size), value)
+        self.notes = [list(notes[i:i + self.size]) for i in range(0, len(notes), self.size)]
+        self.dirty.update((row, col) for row in range(self.size) for col in range(self.size))
+        self.moves = moves
+        # Nothing new yet: this is what the save already holds
+        self.changes = 0
+
+    def toggle_note(self, row, col, digit):
+        """Add or remove a pencil mark on an open cell."""
+        if not self.is_given(row, col):
+            self.notes[row][col] ^= 1 << digit
+            self.changes += 1
+            self.dirty.add((row, col))
+
+    def clear_notes(self, row, col):
+        self.notes[row][col] = 0
+        self.changes += 1
+        self.dirty.add((row, col))
+
+    def _mark_peers(self, row, col):
+        # The cell itself and everything in its row, column and box
+        box = self.puzzle_board.box
+        top, left = row - row % box, col - col % box
+        dirty = self.dirty
+        for i in range(self.size):
+            dirty.add((row, i))
+            dirty.add((i, col))
+            dirty.add((top + i // box, left + i % box))
+
+    def visible_notes(self, row, col):
+        """Pencil marks to show: none on a filled cell, and only digits that
+        no peer already uses, so marks disappear as the board fills up."""
+        if self.player_board[row, col]:
+            return 0
+        return self.notes[row][col] & self.grid.candidates(row, col)
+
+    def is_conflict(self, row, col):
+        """True if the cell's digit (given or entered) repeats in its row, column or box."""
+        return self.grid.is_conflict(row, col)
+
+    def fill_solution(self):
+        """Fill every open cell with its solution value."""
+        for row in range(self.size):
+            for col in range(self.size):
+                self.set(row, col, self.solution_board[row, col])
+
+    def is_complete(self):
+        """True when every open cell has a value."""
+        return self.filled == self.open_cells
+
+    def is_solved(self):
+        """True when every open cell matches the solution."""
+        return self.filled == self.open_cells and self.mismatches == 0
@@ -0,0 +1,80 @@
+#! /usr/bin/env python3
+
+# ------------------------------------------------------------
+# candidates.py
+# Incrementally maintained candidate grid for the Lofi Sudoku Game
+# By: Beck Bishp
+# Last Updated: 10/18/2026
+# ------------------------------------------------------------
+
+from solver import all_digits
+
+
+class CandidateGrid:
+    """Digit counts for every row, column and box of the board on screen.
+
+    set() adjusts three counters and three masks, so it is O(1). From those,
+    a cell's candidates (digits not yet used by any of its peers) and whether
+    its digit clashes with a peer are both O(1) lookups, so nothing has to
+    be rescanned when drawing pencil marks or conflicts.
+    """
+
+    def __init__(self, puzzle_board):
+        size = puzzle_board.size
+        self.box = puzzle_board.box
+        self.all_digits = all_digits(size)
+        self.values = [[0] * size for _ in range(size)]
+        self.row_counts = [[0] * (size + 1) for _ in range(size)]
+        self.col_counts = [[0] * (size + 1) for _ in range(size)]
+        self.box_counts = [[0] * (size + 1) for _ in range(size)]
+        # Bit d is set while digit d appears at least once in the unit
+        self.row_masks = [0] * size
+        self.col_masks = [0] * size
+        self.box_masks = [0] * size
+        for row in range(size):
+            for col in range(size):
+                if puzzle_board[row, col]:
+                    self.set(row, col, puzzle_board[row, col])
+
+    def set(self, row, col, value):
+        """Record that a cell now holds value (0 or None for empty)."""
+        value = value or 0
+        old = self.values[row][col]
+        if old == value:
+            return
+        box = (row // self.box) * self.box + col // self.box
+        if old:
+            self._count(row, col, box, old, -1)
+        if value:
+            self._count(row, col, box, value, 1)
+        self.values[row][col] = value
+
+    def _count(self, row, col, box, digit, delta):
+        bit = 1 << digit
+        for counts, masks, unit in ((self.row_counts, self.row_masks, row),
+                                    (self.col_counts, self.col_masks, col),
+                                    (self.box_counts, self.box_masks, box)):
+            counts[unit][digit] += delta
+            if counts[unit][digit]:
+                masks[unit] |= bit
+            else:
+                masks[unit] &= ~bit
+
+    def used(self, row, col):
+        """Bitmask of digits already present in the cell's row, column or box."""
+        box = (row // self.box) * self.box + col // self.box
+        return self.row_masks[row] | self.col_masks[col] | self.box_masks[box]
+
+    def candidates(self, row, col):
+        """Bitmask of digits that could still go in an empty cell."""
+        return self.all_digits & ~self.used(row, col)
+
+    def is_conflict(self, row, col):
+        """True if the cell's digit also appears elsewhere in its row, column or box."""
+        digit = self.values[row][col]
+        if not digit:
+            return False
+        box = (row // self.box) * self.box + col // self.box
+        return (self.row_counts[row][digit] > 1
+                or self.col_counts[col][digit] > 1
+                or self.box_counts[box][digit] > 1)
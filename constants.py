@@ -3,7 +3,7 @@
 # constants.py 
 # Constants for the Lofi Sudoku Game 
 # By: Beck Bishp 
-# Last Updated: 01/16/2026
+# Last Updated: 10/18/2026
 # ------------------------------------------------------------
 
 # ------ Colors --------- 
@@ -41,22 +41,84 @@ BRONZE = (116, 101, 75)
 SURFACE_HEIGHT = 500
 SURFACE_WIDTH = 500
 FPS = 30 
+IDLE_TIMEOUT_MS = 1000   # Longest the loop sleeps waiting for input when idle
 
 # ------ Puzzle Difficulty --------- 
 EASY_DIFFICULTY = 0.3 
 MEDIUM_DIFFICULTY = 0.4 
 HARD_DIFFICULTY = 0.5 
+DIFFICULTY_TIERS = (EASY_DIFFICULTY, MEDIUM_DIFFICULTY, HARD_DIFFICULTY)  # Tier order in the puzzle bank
+DIFFICULTY_NAMES = {"easy": EASY_DIFFICULTY, "medium": MEDIUM_DIFFICULTY, "hard": HARD_DIFFICULTY}
+
+# Range of cells removed by create_puzzle for each difficulty
+PUZZLE_HOLES = {
+    EASY_DIFFICULTY: (30, 35),
+    MEDIUM_DIFFICULTY: (40, 45),
+    HARD_DIFFICULTY: (50, 55),
+}
+
+# ------ Puzzle Bank --------- 
+PUZZLE_BANK_PATH = "puzzle_bank.bin"
+
+# ------ Saving --------- 
+SAVE_PATH = "autosave.bin"     # Game in progress, offered as Resume on the next launch
+AUTOSAVE_INTERVAL = 5.0        # Seconds between saves while the board keeps changing
+
+# ------ Puzzle Prefetching --------- 
+PREFETCH_DEPTH = 3      # Ready puzzles kept per difficulty
+PREFETCH_WORKERS = 2    # Background generator workers
+PREFETCH_MAX_FAILURES = 3   # Failed puzzles in a row before the pool gives up on its generator
+PUZZLE_CACHE_SIZE = 64  # Generated puzzles kept by puzzle ID
+
+# ------ Puzzle Service --------- 
+SERVICE_HOST = "127.0.0.1"
+SERVICE_PORT = 8765
+SERVICE_BATCH_SIZE = 32        # Most requests handed to a worker at once
+SERVICE_BATCH_WINDOW_MS = 2    # How long a batch waits for more requests
+SERVICE_TIMEOUT = 2.0          # Client socket timeout in seconds
+SERVICE_RETRY_AFTER = 10.0     # Seconds the client uses local generation after a failure
 
 # ------ Grid Constants --------- 
-NUM_CELLS = 9 
-CELL_SIZE = 36 
-BOARD_SIZE = CELL_SIZE * NUM_CELLS 
+BOX_SIZE = 3            # Default box width: 3 gives the classic 9x9 board
+BOX_SIZES = (2, 3, 4, 5)   # Playable boards: 4x4, 9x9, 16x16 and 25x25
+NUM_CELLS = BOX_SIZE * BOX_SIZE 
+CELL_SIZE = 36          # Cell size of a 9x9 board in the default window
+BOARD_SIZE = CELL_SIZE * NUM_CELLS   # Board area in the default window, for every size
+
+# ------ Text Rendering --------- 
+TEXT_CACHE_SIZE = 128   # Rendered text surfaces kept in the LRU cache
+NOTE_FONT_SIZE = 11     # Pencil-mark mini digits (3x3 per cell) on a 9x9 board
+MIN_NOTE_SLOT = 7       # Pencil marks are hidden when their slots are smaller (px)
+DIGIT_FONT_SCALE = 21 / 36   # Digit font size as a fraction of the cell size
+
+# ------ Animated Background --------- 
+BACKGROUND_SEED = 7            # Seed for the skyline, so it is the same every launch
+BACKGROUND_MOTES = 40          # Drifting motes of light at the best quality level
+BACKGROUND_BUDGET = 0.5        # Share of each 1/FPS frame the loop may use before quality drops
+BACKGROUND_SLOW_FRAMES = 5     # Frames over budget in a row that lower the quality
+BACKGROUND_RECOVER_SECONDS = 5.0   # Seconds of frames under half the budget that raise it again
+
+# ------ Profiling --------- 
+PROFILER_FRAMES = 300                  # Frames kept in the profiler's ring buffers
+PROFILER_CSV_PATH = "frame_trace.csv"  # Written by the export hotkey (F4)
 
 # ------ Colors for Highlighting  --------- 
 HIGHLIGHT_COLOR = (70, 130, 180) 
 PLAYER_NUMBER_COLOR = (100, 200, 100)
 CORRECT_COLOR = (50, 205, 50)       # Bright green for correct answers
 INCORRECT_COLOR = (220, 80, 80)     # Red for incorrect answers
+CONFLICT_COLOR = (90, 35, 35)       # Cell background for duplicate digits
+NOTE_COLOR = (160, 160, 160)        # Pencil-mark mini digits
+
+# ------ Background Colors --------- 
+SKY_TOP_COLOR = (14, 10, 32)
+SKY_BOTTOM_COLOR = (58, 30, 70)
+STAR_COLOR = (150, 150, 185)
+MOON_COLOR = (235, 222, 190)
+FAR_SKYLINE_COLOR = (36, 24, 58)
+NEAR_SKYLINE_COLOR = (21, 14, 36)
+LIT_WINDOW_COLOR = (125, 98, 62)
+MOTE_COLOR = (205, 175, 235)
 
 # ------ Button Colors --------- 
 BUTTON_COLOR = (60, 60, 80)
@@ -67,4 +129,5 @@ BUTTON_SELECTED_COLOR = (70, 130, 180)
 # ------ Game States --------- 
 STATE_MENU = "menu"
 STATE_PLAYING = "playing"
+STATE_LOADING = "loading"     # Waiting for the puzzle pool
 STATE_GAME_OVER = "game_over"  
\ No newline at end of file
@@ -0,0 +1,209 @@
+#! /usr/bin/env python3
+
+# ------------------------------------------------------------
+# dlx.py
+# Dancing Links (Algorithm X) exact-cover solver for the Lofi Sudoku Game
+# By: Beck Bishp
+# Last Updated: 10/18/2026
+# ------------------------------------------------------------
+
+from functools import cache
+
+from board import box_size_for
+from solver import flatten, to_rows
+
+
+# ------------------------------------------------------------
+# Exact-Cover Matrix
+# ------------------------------------------------------------
+#
+# Each candidate (cell, digit) is a matrix row that covers four columns.
+# On a 9x9 board those are:
+#   - the cell is filled            (0..80)
+#   - the row has the digit         (81..161)
+#   - the column has the digit      (162..242)
+#   - the box has the digit         (243..323)
+#
+# Node 0 is the root, nodes 1..324 are column headers and the remaining
+# nodes are the 729 * 4 matrix entries. Links are stored in flat lists so a
+# fresh matrix is just a handful of list copies. Other sizes have the same
+# layout with size * size columns per block and size ** 3 candidates.
+
+
+@cache
+def _template(box):
+    size = box * box
+    num_columns = 4 * size * size
+    left = list(range(-1, num_columns))
+    right = list(range(1, num_columns + 2))
+    left[0] = num_columns
+    right[num_columns] = 0
+    up = list(range(num_columns + 1))
+    down = list(range(num_columns + 1))
+    column = list(range(num_columns + 1))
+    row_of = [-1] * (num_columns + 1)
+    row_start = []
+
+    block = size * size
+    for candidate in range(size ** 3):
+        cell, digit = divmod(candidate, size)
+        r, c = divmod(cell, size)
+        b = (r // box) * box + c // box
+        cols = (1 + cell, 1 + block + r * size + digit,
+                1 + 2 * block + c * size + digit, 1 + 3 * block + b * size + digit)
+
+        first = len(column)
+        row_start.append(first)
+        for k, col in enumerate(cols):
+            node = first + k
+            column.append(col)
+            row_of.append(candidate)
+            left.append(first + (k - 1) % 4)
+            right.append(first + (k + 1) % 4)
+            # Append to the bottom of the column's circular list
+            up.append(up[col])
+            down.append(col)
+            down[up[col]] = node
+            up[col] = node
+
+    sizes = [0] + [size] * num_columns
+    return left, right, up, down, column, row_of, row_start, sizes
+
+
+# ------------------------------------------------------------
+# DLX Class
+# ------------------------------------------------------------
+
+class DLX:
+    """Exact-cover Sudoku solver using Knuth's dancing links.
+
+    Always branches on the column with the fewest remaining rows, which keeps
+    the worst case on sparse or contradictory boards predictable. Handles
+    every board size; the matrix layout for each size is built once.
+    """
+
+    def __init__(self, grid):
+        cells = flatten(grid)
+        box = box_size_for(len(cells))
+        left, right, up, down, column, row_of, row_start, sizes = _template(box)
+        self.left = left[:]
+        self.right = right[:]
+        self.up = up[:]
+        self.down = down[:]
+        self.size = sizes[:]
+        self.column = column        # Shared and never changed
+        self.row_of = row_of
+        self.digits = box * box
+        self.cells = cells
+        self.valid = True
+
+        covered = set()
+        for idx, digit in enumerate(cells):
+            if digit == 0:
+                continue
+            node = row_start[idx * self.digits + digit - 1]
+            cols = [column[node + k] for k in range(4)]
+            if covered.intersection(cols):
+                self.valid = False
+                return
+            covered.update(cols)
+            for col in cols:
+                self._cover(col)
+
+    def _cover(self, col):
+        left, right, up, down, size = self.left, self.right, self.up, self.down, self.size
+        column = self.column
+        right[left[col]] = right[col]
+        left[right[col]] = left[col]
+        i = down[col]
+        while i != col:
+            j = right[i]
+            while j != i:
+                down[up[j]] = down[j]
+                up[down[j]] = up[j]
+                size[column[j]] -= 1
+                j = right[j]
+            i = down[i]
+
+    def _uncover(self, col):
+        left, right, up, down, size = self.left, self.right, self.up, self.down, self.size
+        column = self.column
+        i = up[col]
+        while i != col:
+            j = left[i]
+            while j != i:
+                size[column[j]] += 1
+                down[up[j]] = j
+                up[down[j]] = j
+                j = left[j]
+            i = up[i]
+        right[left[col]] = col
+        left[right[col]] = col
+
+    def search(self, limit=1, found=None):
+        """Count exact covers up to limit, appending each solution to found."""
+        if not self.valid:
+            return 0
+        return self._search(limit, [], found)
+
+    def _search(self, limit, partial, found):
+        right, down, size = self.right, self.down, self.size
+        column, row_of = self.column, self.row_of
+        if right[0] == 0:
+            if found is not None:
+                cells = self.cells[:]
+                digits = self.digits
+                for candidate in partial:
+                    cells[candidate // digits] = candidate % digits + 1
+                found.append(cells)
+            return 1
+
+        # Choose the column with the fewest rows left
+        col = right[0]
+        best = size[col]
+        j = right[col]
+        while j != 0 and best > 1:
+            if size[j] < best:
+                col, best = j, size[j]
+            j = right[j]
+        if best == 0:
+            return 0
+
+        total = 0
+        self._cover(col)
+        i = down[col]
+        while i != col:
+            partial.append(row_of[i])
+            j = right[i]
+            while j != i:
+                self._cover(column[j])
+                j = right[j]
+
+            total += self._search(limit - total, partial, found)
+
+            j = self.left[i]
+            while j != i:
+                self._uncover(column[j])
+                j = self.left[j]
+            partial.pop()
+            if total >= limit:
+                break
+            i = down[i]
+        self._uncover(col)
+        return total
+
+
+# ------------------------------------------------------------
+# Entry Points
+# ------------------------------------------------------------
+
+def solve(grid):
+    """Solve a board of any size. Returns the solved grid as rows, or None if unsolvable."""
+    found = []
+    DLX(grid).search(1, found)
+    return to_rows(found[0]) if found else None
+
+
+def count_solutions(grid, limit=2):
+    """Count the solutions of a board, stopping early once limit is reached."""
+    return DLX(grid).search(limit)
@@ -0,0 +1,70 @@
+#! /usr/bin/env python3
+
+# ------------------------------------------------------------
+# frame_scheduler.py
+# Event-driven frame pacing for the Lofi Sudoku Game
+# By: Beck Bishp
+# Last Updated: 10/18/2026
+# ------------------------------------------------------------
+
+import time
+from collections import deque
+
+import pygame
+from pygame.locals import NOEVENT
+
+from constants import FPS, IDLE_TIMEOUT_MS
+
+
+class FrameScheduler:
+    """Runs the main loop at FPS only while something is animating.
+
+    When nothing is animating, next_events() blocks in pygame.event.wait()
+    until input arrives (or timeout_ms passes), so an idle game uses almost
+    no CPU. Every return from next_events() counts as a wakeup; text()
+    sums them up for --timings.
+    """
+
+    def __init__(self, fps=FPS, timeout_ms=IDLE_TIMEOUT_MS):
+        self.fps = fps
+        self.timeout_ms = timeout_ms
+        self.clock = pygame.time.Clock()
+        self.wakeups = deque()
+        self.total_wakeups = 0
+
+    def next_events(self, animating=False):
+        """Wait for the next frame and return the events to handle.
+
+        animating: True while something on screen moves or is being polled,
+                   which keeps the loop at the fixed frame rate.
+        """
+        if animating:
+            self.clock.tick(self.fps)
+            events = pygame.event.get()
+        else:
+            event = pygame.event.wait(self.timeout_ms)
+            events = pygame.event.get()
+            if event.type != NOEVENT:
+                events.insert(0, event)
+            # Keep the clock in step so the first animated frame is not
+            # measured from before the wait.
+            self.clock.tick()
+
+        now = time.perf_counter()
+        self.wakeups.append(now)
+        self.total_wakeups += 1
+        self._expire(now)
+        return events
+
+    def wakeups_per_second(self):
+        """Loop wakeups during the last second."""
+        self._expire(time.perf_counter())
+        return len(self.wakeups)
+
+    def text(self):
+        """One line with the wakeups so far and during the last second."""
+        return f"wakeups: {self.total_wakeups} total, {self.wakeups_per_second()} in the last second"
+
+    def _expire(self, now):
+        while self.wakeups and now - self.wakeups[0] > 1.0:
+            self.wakeups.popleft()
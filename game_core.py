@@ -0,0 +1,275 @@
+#! /usr/bin/env python3
+
+# ------------------------------------------------------------
+# game_core.py
+# Renderer-independent game state machine for the Lofi Sudoku Game
+# By: Beck Bishp
+# Last Updated: 10/18/2026
+# ------------------------------------------------------------
+#
+# The pygame front end in main.py turns clicks and key presses into
+# GameEvents and feeds them to GameCore.step(). Nothing here imports
+# pygame, so the same core can be driven by scripts, fuzzers and
+# benchmarks without a window.
+
+from collections import namedtuple
+
+from constants import MEDIUM_DIFFICULTY, BOX_SIZE
+from constants import STATE_MENU, STATE_PLAYING, STATE_LOADING, STATE_GAME_OVER
+from board_state import BoardState
+from puzzle_ids import normalize_puzzle_id
+
+
+# ------------------------------------------------------------
+# Game Events
+# ------------------------------------------------------------
+
+GameEvent = namedtuple("GameEvent", "kind value", defaults=(None,))
+
+# Menu
+SET_DIFFICULTY = "set_difficulty"  # value: EASY/MEDIUM/HARD_DIFFICULTY
+SET_BOX_SIZE = "set_box_size"      # value: box width, one of BOX_SIZES (3 for 9x9)
+TOGGLE_HINTS = "toggle_hints"
+START = "start"
+PLAY_ID = "play_id"                # value: puzzle ID as typed
+RESUME = "resume"                  # Back to the unfinished game
+# Playing
+SELECT = "select"                  # value: (row, col), or None to deselect
+DIGIT = "digit"                    # value: 1 up to the board size
+CLEAR = "clear"
+UNDO = "undo"
+REDO = "redo"
+TOGGLE_NOTES = "toggle_notes"
+SHOW_SOLUTION = "show_solution"
+NEW_GAME = "new_game"
+# Game over
+PLAY_AGAIN = "play_again"
+# Loading, playing and game over
+MENU = "menu"
+
+EVENT_KINDS = (SET_DIFFICULTY, SET_BOX_SIZE, TOGGLE_HINTS, START, PLAY_ID, RESUME, SELECT, DIGIT, CLEAR,
+               UNDO, REDO, TOGGLE_NOTES, SHOW_SOLUTION, NEW_GAME, PLAY_AGAIN, MENU)
+
+
+# ------------------------------------------------------------
+# GameCore Class
+# ------------------------------------------------------------
+
+class GameCore:
+    """Menu, loading, playing and game over states with all game rules.
+
+    next_puzzle(difficulty, box) returns (puzzle_board, solution_board,
+    puzzle_id) or None if no puzzle is ready yet (e.g. PuzzlePool.get).
+    puzzle_by_id(id) returns (puzzle_board, solution_board) for a normalized
+    ID, or None while it is still being made (e.g. PuzzlePool.get_id). Both
+    are polled while loading, so neither should block.
+
+    Going back to the menu keeps an unfinished game, and RESUME returns to it.
+    """
+
+    def __init__(self, next_puzzle, puzzle_by_id, start_id=None):
+        if next_puzzle is None or puzzle_by_id is None:
+            raise ValueError("GameCore needs both next_puzzle and puzzle_by_id")
+        self.next_puzzle = next_puzzle
+        self.puzzle_by_id = puzzle_by_id
+
+        # --- Settings ---
+        self.state = STATE_MENU if start_id is None else STATE_LOADING
+        self.difficulty = MEDIUM_DIFFICULTY
+        self.box = BOX_SIZE           # Board size for new games (IDs carry their own)
+        self.show_hints = True
+        self.notes_mode = False       # Digits toggle pencil marks instead
+        self.requested_id = start_id  # Puzzle asked for by ID, loaded on the next update
+        self.id_error = False         # Set when the last PLAY_ID was not a valid ID
+
+        # --- Current Game (set when a puzzle is loaded) ---
+        self.puzzle_board = None
+        self.solution_board = None
+        self.board_state = None
+        self.puzzle_id = None
+        self.selected_cell = None
+        self.game_won = False
+        self.solution_revealed = False
+        self.games = 0                # Games started so far, so a saver can tell them apart
+
+        self._handlers = {
+            STATE_MENU: {
+                SET_DIFFICULTY: self._set_difficulty,
+                SET_BOX_SIZE: self._set_box_size,
+                TOGGLE_HINTS: self._toggle_hints,
+                START: self._load,
+                PLAY_ID: self._play_id,
+                RESUME: self._resume,
+            },
+            STATE_LOADING: {
+                MENU: self._menu,
+            },
+            STATE_PLAYING: {
+                SELECT: self._select,
+                DIGIT: self._digit,
+                CLEAR: self._clear,
+                UNDO: self._undo,
+                REDO: self._redo,
+                TOGGLE_NOTES: self._toggle_notes,
+                SHOW_SOLUTION: self._show_solution,
+                NEW_GAME: self._new_game,
+                MENU: self._menu,
+            },
+            STATE_GAME_OVER: {
+                PLAY_AGAIN: self._load,
+                MENU: self._menu,
+            },
+        }
+
+    def step(self, events):
+        """Apply a batch of GameEvents, then update. Returns the new state."""
+        for event in events:
+            self.handle(event)
+        self.update()
+        return self.state
+
+    def handle(self, event):
+        """Apply one GameEvent. Events that mean nothing in the current state are ignored."""
+        handler = self._handlers[self.state].get(event.kind)
+        if handler is not None:
+            handler(event.value)
+
+    def update(self):
+        """Start the game once a puzzle is available (polled while loading)."""
+        if self.state != STATE_LOADING:
+            return
+        if self.requested_id is not None:
+            boards = self.puzzle_by_id(self.requested_id)
+            if boards is None:
+                return
+            boards += (self.requested_id,)
+            self.requested_id = None
+        else:
+            boards = self.next_puzzle(self.difficulty, self.box)
+        if boards is not None:
+            self.start_game(*boards)
+
+    def start_game(self, puzzle_board, solution_board, puzzle_id=None):
+        self.puzzle_board = puzzle_board
+        self.solution_board = solution_board
+        self.puzzle_id = puzzle_id
+        self.board_state = BoardState(puzzle_board, solution_board)
+        self.selected_cell = None
+        self.game_won = False
+        self.solution_revealed = False
+        self.games += 1
+        self.state = STATE_PLAYING
+
+    def restore(self, saved):
+        """Load a saved game (see savegame.py) without leaving the current
+        state, ready to be picked up with RESUME."""
+        state = self.state
+        self.start_game(saved.puzzle_board, saved.solution_board, saved.puzzle_id)
+        self.board_state.load_progress(saved.player_board, saved.notes, saved.moves)
+        self.state = state
+
+    @property
+    def can_resume(self):
+        """True while there is a game that is neither won nor revealed."""
+        return self.board_state is not None and not self.game_won and not self.solution_revealed
+
+    # --- Menu ---
+
+    def _set_difficulty(self, difficulty):
+        self.difficulty = difficulty
+
+    def _set_box_size(self, box):
+        self.box = box
+
+    def _toggle_hints(self, _):
+        self.show_hints = not self.show_hints
+
+    def _play_id(self, text):
+        try:
+            self.requested_id = normalize_puzzle_id(text or "")
+        except ValueError:
+            self.id_error = True
+            return
+        self.id_error = False
+        self.state = STATE_LOADING
+
+    def _resume(self, _):
+        if self.can_resume:
+            self.state = STATE_PLAYING
+
+    # --- Playing ---
+
+    def _select(self, cell):
+        # Only open cells can be selected
+        if cell is not None and not self.puzzle_board[cell]:
+            self.selected_cell = cell
+        else:
+            self.selected_cell = None
+
+    def _digit(self, digit):
+        # Letter keys can name digits past the end of a small board
+        if self.selected_cell is None or not 1 <= digit <= self.puzzle_board.size:
+            return
+        row, col = self.selected_cell
+        if self.notes_mode:
+            self.board_state.toggle_note(row, col, digit)
+        else:
+            self.board_state.move(row, col, digit)
+            self._check_win()
+
+    def _clear(self, _):
+        if self.selected_cell is None:
+            return
+        row, col = self.selected_cell
+        # Clear the digit first, then the pencil marks
+        if self.board_state.player_board[row, col]:
+            self.board_state.move(row, col, 0)
+        else:
+            self.board_state.clear_notes(row, col)
+
+    def _undo(self, _):
+        # The revealed solution is not in the move log, so there is nothing to take back
+        if self.solution_revealed:
+            return
+        cell = self.board_state.undo()
+        if cell is not None:
+            self.selected_cell = cell
+
+    def _redo(self, _):
+        if self.solution_revealed:
+            return
+        cell = self.board_state.redo()
+        if cell is not None:
+            self.selected_cell = cell
+            self._check_win()
+
+    def _check_win(self):
+        # The board only fills up through DIGIT and REDO, so these are the
+        # only places a win can happen. Skipped once the solution was revealed (no cheating!)
+        if not self.game_won and not self.solution_revealed and self.board_state.is_solved():
+            self.game_won = True
+            self.state = STATE_GAME_OVER
+
+    def _toggle_notes(self, _):
+        self.notes_mode = not self.notes_mode
+
+    def _show_solution(self, _):
+        if not self.solution_revealed:
+            self.board_state.fill_solution()
+            self.solution_revealed = True
+
+    def _new_game(self, _):
+        # Only offered after the solution was revealed
+        if self.solution_revealed:
+            self._load(None)
+
+    # --- Shared ---
+
+    def _load(self, _):
+        # Take the next puzzle once one is ready
+        self.state = STATE_LOADING
+
+    def _menu(self, _):
+        # A puzzle ID still loading is given up on
+        self.requested_id = None
+        self.state = STATE_MENU
@@ -4,74 +4,95 @@
 # generate_puzzle.py 
 # Generates puzzles and solutions for the Lofi Sudoku Game 
 # By: Beck Bishp 
-# Last Updated: 01/16/2026
+# Last Updated: 10/18/2026
 # ------------------------------------------------------------
 
+import argparse
+import os
 import random 
-from constants import EASY_DIFFICULTY, MEDIUM_DIFFICULTY, HARD_DIFFICULTY
+import secrets
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
 
+from constants import MEDIUM_DIFFICULTY
+from constants import DIFFICULTY_NAMES, PUZZLE_HOLES, BOX_SIZE
+from grader import grade
+from puzzle_bank import BankWriter, RECORD_SIZE, encode_record, tier_for_difficulty
+from board import Board
+from solver import Solver, UNLIMITED, flatten, generate
+from transforms import transform_pair
 
-def generate_solved_grid():
-    """Generate a complete valid Sudoku grid using backtracking."""
 
-    grid = [[0] * 9 for _ in range(9)]
-    
-    def is_valid(grid, row, col, num):
-        # Check row
-        if num in grid[row]:
-            return False
-
-        # Check column
-        if num in [grid[i][col] for i in range(9)]:
-            return False
-            
-        # Check 3x3 box
-        box_row, box_col = 3 * (row // 3), 3 * (col // 3)
-        for i in range(box_row, box_row + 3):
-            for j in range(box_col, box_col + 3):
-                if grid[i][j] == num:
-                    return False
-        return True
-    
-    def solve(grid):
-        for row in range(9):
-            for col in range(9):
-                if grid[row][col] == 0:
-                    nums = list(range(1, 10))
-                    random.shuffle(nums)  # Randomize for variety
-                    for num in nums:
-                        if is_valid(grid, row, col, num):
-                            grid[row][col] = num
-                            if solve(grid):
-                                return True
-                            grid[row][col] = 0
-                    return False
-        return True
-    
-    solve(grid)
-    return grid
+# py-sudoku seeds the shared random module, so library calls take turns
+_library_lock = threading.Lock()
 
+# Search steps per row a uniqueness check may take before create_puzzle
+# gives up on removing that cell
+DIG_NODES = 2
 
-def create_puzzle(grid, difficulty=40):
+
+def generate_solved_grid(rng=random, box=BOX_SIZE):
+    """Generate a complete valid Sudoku grid (a Board) using the bitmask solver.
+
+    box: the box width, 3 for 9x9 up to 5 for 25x25.
+    """
+    return Board.from_rows(generate(rng, box))
+
+
+def create_puzzle(grid, difficulty=40, unique=True, rng=random):
     """Remove numbers from solved grid to create a puzzle.
     
     difficulty: determined by the number of cells removed from the grid.
     - Easy: 30-35 removed
     - Medium: 40-45 removed
     - Hard: 50-55 removed
+
+    unique: only keep removals that leave exactly one solution. Cells are
+    tried in random order, so if no more cells can be removed the puzzle
+    may end up with fewer holes than asked for.
+
+    rng: a random.Random to make the result reproducible.
+
+    Works for every board size; the ranges above are for 9x9.
     """
-    puzzle = [row[:] for row in grid]  # Deep copy
-    cells = [(r, c) for r in range(9) for c in range(9)]
-    random.shuffle(cells)
-    
-    for i in range(difficulty):
-        row, col = cells[i]
-        puzzle[row][col] = 0
-    
-    return puzzle
+    puzzle = Board(flatten(grid))
+    cells = list(range(len(puzzle.cells)))
+    rng.shuffle(cells)
+
+    if not unique:
+        for idx in cells[:difficulty]:
+            puzzle.cells[idx] = 0
+        return puzzle
+
+    # One solver is kept for the whole dig so each removal only re-checks
+    # the cell it touched.
+    solver = Solver(puzzle)
+    removed = 0
+    if puzzle.box > BOX_SIZE:
+        # From 16x16 up a search per cell is too slow, so first take every
+        # cell that stays a single (no search needed), then search only for
+        # the rest, giving up on a cell when its check takes too long.
+        rest = []
+        for idx in cells:
+            if removed == difficulty:
+                break
+            if solver.dig_single(idx):
+                removed += 1
+            else:
+                rest.append(idx)
+        cells = rest
+    max_nodes = DIG_NODES * puzzle.size if puzzle.box > BOX_SIZE else UNLIMITED
+    for idx in cells:
+        if removed == difficulty:
+            break
+        if solver.dig(idx, max_nodes):
+            removed += 1
+
+    return Board(solver.cells)
 
 
-def create_puzzle_from_library(difficulty=MEDIUM_DIFFICULTY):
+def create_puzzle_from_library(difficulty=MEDIUM_DIFFICULTY, seed=None, box=BOX_SIZE):
     """
     Uses the py-sudoku library to generate puzzles.
     Docs: https://pypi.org/project/py-sudoku/
@@ -79,20 +100,141 @@ def create_puzzle_from_library(difficulty=MEDIUM_DIFFICULTY):
     Args:
         difficulty: Float between 0 and 1 (higher = harder)
                    Use EASY_DIFFICULTY, MEDIUM_DIFFICULTY, or HARD_DIFFICULTY
+        seed: Seed for py-sudoku. A fresh one is drawn when None; py-sudoku's
+              own default is fixed at import, so every call would otherwise
+              return the same puzzle.
+        box: Box width, 3 for the usual 9x9 board.
     """
     from sudoku import Sudoku 
-    # initializes a puzzle with a 3x3 subgrid and given difficulty.
-    puzzle = Sudoku(3).difficulty(difficulty)
-    solution = puzzle.solve()
+    if seed is None:
+        seed = secrets.randbits(32)
+    # initializes a puzzle with box x box subgrids and given difficulty.
+    with _library_lock:
+        puzzle = Sudoku(box, seed=seed).difficulty(difficulty)
+        solution = puzzle.solve()
     return puzzle, solution
 
 
+def create_puzzle_variant(puzzle, solution, rng=random):
+    """Turn a seed puzzle and solution into a fresh-looking equivalent pair.
+
+    Applies a random symmetry transform (see transforms.py) instead of
+    solving anything, so it takes microseconds. The variant has the same
+    unique solution count and needs the same techniques as the seed.
+    """
+    if not isinstance(puzzle, Board):
+        puzzle, solution = Board.from_rows(puzzle), Board.from_rows(solution)
+    return transform_pair(puzzle, solution, rng)
+
+
+def generate_boards(difficulty=MEDIUM_DIFFICULTY, rng=random, box=BOX_SIZE):
+    """Generate a unique puzzle with the bitmask solver.
+
+    The number of holes is picked from PUZZLE_HOLES for the difficulty,
+    scaled to the board's cell count when it is not 9x9. Returns
+    (puzzle_board, solution_board) with 0 for blanks. The same seeded rng
+    always gives the same pair.
+    """
+    low, high = PUZZLE_HOLES[difficulty]
+    solution = generate_solved_grid(rng, box)
+    holes = rng.randint(low, high) * len(solution.cells) // 81
+    return create_puzzle(solution, holes, rng=rng), solution
+
+
+# ------------------------------------------------------------
+# Batch Generation
+# ------------------------------------------------------------
+
+def _seed_worker():
+    # Forked workers start with the parent's random state, so give each
+    # one its own seed or they would all produce the same puzzles.
+    random.seed(os.urandom(16))
+
+
+def _generate_chunk(difficulty, count, graded=False):
+    """Worker task: generate count puzzles and return them as packed records.
+
+    Records are grouped by bank tier: the tier of difficulty, or with graded
+    set, the tier the grader puts each puzzle in.
+    """
+    start = time.perf_counter()
+    tier = tier_for_difficulty(difficulty)
+    records = {}
+    for _ in range(count):
+        puzzle, solution = generate_boards(difficulty)
+        if graded:
+            tier = grade(puzzle).tier
+        records.setdefault(tier, []).append(encode_record(puzzle, solution))
+    records = {tier: b"".join(chunk) for tier, chunk in records.items()}
+    return os.getpid(), count, time.perf_counter() - start, records
+
+
+def generate_bank(out, count, difficulty=MEDIUM_DIFFICULTY, workers=None, chunk_size=200, graded=False):
+    """Generate count puzzles across a process pool and add them to a bank file.
+
+    Finished chunks are written to the bank's spool as they arrive, and an
+    existing bank at out keeps its puzzles. With graded set, each puzzle is
+    filed under the tier the grader gives it instead of under difficulty.
+    Returns per-worker stats as {pid: [puzzles, busy_seconds]}, the number
+    of puzzles added per tier and the total wall time.
+    """
+    chunks = [chunk_size] * (count // chunk_size)
+    if count % chunk_size:
+        chunks.append(count % chunk_size)
+
+    stats = {}
+    per_tier = {}
+    done = 0
+    start = time.perf_counter()
+    with BankWriter(out, append=True) as writer, \
+            ProcessPoolExecutor(max_workers=workers, initializer=_seed_worker) as pool:
+        futures = [pool.submit(_generate_chunk, difficulty, size, graded) for size in chunks]
+        for future in as_completed(futures):
+            pid, generated, elapsed, records = future.result()
+            for tier, tier_records in records.items():
+                writer.add_records(tier, tier_records)
+                per_tier[tier] = per_tier.get(tier, 0) + len(tier_records) // RECORD_SIZE
+            worker = stats.setdefault(pid, [0, 0.0])
+            worker[0] += generated
+            worker[1] += elapsed
+            done += generated
+            wall = time.perf_counter() - start
+            print(f"\r{done}/{count} puzzles  {done / wall:.1f} puzzles/sec", end="", flush=True)
+    print()
+    return stats, per_tier, time.perf_counter() - start
+
+
+def report_bank_stats(stats, per_tier, wall):
+    """Print puzzles/sec for each worker and for the whole run."""
+    names = list(DIFFICULTY_NAMES)
+    print("added: " + ", ".join(f"{names[tier]} {added}" for tier, added in sorted(per_tier.items())))
+    for pid, (generated, busy) in sorted(stats.items()):
+        print(f"worker {pid}: {generated} puzzles in {busy:.2f}s ({generated / busy if busy else 0:.1f} puzzles/sec)")
+    total = sum(generated for generated, _ in stats.values())
+    print(f"overall: {total} puzzles in {wall:.2f}s ({total / wall if wall else 0:.1f} puzzles/sec)")
+
+
 
 if __name__ == "__main__":
 
-    # small test to ensure the puzzle generation is working.
-    puzzle, solution = create_puzzle_from_library()
-    print(puzzle.board)
-    print(solution.board)
-    puzzle.show()
-    solution.show()
\ No newline at end of file
+    parser = argparse.ArgumentParser(description="Generate Sudoku puzzles.")
+    parser.add_argument("--count", type=int, default=0, help="number of puzzles to add to the bank")
+    parser.add_argument("--difficulty", choices=DIFFICULTY_NAMES, default="medium")
+    parser.add_argument("--workers", type=int, default=os.cpu_count(), help="generator processes")
+    parser.add_argument("--out", default=None, help="puzzle bank file to create or extend")
+    parser.add_argument("--chunk", type=int, default=200, help="puzzles per worker task")
+    parser.add_argument("--grade", action="store_true",
+                        help="file each puzzle under the tier the technique grader gives it")
+    args = parser.parse_args()
+
+    if args.out and args.count > 0:
+        stats, per_tier, wall = generate_bank(args.out, args.count, DIFFICULTY_NAMES[args.difficulty],
+                                              args.workers, args.chunk, args.grade)
+        report_bank_stats(stats, per_tier, wall)
+    else:
+        # small test to ensure the puzzle generation is working.
+        puzzle, solution = create_puzzle_from_library()
+        print(puzzle.board)
+        print(solution.board)
+        puzzle.show()
+        solution.show()
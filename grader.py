@@ -0,0 +1,241 @@
+#! /usr/bin/env python3
+
+# ------------------------------------------------------------
+# grader.py
+# Human-technique difficulty grader for the Lofi Sudoku Game
+# By: Beck Bishp
+# Last Updated: 10/18/2026
+# ------------------------------------------------------------
+#
+# Solves a puzzle the way a person would, applying the easiest technique
+# that makes progress and starting over from the easiest after each step.
+# The hardest technique that was needed decides the difficulty tier and
+# every step adds that technique's weight to the score.
+
+from collections import namedtuple
+from itertools import combinations
+
+from board import ROWS, COLS, BOXES, UNITS, PEERS
+from solver import ALL_DIGITS, flatten
+
+
+DIGIT_BITS = [1 << d for d in range(1, 10)]
+
+GUESS_WEIGHT = 50          # Added to the score when logic alone gets stuck
+
+Grade = namedtuple("Grade", "solved hardest score tier steps")
+
+
+# ------------------------------------------------------------
+# Grader Class
+# ------------------------------------------------------------
+
+class Grader:
+    """Candidate-grid logical solver. Each candidate set is a 9-bit mask.
+
+    puzzle is a Board, a list of rows or a flat list of cells; anything but
+    a 9x9 board raises ValueError.
+    """
+
+    def __init__(self, puzzle):
+        cells = flatten(puzzle)
+        if len(cells) != 81:
+            raise ValueError("grader supports 9x9 only")
+        self.values = [0] * 81
+        self.candidates = [ALL_DIGITS] * 81
+        self.open = 81
+        self.broken = False
+        for idx, digit in enumerate(cells):
+            if digit:
+                self.assign(idx, digit)
+
+    def assign(self, idx, digit):
+        bit = 1 << digit
+        if not self.candidates[idx] & bit:
+            self.broken = True
+        self.values[idx] = digit
+        self.candidates[idx] = 0
+        self.open -= 1
+        candidates = self.candidates
+        for peer in PEERS[idx]:
+            candidates[peer] &= ~bit
+
+    def eliminate(self, cells, mask):
+        """Remove mask from the candidates of cells. Returns True if anything changed."""
+        changed = False
+        candidates = self.candidates
+        for idx in cells:
+            if candidates[idx] & mask:
+                candidates[idx] &= ~mask
+                changed = True
+        return changed
+
+    # --- Techniques: each returns True if it made progress ---
+
+    def naked_single(self):
+        progress = False
+        for idx in range(81):
+            mask = self.candidates[idx]
+            if mask and not mask & (mask - 1):
+                self.assign(idx, mask.bit_length() - 1)
+                progress = True
+        return progress
+
+    def hidden_single(self):
+        candidates = self.candidates
+        for unit in UNITS:
+            once = twice = 0
+            for idx in unit:
+                twice |= once & candidates[idx]
+                once |= candidates[idx]
+            hidden = once & ~twice
+            if hidden:
+                bit = hidden & -hidden
+                for idx in unit:
+                    if candidates[idx] & bit:
+                        self.assign(idx, bit.bit_length() - 1)
+                        return True
+        return False
+
+    def pointing(self):
+        # A digit confined to one row or column inside a box can be removed
+        # from that row or column outside the box.
+        candidates = self.candidates
+        for b, box in enumerate(BOXES):
+            for bit in DIGIT_BITS:
+                cells = [idx for idx in box if candidates[idx] & bit]
+                if len(cells) < 2:
+                    continue
+                rows = {idx // 9 for idx in cells}
+                cols = {idx % 9 for idx in cells}
+                if len(rows) == 1:
+                    others = [idx for idx in ROWS[rows.pop()] if idx not in box]
+                    if self.eliminate(others, bit):
+                        return True
+                if len(cols) == 1:
+                    others = [idx for idx in COLS[cols.pop()] if idx not in box]
+                    if self.eliminate(others, bit):
+                        return True
+        return False
+
+    def box_line_reduction(self):
+        # A digit confined to one box inside a row or column can be removed
+        # from the rest of that box.
+        candidates = self.candidates
+        for line in ROWS + COLS:
+            for bit in DIGIT_BITS:
+                cells = [idx for idx in line if candidates[idx] & bit]
+                if len(cells) < 2:
+                    continue
+                boxes = {(idx // 27) * 3 + (idx % 9) // 3 for idx in cells}
+                if len(boxes) == 1:
+                    others = [idx for idx in BOXES[boxes.pop()] if idx not in line]
+                    if self.eliminate(others, bit):
+                        return True
+        return False
+
+    def _naked_subset(self, size):
+        candidates = self.candidates
+        for unit in UNITS:
+            cells = [idx for idx in unit if candidates[idx] and candidates[idx].bit_count() <= size]
+            for group in combinations(cells, size):
+                mask = 0
+                for idx in group:
+                    mask |= candidates[idx]
+                if mask.bit_count() == size:
+                    others = [idx for idx in unit if idx not in group]
+                    if self.eliminate(others, mask):
+                        return True
+        return False
+
+    def naked_pair(self):
+        return self._naked_subset(2)
+
+    def naked_triple(self):
+        return self._naked_subset(3)
+
+    def hidden_pair(self):
+        candidates = self.candidates
+        for unit in UNITS:
+            places = {}
+            for bit in DIGIT_BITS:
+                cells = tuple(idx for idx in unit if candidates[idx] & bit)
+                if len(cells) == 2:
+                    places.setdefault(cells, []).append(bit)
+            for cells, bits in places.items():
+                if len(bits) == 2:
+                    keep = bits[0] | bits[1]
+                    if self.eliminate(cells, ALL_DIGITS & ~keep):
+                        return True
+        return False
+
+    def x_wing(self):
+        candidates = self.candidates
+        for lines, across in ((ROWS, COLS), (COLS, ROWS)):
+            for bit in DIGIT_BITS:
+                # For each line, the positions (0-8) where the digit can go
+                spots = {}
+                for i, line in enumerate(lines):
+                    positions = tuple(p for p, idx in enumerate(line) if candidates[idx] & bit)
+                    if len(positions) == 2:
+                        spots.setdefault(positions, []).append(i)
+                for positions, found in spots.items():
+                    if len(found) < 2:
+                        continue
+                    for first, second in combinations(found, 2):
+                        others = [
+                            idx for p in positions for idx in across[p]
+                            if idx not in lines[first] and idx not in lines[second]
+                        ]
+                        if self.eliminate(others, bit):
+                            return True
+        return False
+
+    def run(self):
+        """Solve as far as logic allows. Returns a Grade."""
+        hardest = -1
+        score = 0
+        steps = 0
+        while self.open and not self.broken:
+            for level, (_, technique, _, _) in enumerate(TECHNIQUES):
+                if technique(self):
+                    hardest = max(hardest, level)
+                    score += TECHNIQUES[level][2]
+                    steps += 1
+                    break
+            else:
+                break
+
+        solved = self.open == 0 and not self.broken
+        if solved:
+            name, _, _, tier = TECHNIQUES[max(hardest, 0)]
+        else:
+            name, tier = "guessing", TECHNIQUES[-1][3]
+            score += GUESS_WEIGHT
+        return Grade(solved, name, score, tier, steps)
+
+
+# (name, method, weight, tier) from easiest to hardest. Tiers follow
+# DIFFICULTY_TIERS: 0 = easy, 1 = medium, 2 = hard.
+TECHNIQUES = [
+    ("naked single", Grader.naked_single, 1, 0),
+    ("hidden single", Grader.hidden_single, 2, 0),
+    ("pointing", Grader.pointing, 5, 1),
+    ("box/line reduction", Grader.box_line_reduction, 5, 1),
+    ("naked pair", Grader.naked_pair, 6, 1),
+    ("hidden pair", Grader.hidden_pair, 8, 1),
+    ("naked triple", Grader.naked_triple, 10, 2),
+    ("x-wing", Grader.x_wing, 14, 2),
+]
+
+
+# ------------------------------------------------------------
+# Entry Points
+# ------------------------------------------------------------
+
+def grade(puzzle):
+    """Grade a 9x9 puzzle (0 or None for blanks) by the techniques it needs.
+
+    Raises ValueError for other board sizes.
+    """
+    return Grader(puzzle).run()
@@ -0,0 +1,67 @@
+#! /usr/bin/env python3
+
+# ------------------------------------------------------------
+# layout.py
+# Window-size layout engine for the Lofi Sudoku Game
+# By: Beck Bishp
+# Last Updated: 10/18/2026
+# ------------------------------------------------------------
+
+import pygame
+
+from constants import SURFACE_WIDTH, SURFACE_HEIGHT, BOARD_SIZE, BOX_SIZE
+
+
+def get_board_layout(box=BOX_SIZE, width=SURFACE_WIDTH, height=SURFACE_HEIGHT):
+    """Cell size and top-left corner of a centered board with box x box boxes.
+
+    Every board size gets the same area, BOARD_SIZE at the default window
+    size and scaled with the window, so bigger boards get smaller cells.
+    """
+    size = box * box
+    area = int(BOARD_SIZE * min(width / SURFACE_WIDTH, height / SURFACE_HEIGHT))
+    cell_size = max(area // size, 1)
+    board_px = cell_size * size
+    return cell_size, ((width - board_px) // 2, (height - board_px) // 2)
+
+
+# ------------------------------------------------------------
+# Layout Class
+# ------------------------------------------------------------
+
+class Layout:
+    """Where things go in a window of a given size.
+
+    The screens are designed for the default SURFACE_WIDTH x SURFACE_HEIGHT
+    window. A layout scales that design by the same factor both ways, as
+    large as fits the window, and centers it, so the board (see
+    get_board_layout) and everything around it keep their proportions.
+    Coordinates and font sizes given in the default window are turned into
+    ones for this window.
+    """
+
+    def __init__(self, size):
+        self.size = width, height = tuple(size)
+        self.scale = min(width / SURFACE_WIDTH, height / SURFACE_HEIGHT)
+        self.offset = ((width - SURFACE_WIDTH * self.scale) / 2, (height - SURFACE_HEIGHT * self.scale) / 2)
+
+    def point(self, x, y):
+        """A point in the default window, in this window."""
+        return (round(self.offset[0] + x * self.scale), round(self.offset[1] + y * self.scale))
+
+    def rect(self, x, y, width, height):
+        """A rect in the default window, in this window."""
+        left, top = self.point(x, y)
+        return pygame.Rect(left, top, max(round(width * self.scale), 1), max(round(height * self.scale), 1))
+
+    def font_size(self, size):
+        """A font size (in points) used in the default window, in this window."""
+        return max(round(size * self.scale), 1)
+
+    def board(self, box=BOX_SIZE):
+        """Cell size and top-left corner of the board, see get_board_layout()."""
+        return get_board_layout(box, *self.size)
+
+
+# Layout of the default window, used when none is given
+DEFAULT_LAYOUT = Layout((SURFACE_WIDTH, SURFACE_HEIGHT))
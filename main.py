@@ -4,21 +4,42 @@
 # main.py 
 # Lofi Sudoku Game 
 # By: Beck Bishp 
-# Last Updated: 01/16/2026
+# Last Updated: 10/18/2026
 # ------------------------------------------------------------
 
+import time
+
+# Startup timings count from here, before the heavier imports below
+LAUNCHED = time.perf_counter()
+
+import argparse
+import math
 import pygame
 import sys
 
 # contains constants for the pygame library
 from pygame.locals import *
-from constants import WHITE, BLACK, GRAY, SURFACE_HEIGHT, SURFACE_WIDTH, FPS
-from constants import HIGHLIGHT_COLOR, PLAYER_NUMBER_COLOR, CORRECT_COLOR, INCORRECT_COLOR
-from constants import NUM_CELLS, CELL_SIZE, BOARD_SIZE
-from constants import EASY_DIFFICULTY, MEDIUM_DIFFICULTY, HARD_DIFFICULTY
+from constants import WHITE, BLACK, GRAY, DARK_GRAY, SURFACE_HEIGHT, SURFACE_WIDTH
+from constants import HIGHLIGHT_COLOR, CORRECT_COLOR, INCORRECT_COLOR
+from constants import NUM_CELLS, BOX_SIZE, BOX_SIZES, DIGIT_FONT_SCALE
+from constants import EASY_DIFFICULTY, MEDIUM_DIFFICULTY, HARD_DIFFICULTY, DIFFICULTY_TIERS
 from constants import BUTTON_COLOR, BUTTON_HOVER_COLOR, BUTTON_TEXT_COLOR, BUTTON_SELECTED_COLOR
-from constants import STATE_MENU, STATE_PLAYING, STATE_GAME_OVER
-from generate_puzzle import create_puzzle_from_library
+from constants import STATE_MENU, STATE_PLAYING, STATE_LOADING, STATE_GAME_OVER
+from constants import PUZZLE_BANK_PATH, PROFILER_CSV_PATH, SERVICE_HOST, SERVICE_PORT
+from puzzle_bank import PuzzleBank
+from puzzle_pool import PuzzlePool
+from puzzle_ids import normalize_puzzle_id, seeded_boards
+from generate_puzzle import create_puzzle_variant
+from game_core import GameCore, GameEvent
+from game_core import SET_DIFFICULTY, SET_BOX_SIZE, TOGGLE_HINTS, START, PLAY_ID, RESUME, SELECT, DIGIT, CLEAR
+from game_core import UNDO, REDO, TOGGLE_NOTES, SHOW_SOLUTION, NEW_GAME, PLAY_AGAIN, MENU
+from board_renderer import BoardRenderer
+from text_cache import text_cache
+from frame_scheduler import FrameScheduler
+from background import LofiBackground
+from savegame import Autosaver
+from profiler import profiler, StartupTimer
+from layout import Layout, DEFAULT_LAYOUT
 
 
 # ------------------------------------------------------------
@@ -55,7 +76,7 @@ class Button:
         pygame.draw.rect(surface, WHITE, self.rect, width=2, border_radius=8)
         
         # Draw text centered on button
-        text_surface = self.font.render(self.text, True, self.text_color)
+        text_surface = text_cache.render(self.font, self.text, True, self.text_color)
         text_rect = text_surface.get_rect(center=self.rect.center)
         surface.blit(text_surface, text_rect)
     
@@ -69,184 +90,214 @@ class Button:
         return False
 
 
+class TextBox:
+    """A one-line text field. Click it to type; Enter submits."""
+    
+    def __init__(self, x, y, width, height, font, placeholder="", max_length=12):
+        self.rect = pygame.Rect(x, y, width, height)
+        self.font = font
+        self.placeholder = placeholder
+        self.max_length = max_length
+        self.text = ""
+        self.focused = False
+        self.error = False
+    
+    def draw(self, surface):
+        """Draw the text field on the surface."""
+        border = INCORRECT_COLOR if self.error else HIGHLIGHT_COLOR if self.focused else WHITE
+        pygame.draw.rect(surface, BUTTON_COLOR, self.rect, border_radius=8)
+        pygame.draw.rect(surface, border, self.rect, width=2, border_radius=8)
+        
+        if self.text or self.focused:
+            text_surface = text_cache.render(self.font, self.text + ("_" if self.focused else ""), True, WHITE)
+        else:
+            text_surface = text_cache.render(self.font, self.placeholder, True, GRAY)
+        text_rect = text_surface.get_rect(midleft=(self.rect.x + 10, self.rect.centery))
+        surface.blit(text_surface, text_rect)
+    
+    def handle_event(self, event):
+        """Handle mouse and key events. Returns True when Enter is pressed."""
+        if event.type == MOUSEBUTTONDOWN and event.button == 1:
+            self.focused = self.rect.collidepoint(event.pos)
+        elif event.type == KEYDOWN and self.focused:
+            self.error = False
+            if event.key in (K_RETURN, K_KP_ENTER):
+                return True
+            elif event.key == K_BACKSPACE:
+                self.text = self.text[:-1]
+            elif event.unicode and (event.unicode.isalnum() or event.unicode in "#-") \
+                    and len(self.text) < self.max_length:
+                self.text += event.unicode.upper()
+        return False
+
+
 # ------------------------------------------------------------
 # Game Helper Functions
 # ------------------------------------------------------------
 
-def get_board_position():
+def get_board_position(box=BOX_SIZE, layout=DEFAULT_LAYOUT):
     "Calculate the top-left position of the board for centering."
-    margin_x = (SURFACE_WIDTH - BOARD_SIZE) // 2
-    margin_y = (SURFACE_HEIGHT - BOARD_SIZE) // 2
-    return margin_x, margin_y
-
-
-def is_board_complete(puzzle_board, player_board):
-    """Check if all cells are filled (no empty cells remaining)."""
-    for row in range(NUM_CELLS):
-        for col in range(NUM_CELLS):
-            original = puzzle_board[row][col]
-            player = player_board[row][col]
-            if (original is None or original == 0) and (player is None or player == 0):
-                return False
-    return True
-
-
-def check_solution(puzzle_board, player_board, solution_board):
-    """Check if the player's solution is correct."""
-    for row in range(NUM_CELLS):
-        for col in range(NUM_CELLS):
-            original = puzzle_board[row][col]
-            if original is None or original == 0:
-                player_value = player_board[row][col]
-                solution_value = solution_board[row][col]
-                if player_value != solution_value:
-                    return False
-    return True
-
-
-def is_cell_correct(row, col, puzzle_board, player_board, solution_board):
-    """Check if a specific player's entered cell is correct."""
-    original = puzzle_board[row][col]
-    if original is None or original == 0:
-        player_value = player_board[row][col]
-        if player_value is not None and player_value != 0:
-            return player_value == solution_board[row][col]
-    return True
-
-
-def get_cell_from_mouse(pos):
+    return layout.board(box)[1]
+
+
+def load_fonts(layout=DEFAULT_LAYOUT):
+    """Title, button and profiler overlay fonts sized for a layout."""
+    return tuple(pygame.font.Font('freesansbold.ttf', layout.font_size(size)) for size in (32, 18, 12))
+
+
+def load_puzzle_source(server=None):
+    """Use the on-disk puzzle bank if it can be read and every tier has puzzles,
+    otherwise seeded generation.
+
+    server: (host, port) of a puzzle service to ask first. The local source
+    is used whenever the service cannot be reached.
+    """
+    source = seeded_boards
+    try:
+        bank = PuzzleBank.open_if_exists(PUZZLE_BANK_PATH)
+    except (OSError, ValueError):
+        # An unreadable or damaged bank is passed over, not fatal
+        bank = None
+    if (bank is not None and bank.tiers >= len(DIFFICULTY_TIERS)
+            and all(bank.count(tier) for tier in range(bank.tiers))):
+        # Show each bank puzzle as a random variant of itself, so even a
+        # small bank rarely repeats. The bank only holds 9x9 puzzles.
+        def bank_variant(difficulty, box=BOX_SIZE):
+            if box != BOX_SIZE:
+                return seeded_boards(difficulty, box)
+            return create_puzzle_variant(*bank.random_boards(difficulty)) + (None,)
+        source = bank_variant
+    if server is not None:
+        # Only imported when asked for: it brings in asyncio and the process pool
+        from puzzle_service import PuzzleClient, service_source
+        source = service_source(PuzzleClient(*server), fallback=source)
+    return source
+
+
+# Keys that enter a digit (keyboard and numpad, then A-P for 10-25 on the
+# bigger boards), clear a cell, or toggle pencil marks. N is the digit 23 on
+# a 25x25 board, so Tab toggles pencil marks there.
+DIGIT_KEYS = {K_1: 1, K_2: 2, K_3: 3, K_4: 4, K_5: 5, K_6: 6, K_7: 7, K_8: 8, K_9: 9,
+              K_KP1: 1, K_KP2: 2, K_KP3: 3, K_KP4: 4, K_KP5: 5, K_KP6: 6, K_KP7: 7, K_KP8: 8, K_KP9: 9}
+DIGIT_KEYS.update({K_a + i: 10 + i for i in range(16)})
+CLEAR_KEYS = (K_DELETE, K_BACKSPACE, K_0, K_KP0)
+NOTES_KEYS = (K_n, K_TAB)
+
+
+def get_cell_from_mouse(pos, box=BOX_SIZE, layout=DEFAULT_LAYOUT):
     """Convert mouse position to grid cell coordinates (row, col)."""
-    margin_x, margin_y = get_board_position() 
+    cell_size, (margin_x, margin_y) = layout.board(box)
+    board_px = cell_size * box * box
     x, y = pos 
 
-    if (margin_x <= x < margin_x + BOARD_SIZE and 
-        margin_y <= y < margin_y + BOARD_SIZE):
-        col = (x - margin_x) // CELL_SIZE 
-        row = (y - margin_y) // CELL_SIZE 
+    if (margin_x <= x < margin_x + board_px and 
+        margin_y <= y < margin_y + board_px):
+        col = (x - margin_x) // cell_size 
+        row = (y - margin_y) // cell_size 
         return row, col 
 
     return None
 
 
-def fill_solution(puzzle_board, player_board, solution_board):
-    """Fill the player board with the correct solution for empty cells."""
-    for row in range(NUM_CELLS):
-        for col in range(NUM_CELLS):
-            original = puzzle_board[row][col]
-            solution_value = solution_board[row][col]
-            # Only fill cells that were originally empty
-            if original is None or original == 0:
-                # Make sure we have a valid solution value
-                if solution_value is not None:
-                    player_board[row][col] = solution_value
-
-
 # ------------------------------------------------------------
 # Drawing Functions
 # ------------------------------------------------------------
 
-def draw_highlight(surface, selected_cell): 
-    """Draw highlight around the selected cell.""" 
-    if selected_cell is None:
-        return 
-    
-    row, col = selected_cell  
-    margin_x, margin_y = get_board_position()  
-    x = margin_x + col * CELL_SIZE 
-    y = margin_y + row * CELL_SIZE 
-    pygame.draw.rect(surface, HIGHLIGHT_COLOR, (x, y, CELL_SIZE, CELL_SIZE))
-
-
-def draw_puzzle(surface, puzzle_board, player_board, solution_board, font, show_hints=True):
-    """Draw the puzzle numbers onto the grid."""
-    margin_x, margin_y = get_board_position() 
-
-    for row in range(NUM_CELLS):
-        for col in range(NUM_CELLS): 
-            original_value = puzzle_board[row][col] 
-            player_value = player_board[row][col]
-
-            if original_value is not None and original_value != 0:
-                value = original_value
-                color = WHITE
-            elif player_value is not None and player_value != 0:
-                value = player_value
-                if show_hints:
-                    if is_cell_correct(row, col, puzzle_board, player_board, solution_board):
-                        color = PLAYER_NUMBER_COLOR
-                    else:
-                        color = INCORRECT_COLOR
-                else:
-                    color = PLAYER_NUMBER_COLOR  # No hints - always green
-            else:
-                continue
+def draw_hints_status(surface, board_renderer, font, rect, show_hints):
+    """Draw the "Hints: ON/OFF" label of the playing screen if it changed. Returns dirty rects."""
+    text = text_cache.render(font, f"Hints: {'ON' if show_hints else 'OFF'}", True, GRAY)
+    return board_renderer.draw_widget(surface, "hints", rect, show_hints,
+                                      lambda surface: surface.blit(text, rect))
 
-            text_surface = font.render(str(value), True, color)
-            text_rect = text_surface.get_rect()
-            cell_center_x = margin_x + col * CELL_SIZE + CELL_SIZE // 2
-            cell_center_y = margin_y + row * CELL_SIZE + CELL_SIZE // 2
-            text_rect.center = (cell_center_x, cell_center_y)
-            surface.blit(text_surface, text_rect)
 
-
-def draw_grid(surface):
-    """Draws the sudoku grid on the surface."""
-    margin_x, margin_y = get_board_position() 
-
-    for i in range(10):
-        line_width = 4 if i % 3 == 0 else 1
-        x = margin_x + i * CELL_SIZE 
-        pygame.draw.line(surface, WHITE, (x, margin_y), (x, margin_y + BOARD_SIZE), line_width)
-        
-        y = margin_y + i * CELL_SIZE
-        pygame.draw.line(surface, WHITE, (margin_x, y), (margin_x + BOARD_SIZE, y), line_width)
+def draw_profiler_overlay(surface, font, rect, text):
+    """Draw the profiler's one-line summary in a strip at the top of the window."""
+    surface.fill(DARK_GRAY, rect)
+    surface.blit(font.render(text, True, WHITE), (rect.x + 4, rect.y + 1))
 
 
 # ------------------------------------------------------------
 # Scene Functions
 # ------------------------------------------------------------
 
-def draw_menu(surface, title_font, button_font, difficulty_buttons, hints_button, start_button):
+@profiler.timed("draw_menu")
+def draw_menu(surface, title_font, button_font, difficulty_buttons, hints_button, start_button,
+              id_box=None, play_id_button=None, size_button=None, resume_button=None, layout=DEFAULT_LAYOUT):
     """Draw the main menu screen."""
     surface.fill(BLACK)
     
     # Draw title
-    title_text = title_font.render('Lofi-Sudoku', True, WHITE)
-    title_rect = title_text.get_rect(midtop=(SURFACE_WIDTH // 2, 40))
+    title_text = text_cache.render(title_font, 'Lofi-Sudoku', True, WHITE)
+    title_rect = title_text.get_rect(midtop=layout.point(SURFACE_WIDTH // 2, 40))
     surface.blit(title_text, title_rect)
     
     # Draw subtitle
-    subtitle_text = button_font.render('Select Difficulty', True, GRAY)
-    subtitle_rect = subtitle_text.get_rect(midtop=(SURFACE_WIDTH // 2, 100))
+    subtitle_text = text_cache.render(button_font, 'Select Difficulty', True, GRAY)
+    subtitle_rect = subtitle_text.get_rect(midtop=layout.point(SURFACE_WIDTH // 2, 100))
     surface.blit(subtitle_text, subtitle_rect)
     
     # Draw difficulty buttons
     for btn in difficulty_buttons:
         btn.draw(surface)
     
-    # Draw hints toggle button
+    # Draw hints toggle and board size buttons
     hints_button.draw(surface)
+    if size_button is not None:
+        size_button.draw(surface)
     
-    # Draw start button
+    # Draw start button (and resume, when there is a game to go back to)
     start_button.draw(surface)
+    if resume_button is not None:
+        resume_button.draw(surface)
+    
+    # Draw the "play puzzle #ID" field
+    if id_box is not None:
+        id_box.draw(surface)
+        play_id_button.draw(surface)
 
 
-def draw_game_over(surface, title_font, button_font, play_again_button, menu_button):
+@profiler.timed("draw_loading")
+def draw_loading(surface, title_font, button_font, layout=DEFAULT_LAYOUT, error=None):
+    """Draw the screen shown while waiting for a puzzle to be generated,
+    with the error if generating keeps failing."""
+    surface.fill(BLACK)
+
+    title_text = text_cache.render(title_font, 'Lofi-Sudoku', True, WHITE)
+    title_rect = title_text.get_rect(midtop=layout.point(SURFACE_WIDTH // 2, 40))
+    surface.blit(title_text, title_rect)
+
+    loading_text = text_cache.render(button_font, 'Generating puzzle...', True, GRAY)
+    loading_rect = loading_text.get_rect(center=layout.point(SURFACE_WIDTH // 2, SURFACE_HEIGHT // 2))
+    surface.blit(loading_text, loading_rect)
+
+    if error is not None:
+        lines = ("Could not make a puzzle, still trying:", f"{type(error).__name__}: {error}"[:48])
+        for i, line in enumerate(lines):
+            error_text = text_cache.render(button_font, line, True, INCORRECT_COLOR)
+            surface.blit(error_text, error_text.get_rect(
+                center=layout.point(SURFACE_WIDTH // 2, SURFACE_HEIGHT // 2 + 40 + 25 * i)))
+
+    esc_text = text_cache.render(button_font, "ESC: Menu", True, GRAY)
+    surface.blit(esc_text, layout.point(SURFACE_WIDTH - 100, SURFACE_HEIGHT - 30))
+
+
+@profiler.timed("draw_game_over")
+def draw_game_over(surface, title_font, button_font, play_again_button, menu_button, layout=DEFAULT_LAYOUT):
     """Draw the game over screen."""
     surface.fill(BLACK)
     
     # Draw congratulations message
-    congrats_text = title_font.render('Congratulations!', True, CORRECT_COLOR)
-    congrats_rect = congrats_text.get_rect(midtop=(SURFACE_WIDTH // 2, 80))
+    congrats_text = text_cache.render(title_font, 'Congratulations!', True, CORRECT_COLOR)
+    congrats_rect = congrats_text.get_rect(midtop=layout.point(SURFACE_WIDTH // 2, 80))
     surface.blit(congrats_text, congrats_rect)
     
-    win_text = title_font.render('You Win!', True, WHITE)
-    win_rect = win_text.get_rect(midtop=(SURFACE_WIDTH // 2, 140))
+    win_text = text_cache.render(title_font, 'You Win!', True, WHITE)
+    win_rect = win_text.get_rect(midtop=layout.point(SURFACE_WIDTH // 2, 140))
     surface.blit(win_text, win_rect)
     
     # Draw subtitle
-    subtitle_text = button_font.render('Puzzle Completed Successfully', True, GRAY)
-    subtitle_rect = subtitle_text.get_rect(midtop=(SURFACE_WIDTH // 2, 200))
+    subtitle_text = text_cache.render(button_font, 'Puzzle Completed Successfully', True, GRAY)
+    subtitle_rect = subtitle_text.get_rect(midtop=layout.point(SURFACE_WIDTH // 2, 200))
     surface.blit(subtitle_text, subtitle_rect)
     
     # Draw buttons
@@ -258,25 +309,54 @@ def draw_game_over(surface, title_font, button_font, play_again_button, menu_but
 # Main Game Function
 # ------------------------------------------------------------
 
-def main():
-    """Main Lofi Sudoku Game Loop"""
+def main(start_id=None, server=None, box=BOX_SIZE, show_timings=False, animate_background=False):
+    """Main Lofi Sudoku Game Loop
+
+    start_id: a puzzle ID to start on straight away instead of the menu.
+    server: (host, port) of a puzzle service to fetch puzzles from.
+    box: box width of the board size selected in the menu (3 for 9x9).
+    show_timings: print the time to the first frame and the first puzzle,
+                  and on quitting how often the main loop woke up.
+    animate_background: start with the animated background on (F2 toggles it).
+    """
     
-    pygame.init()
-    fpsClock = pygame.time.Clock() 
-    DISPLAYSURF = pygame.display.set_mode((SURFACE_WIDTH, SURFACE_HEIGHT))
+    # Only the display and fonts are started: the game never uses the mixer
+    # or the other modules pygame.init() would bring up (audio alone can
+    # take a noticeable part of a second)
+    startup = StartupTimer(LAUNCHED)
+    pygame.display.init()
+    pygame.font.init()
+    scheduler = FrameScheduler()
+    # The window can be resized; everything is laid out for its current size
+    # (see layout.py) and laid out again only when it changes
+    DISPLAYSURF = pygame.display.set_mode((SURFACE_WIDTH, SURFACE_HEIGHT), RESIZABLE)
     pygame.display.set_caption("Lofi-Sudoku") 
+    layout = Layout(DISPLAYSURF.get_size())
+
+    # Puzzles are generated in the background, but only once the first
+    # frame is up (see the end of the main loop), so the workers do not
+    # compete with building it
+    puzzle_pool = PuzzlePool()
 
     # Create font objects
-    title_font = pygame.font.Font('freesansbold.ttf', 32)
-    puzzle_font = pygame.font.Font('freesansbold.ttf', 21)
-    button_font = pygame.font.Font('freesansbold.ttf', 18)
+    title_font, button_font, overlay_font = load_fonts(layout)
 
     # --- Game State ---
-    game_state = STATE_MENU
-    selected_difficulty = MEDIUM_DIFFICULTY
-    show_hints = True
+    # All rules live in GameCore; this loop only turns pygame input into
+    # GameEvents and draws whatever state the core is in.
+    core = GameCore(puzzle_pool.get, puzzle_pool.get_id, start_id)
+    core.handle(GameEvent(SET_BOX_SIZE, box))
+    
+    # The game saved last time (if it was not finished) is offered on the
+    # menu as Resume. Progress is saved in the background while playing.
+    # Starting on a puzzle ID leaves the saved game for the next launch.
+    autosaver = Autosaver()
+    if start_id is None:
+        autosaver.restore(core)
     
     # --- Menu Buttons ---
+    # Widgets are placed in the default window; place_widgets() moves them
+    # to where the layout puts them
     button_width = 120
     button_height = 45
     button_y = 150
@@ -288,9 +368,14 @@ def main():
     medium_btn = Button(start_x + button_width + button_spacing, button_y, button_width, button_height, "Medium", button_font, selected=True)
     hard_btn = Button(start_x + 2 * (button_width + button_spacing), button_y, button_width, button_height, "Hard", button_font)
     difficulty_buttons = [easy_btn, medium_btn, hard_btn]
+    button_difficulty = {easy_btn: EASY_DIFFICULTY, medium_btn: MEDIUM_DIFFICULTY, hard_btn: HARD_DIFFICULTY}
     
-    hints_btn = Button(SURFACE_WIDTH // 2 - 100, 230, 200, button_height, "Hints: ON", button_font)
+    hints_btn = Button(SURFACE_WIDTH // 2 - 205, 230, 195, button_height, "Hints: ON", button_font)
+    size_btn = Button(SURFACE_WIDTH // 2 + 10, 230, 195, button_height, f"Board: {NUM_CELLS}x{NUM_CELLS}", button_font)
     start_btn = Button(SURFACE_WIDTH // 2 - 80, 320, 160, 50, "Start Game", button_font)
+    resume_btn = Button(SURFACE_WIDTH // 2 + 10, 320, 160, 50, "Resume", button_font)
+    id_box = TextBox(SURFACE_WIDTH // 2 - 130, 400, 160, 40, button_font, "Puzzle ID")
+    play_id_btn = Button(SURFACE_WIDTH // 2 + 40, 400, 90, 40, "Play #", button_font)
     
     # --- Game Over Buttons ---
     play_again_btn = Button(SURFACE_WIDTH // 2 - 100, 280, 200, 50, "Play Again", button_font)
@@ -300,166 +385,342 @@ def main():
     show_solution_btn = Button(SURFACE_WIDTH // 2 - 75, SURFACE_HEIGHT - 50, 150, 35, "Show Solution", button_font)
     new_game_btn = Button(SURFACE_WIDTH // 2 - 75, SURFACE_HEIGHT - 50, 150, 35, "New Game", button_font)
     
-    # --- Game Variables (initialized when game starts) ---
-    puzzle = None
-    solution = None
-    player_board = None
-    selected_cell = None
-    game_won = False
-    solution_revealed = False  # Track if solution was shown
+    widget_rects = {widget: tuple(widget.rect) for widget in (
+        *difficulty_buttons, hints_btn, size_btn, start_btn, resume_btn, id_box, play_id_btn,
+        play_again_btn, menu_btn, show_solution_btn, new_game_btn)}
+    
+    def place_widgets():
+        for widget, rect in widget_rects.items():
+            widget.rect = layout.rect(*rect)
+            widget.font = button_font
+    
+    # Retained-mode renderers for the playing screen, one per board size,
+    # each laid out to fit the window. A resize drops them, so the grid and
+    # digit glyphs are only rasterized again when the window size changes.
+    board_renderers = {}
+    last_drawn_state = None
+    drawn_loading_error = None
+
+    def renderer_for(box):
+        if box not in board_renderers:
+            cell_size, origin = layout.board(box)
+            font = pygame.font.Font('freesansbold.ttf', max(round(cell_size * DIGIT_FONT_SCALE), 1))
+            board_renderers[box] = BoardRenderer(font, origin, cell_size=cell_size, box=box)
+        return board_renderers[box]
     
-    # Title for game screen
-    game_title_surface = title_font.render('Lofi-Sudoku', True, WHITE)
-    game_title_rect = game_title_surface.get_rect(midtop=(SURFACE_WIDTH // 2, 15))
+    # Animated background (F2 toggles). Built the first time it is turned on
+    background = None
+    ui_layer = None
+    background_on = False
+
+    def build_ui_layer():
+        # The UI layer is see-through wherever the screens leave black
+        layer = pygame.Surface(DISPLAYSURF.get_size()).convert()
+        layer.set_colorkey(BLACK)
+        return layer
+
+    def build_background():
+        return LofiBackground(DISPLAYSURF.get_size()), build_ui_layer()
+
+    if animate_background:
+        background, ui_layer = build_background()
+        background_on = True
+    
+    # Profiler overlay (F3 toggles, F4 exports a CSV trace)
+    overlay_rect = pygame.Rect(0, 0, DISPLAYSURF.get_width(), layout.font_size(15))
+
+    def translate_event(event):
+        """Turn one pygame event into GameEvents for the core's current state."""
+        game_events = []
+        
+        # --- Menu State Events ---
+        if core.state == STATE_MENU:
+            for btn, difficulty in button_difficulty.items():
+                if btn.handle_event(event):
+                    game_events.append(GameEvent(SET_DIFFICULTY, difficulty))
+            if hints_btn.handle_event(event):
+                game_events.append(GameEvent(TOGGLE_HINTS))
+            if size_btn.handle_event(event):
+                # Cycle through the board sizes
+                next_box = BOX_SIZES[(BOX_SIZES.index(core.box) + 1) % len(BOX_SIZES)]
+                game_events.append(GameEvent(SET_BOX_SIZE, next_box))
+            if start_btn.handle_event(event):
+                game_events.append(GameEvent(START))
+            if core.can_resume and resume_btn.handle_event(event):
+                game_events.append(GameEvent(RESUME))
+            if id_box.handle_event(event) or play_id_btn.handle_event(event):
+                game_events.append(GameEvent(PLAY_ID, id_box.text))
+        
+        # --- Loading State Events ---
+        elif core.state == STATE_LOADING:
+            if event.type == KEYDOWN and event.key == K_ESCAPE:
+                game_events.append(GameEvent(MENU))
+        
+        # --- Playing State Events ---
+        elif core.state == STATE_PLAYING:
+            # Show Solution until the solution is revealed, then New Game
+            if not core.solution_revealed:
+                if show_solution_btn.handle_event(event):
+                    game_events.append(GameEvent(SHOW_SOLUTION))
+            elif new_game_btn.handle_event(event):
+                game_events.append(GameEvent(NEW_GAME))
+            
+            if event.type == MOUSEBUTTONDOWN and event.button == 1:
+                game_events.append(GameEvent(SELECT, get_cell_from_mouse(event.pos, core.puzzle_board.box, layout)))
+            elif event.type == KEYDOWN:
+                digit = DIGIT_KEYS.get(event.key)
+                if event.key == K_ESCAPE:
+                    game_events.append(GameEvent(MENU))
+                elif event.mod & KMOD_CTRL and event.key in (K_z, K_y):
+                    # Ctrl+Z undoes; Ctrl+Y and Ctrl+Shift+Z redo
+                    redo = event.key == K_y or event.mod & KMOD_SHIFT
+                    game_events.append(GameEvent(REDO if redo else UNDO))
+                elif digit is not None and digit <= core.puzzle_board.size:
+                    game_events.append(GameEvent(DIGIT, digit))
+                elif event.key in NOTES_KEYS:
+                    game_events.append(GameEvent(TOGGLE_NOTES))
+                elif event.key in CLEAR_KEYS:
+                    game_events.append(GameEvent(CLEAR))
+        
+        # --- Game Over State Events ---
+        elif core.state == STATE_GAME_OVER:
+            if play_again_btn.handle_event(event):
+                game_events.append(GameEvent(PLAY_AGAIN))
+            elif menu_btn.handle_event(event):
+                game_events.append(GameEvent(MENU))
+        
+        return game_events
 
     # --- Main Game Loop ---- 
     while True:
         # --- Handle Events ---- 
-        for event in pygame.event.get():
+        # Sleeps until input arrives unless we are polling for a puzzle
+        # (or profiling, which needs real frames to measure) or the
+        # background is moving. The first frame never waits.
+        events = scheduler.next_events(animating=core.state == STATE_LOADING or profiler.enabled
+                                       or last_drawn_state is None
+                                       or (background_on and background.animating))
+        frame_start = time.perf_counter()
+        profiler.begin_frame()
+        phase_start = profiler.start()
+        new_size = None
+        for event in events:
             if event.type == QUIT:
+                # Save any progress since the last autosave, waiting at most
+                # a second so a stuck disk cannot hold up quitting
+                autosaver.update(core, force=True)
+                autosaver.flush(timeout=1.0)
+                if show_timings:
+                    print(scheduler.text(), flush=True)
+                puzzle_pool.stop()
                 pygame.quit()
                 sys.exit()
             
-            # --- Menu State Events ---
-            if game_state == STATE_MENU:
-                # Handle difficulty button clicks
-                if easy_btn.handle_event(event):
-                    selected_difficulty = EASY_DIFFICULTY
-                    easy_btn.selected = True
-                    medium_btn.selected = False
-                    hard_btn.selected = False
-                elif medium_btn.handle_event(event):
-                    selected_difficulty = MEDIUM_DIFFICULTY
-                    easy_btn.selected = False
-                    medium_btn.selected = True
-                    hard_btn.selected = False
-                elif hard_btn.handle_event(event):
-                    selected_difficulty = HARD_DIFFICULTY
-                    easy_btn.selected = False
-                    medium_btn.selected = False
-                    hard_btn.selected = True
-                
-                # Handle hints toggle
-                if hints_btn.handle_event(event):
-                    show_hints = not show_hints
-                    hints_btn.text = "Hints: ON" if show_hints else "Hints: OFF"
-                
-                # Handle start button
-                if start_btn.handle_event(event):
-                    # Generate new puzzle and start game
-                    puzzle, solution = create_puzzle_from_library(selected_difficulty)
-                    player_board = [[0] * 9 for _ in range(9)]
-                    selected_cell = None
-                    game_won = False
-                    solution_revealed = False
-                    game_state = STATE_PLAYING
+            # Dragging a window edge sends a stream of these; only the last
+            # one of the frame is laid out
+            if event.type == VIDEORESIZE:
+                new_size = event.size
             
-            # --- Playing State Events ---
-            elif game_state == STATE_PLAYING:
-                # Handle Show Solution button (only if solution not already revealed)
-                if not solution_revealed:
-                    if show_solution_btn.handle_event(event):
-                        fill_solution(puzzle.board, player_board, solution.board)
-                        solution_revealed = True
-                else:
-                    # Handle New Game button (only shown after solution is revealed)
-                    if new_game_btn.handle_event(event):
-                        puzzle, solution = create_puzzle_from_library(selected_difficulty)
-                        player_board = [[0] * 9 for _ in range(9)]
-                        selected_cell = None
-                        game_won = False
-                        solution_revealed = False
-                
-                if event.type == MOUSEBUTTONDOWN:
-                    if event.button == 1:
-                        cell = get_cell_from_mouse(event.pos) 
-                        if cell:
-                            row, col = cell 
-                            if puzzle.board[row][col] is None or puzzle.board[row][col] == 0: 
-                                selected_cell = cell 
-                            else: 
-                                selected_cell = None
-                        else: 
-                            selected_cell = None
-                
-                elif event.type == KEYDOWN:
-                    # ESC to return to menu
-                    if event.key == K_ESCAPE:
-                        game_state = STATE_MENU
-                    
-                    elif selected_cell is not None:
-                        row, col = selected_cell  
-
-                        if event.key in (K_1, K_2, K_3, K_4, K_5, K_6, K_7, K_8, K_9):
-                            number = event.key - K_0
-                            player_board[row][col] = number  
-                        
-                        elif event.key in (K_KP1, K_KP2, K_KP3, K_KP4, K_KP5, K_KP6, K_KP7, K_KP8, K_KP9):
-                            number = event.key - K_KP0
-                            player_board[row][col] = number  
-                        
-                        elif event.key in (K_DELETE, K_BACKSPACE, K_0, K_KP0):
-                            player_board[row][col] = 0
+            # --- Background Hotkey (any screen) ---
+            if event.type == KEYDOWN and event.key == K_F2:
+                background_on = not background_on
+                if background_on and background is None:
+                    background, ui_layer = build_background()
+                # Everything is drawn again onto the new target
+                last_drawn_state = None
             
-            # --- Game Over State Events ---
-            elif game_state == STATE_GAME_OVER:
-                if play_again_btn.handle_event(event):
-                    # Start a new game with same settings
-                    puzzle, solution = create_puzzle_from_library(selected_difficulty)
-                    player_board = [[0] * 9 for _ in range(9)]
-                    selected_cell = None
-                    game_won = False
-                    solution_revealed = False
-                    game_state = STATE_PLAYING
-                
-                elif menu_btn.handle_event(event):
-                    game_state = STATE_MENU
+            # --- Profiler Hotkeys (any screen) ---
+            if event.type == KEYDOWN and event.key == K_F3:
+                profiler.toggle()
+            elif event.type == KEYDOWN and event.key == K_F4 and profiler.enabled:
+                frames = profiler.export_csv(PROFILER_CSV_PATH)
+                print(f"Wrote {frames} frames to {PROFILER_CSV_PATH}")
+            
+            for game_event in translate_event(event):
+                core.handle(game_event)
         
-        # --- Update Game State ---
-        # Only check for win if solution wasn't revealed (no cheating!)
-        if game_state == STATE_PLAYING and not game_won and not solution_revealed:
-            if puzzle and is_board_complete(puzzle.board, player_board):
-                if check_solution(puzzle.board, player_board, solution.board):
-                    game_won = True
-                    game_state = STATE_GAME_OVER
+        # --- Fit To A Resized Window ---
+        if new_size is not None:
+            # pygame 2 resizes the display surface by itself, older versions
+            # need set_mode()
+            DISPLAYSURF = pygame.display.get_surface()
+            if DISPLAYSURF.get_size() != new_size:
+                DISPLAYSURF = pygame.display.set_mode(new_size, RESIZABLE)
+            layout = Layout(DISPLAYSURF.get_size())
+            title_font, button_font, overlay_font = load_fonts(layout)
+            place_widgets()
+            overlay_rect = pygame.Rect(0, 0, DISPLAYSURF.get_width(), layout.font_size(15))
+            # Text rendered in the old sizes will not be asked for again
+            text_cache.clear()
+            board_renderers.clear()
+            if background is not None:
+                background.build(DISPLAYSURF.get_size())
+                ui_layer = build_ui_layer()
+            # Everything is drawn again at the new size
+            last_drawn_state = None
         
-        # --- Draw Game State ---- 
-        DISPLAYSURF.fill(BLACK)
+        # Keep the menu widgets in step with the core's settings
+        if core.state == STATE_MENU:
+            for btn, difficulty in button_difficulty.items():
+                btn.selected = core.difficulty == difficulty
+            hints_btn.text = "Hints: ON" if core.show_hints else "Hints: OFF"
+            size_btn.text = f"Board: {core.box * core.box}x{core.box * core.box}"
+            id_box.error = core.id_error
+            # Start moves aside for Resume while there is a game to go back to
+            start_btn.rect = layout.rect(SURFACE_WIDTH // 2 - (170 if core.can_resume else 80), 320, 160, 50)
+        
+        profiler.stop("event", phase_start)
         
-        if game_state == STATE_MENU:
-            draw_menu(DISPLAYSURF, title_font, button_font, difficulty_buttons, hints_btn, start_btn)
+        # --- Update Game State ---
+        phase_start = profiler.start()
+        # Starts the game once the pool (or the ID cache) has the puzzle
+        core.update()
+        game_state = core.state
+        board_state = core.board_state
+        loading_error = puzzle_pool.error if game_state == STATE_LOADING else None
+        # Saves every few seconds while playing, and straight away on the
+        # other screens, e.g. right after ESC to the menu
+        autosaver.update(core, force=game_state != STATE_PLAYING)
+        
+        profiler.stop("update", phase_start)
         
-        elif game_state == STATE_PLAYING:
-            draw_highlight(DISPLAYSURF, selected_cell) 
-            draw_grid(DISPLAYSURF)
-            draw_puzzle(DISPLAYSURF, puzzle.board, player_board, solution.board, puzzle_font, show_hints)
-            DISPLAYSURF.blit(game_title_surface, game_title_rect)
+        # --- Draw Game State ---- 
+        phase_start = profiler.start()
+        # With the animated background on, the screens are drawn into the UI
+        # layer and put on top of the background scene below
+        target = ui_layer if background_on else DISPLAYSURF
+        ui_changed = False
+        if game_state == STATE_PLAYING:
+            # Retained mode: the background is built once per puzzle and only
+            # the cells and widgets that changed are repainted and updated.
+            board_renderer = renderer_for(core.puzzle_board.box)
+            if board_renderer.puzzle_board is not core.puzzle_board:
+                # A resize builds new renderers, so the text here is also
+                # placed again for the new layout
+                game_title_surface = text_cache.render(title_font, 'Lofi-Sudoku', True, WHITE)
+                esc_text = text_cache.render(button_font, "ESC: Menu", True, GRAY)
+                static_blits = [
+                    (game_title_surface, game_title_surface.get_rect(midtop=layout.point(SURFACE_WIDTH // 2, 15))),
+                    (esc_text, layout.point(SURFACE_WIDTH - 100, SURFACE_HEIGHT - 30)),
+                ]
+                if core.puzzle_id is not None:
+                    id_text = text_cache.render(button_font, f"#{core.puzzle_id}", True, GRAY)
+                    static_blits.append((id_text, id_text.get_rect(
+                        topright=layout.point(SURFACE_WIDTH - 10, SURFACE_HEIGHT - 55))))
+                board_renderer.reset(target, core.puzzle_board, static_blits)
+                revealed_text = text_cache.render(button_font, "Solution Revealed", True, GRAY)
+                revealed_rect = revealed_text.get_rect(midtop=layout.point(SURFACE_WIDTH // 2, SURFACE_HEIGHT - 80))
+                notes_rect = layout.rect(10, SURFACE_HEIGHT - 55, 150, 20)
+                hints_rect = layout.rect(10, SURFACE_HEIGHT - 30, 150, 20)
+            elif last_drawn_state != STATE_PLAYING:
+                board_renderer.invalidate()
+            
+            dirty = board_renderer.draw_board(target, board_state, core.selected_cell, core.show_hints)
+            
+            notes_key = "Tab" if DIGIT_KEYS[K_n] <= core.puzzle_board.size else "N"
+            notes_text = text_cache.render(button_font, f"Notes: {'ON' if core.notes_mode else 'OFF'} ({notes_key})", True, GRAY)
+            dirty += board_renderer.draw_widget(target, "notes", notes_rect, core.notes_mode,
+                                                lambda surface: surface.blit(notes_text, notes_rect))
+            # Hints can be switched in the menu and the game resumed
+            dirty += draw_hints_status(target, board_renderer, button_font, hints_rect, core.show_hints)
             
             # Draw appropriate button based on state
-            if solution_revealed:
-                # Show "New Game" button and message after solution is revealed
-                new_game_btn.draw(DISPLAYSURF)
-                revealed_text = button_font.render("Solution Revealed", True, GRAY)
-                revealed_rect = revealed_text.get_rect(midtop=(SURFACE_WIDTH // 2, SURFACE_HEIGHT - 80))
-                DISPLAYSURF.blit(revealed_text, revealed_rect)
+            bottom_btn = new_game_btn if core.solution_revealed else show_solution_btn
+            dirty += board_renderer.draw_widget(target, "bottom_button", bottom_btn.rect,
+                                                (bottom_btn.text, bottom_btn.hovered), bottom_btn.draw)
+            if core.solution_revealed:
+                # Show message after solution is revealed
+                dirty += board_renderer.draw_widget(target, "revealed", revealed_rect, True,
+                                                    lambda surface: surface.blit(revealed_text, revealed_rect))
             else:
-                # Show "Show Solution" button during normal play
-                show_solution_btn.draw(DISPLAYSURF)
+                dirty += board_renderer.clear_widget(target, "revealed", revealed_rect)
             
-            # Show hint status in corner
-            hint_status = button_font.render(f"Hints: {'ON' if show_hints else 'OFF'}", True, GRAY)
-            DISPLAYSURF.blit(hint_status, (10, SURFACE_HEIGHT - 30))
+            if profiler.enabled:
+                text = profiler.overlay_text()
+                dirty += board_renderer.draw_widget(target, "profiler", overlay_rect, text,
+                                                    lambda surface: draw_profiler_overlay(surface, overlay_font,
+                                                                                          overlay_rect, text))
+            else:
+                dirty += board_renderer.clear_widget(target, "profiler", overlay_rect)
             
-            # Show ESC instruction
-            esc_text = button_font.render("ESC: Menu", True, GRAY)
-            DISPLAYSURF.blit(esc_text, (SURFACE_WIDTH - 100, SURFACE_HEIGHT - 30))
+            if dirty and not background_on:
+                pygame.display.update(dirty)
+            ui_changed = bool(dirty)
+            if startup.mark("first_puzzle") and show_timings:
+                print(startup.text("first_puzzle"), flush=True)
         
-        elif game_state == STATE_GAME_OVER:
-            draw_game_over(DISPLAYSURF, title_font, button_font, play_again_btn, menu_btn)
-
-        pygame.display.update()
-        fpsClock.tick(FPS)
+        # The other screens are static, so redraw them only after input or
+        # when they are first shown (or every frame while profiling)
+        elif (events or game_state != last_drawn_state or loading_error is not drawn_loading_error
+              or profiler.enabled):
+            target.fill(BLACK)
+            
+            if game_state == STATE_MENU:
+                draw_menu(target, title_font, button_font, difficulty_buttons, hints_btn, start_btn,
+                          id_box, play_id_btn, size_btn, resume_btn if core.can_resume else None, layout)
+            
+            elif game_state == STATE_LOADING:
+                draw_loading(target, title_font, button_font, layout, loading_error)
+                drawn_loading_error = loading_error
+            
+            elif game_state == STATE_GAME_OVER:
+                draw_game_over(target, title_font, button_font, play_again_btn, menu_btn, layout)
+            
+            if profiler.enabled:
+                draw_profiler_overlay(target, overlay_font, overlay_rect, profiler.overlay_text())
+            
+            if not background_on:
+                pygame.display.update()
+            ui_changed = True
+        
+        # --- Composite Background and UI ---
+        if background_on:
+            if background.update() or ui_changed:
+                DISPLAYSURF.blit(background.scene, (0, 0))
+                DISPLAYSURF.blit(ui_layer, (0, 0))
+                pygame.display.update()
+        
+        last_drawn_state = game_state
+        profiler.stop("draw", phase_start)
+        profiler.end_frame()
+        if background_on:
+            background.end_frame(time.perf_counter() - frame_start)
+        
+        # --- Warm Up After The First Frame ---
+        # With the window showing, start on what the first Start click
+        # needs: puzzles from the pool and the renderer for the board size
+        if startup.mark("first_frame"):
+            if show_timings:
+                print(startup.text("first_frame"), flush=True)
+            puzzle_pool.generator = load_puzzle_source(server)
+            puzzle_pool.start()
+            renderer_for(core.box)
 
 
 if __name__ == "__main__":
-    main()
+    parser = argparse.ArgumentParser(description="Play Lofi Sudoku.")
+    parser.add_argument("--puzzle", metavar="ID", help="start on the puzzle with this ID (e.g. M-4F2K9QZ)")
+    parser.add_argument("--size", type=int, choices=[box * box for box in BOX_SIZES], default=NUM_CELLS,
+                        help="board size selected in the menu (default 9)")
+    parser.add_argument("--server", nargs="?", const=f"{SERVICE_HOST}:{SERVICE_PORT}", metavar="HOST:PORT",
+                        help="fetch puzzles from a puzzle service (python puzzle_service.py), "
+                             "falling back to local generation")
+    parser.add_argument("--background", action="store_true",
+                        help="start with the animated background on (F2 toggles it)")
+    parser.add_argument("--timings", action="store_true",
+                        help="print the time to the first frame and to the first puzzle, and loop wakeups on quitting")
+    args = parser.parse_args()
+
+    puzzle_id = None
+    if args.puzzle:
+        try:
+            puzzle_id = normalize_puzzle_id(args.puzzle)
+        except ValueError as error:
+            parser.error(str(error))
+    server = None
+    if args.server:
+        host, _, port = args.server.rpartition(":")
+        if not port.isdigit():
+            parser.error(f"--server needs HOST:PORT, got {args.server!r}")
+        server = (host or SERVICE_HOST, int(port))
+    main(puzzle_id, server, math.isqrt(args.size), args.timings, args.background)
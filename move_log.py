@@ -0,0 +1,79 @@
+#! /usr/bin/env python3
+
+# ------------------------------------------------------------
+# move_log.py
+# Undo/redo history of the player's moves for the Lofi Sudoku Game
+# By: Beck Bishp
+# Last Updated: 10/18/2026
+# ------------------------------------------------------------
+
+import sys
+from array import array
+
+
+class MoveLog:
+    """The player's moves on one puzzle, kept flat in a single array.
+
+    Each move is three unsigned 16-bit entries: cell index, old value and
+    new value. position is the number of moves currently applied; undo()
+    and redo() only move it, so both are O(1). Recording a move after an
+    undo drops the moves that could have been redone, as editors do.
+    """
+
+    __slots__ = ("entries", "position")
+
+    def __init__(self, entries=None, position=None):
+        self.entries = array('H') if entries is None else entries
+        self.position = len(self) if position is None else position
+
+    def __len__(self):
+        """Moves in the log, including those that were undone."""
+        return len(self.entries) // 3
+
+    def record(self, idx, old, new):
+        """Append a move at the current position."""
+        if self.position < len(self):
+            del self.entries[self.position * 3:]
+        self.entries.extend((idx, old, new))
+        self.position += 1
+
+    def can_undo(self):
+        return self.position > 0
+
+    def can_redo(self):
+        return self.position < len(self)
+
+    def undo(self):
+        """Step back one move. Returns its (idx, old, new), or None if there is none."""
+        if not self.position:
+            return None
+        self.position -= 1
+        i = self.position * 3
+        return self.entries[i], self.entries[i + 1], self.entries[i + 2]
+
+    def redo(self):
+        """Step forward over an undone move. Returns its (idx, old, new), or None."""
+        if self.position >= len(self):
+            return None
+        i = self.position * 3
+        self.position += 1
+        return self.entries[i], self.entries[i + 1], self.entries[i + 2]
+
+    def to_bytes(self):
+        """The entries as little-endian uint16s (the position is not included)."""
+        if sys.byteorder == "little":
+            return self.entries.tobytes()
+        swapped = array('H', self.entries)
+        swapped.byteswap()
+        return swapped.tobytes()
+
+    @classmethod
+    def from_bytes(cls, data, position):
+        """Rebuild a log written by to_bytes()."""
+        entries = array('H')
+        entries.frombytes(data)
+        if sys.byteorder != "little":
+            entries.byteswap()
+        if len(entries) % 3 or not 0 <= position <= len(entries) // 3:
+            raise ValueError("not a valid move log")
+        return cls(entries, position)
@@ -0,0 +1,185 @@
+#! /usr/bin/env python3
+
+# ------------------------------------------------------------
+# profiler.py
+# Per-phase frame profiler for the Lofi Sudoku Game
+# By: Beck Bishp
+# Last Updated: 10/18/2026
+# ------------------------------------------------------------
+
+import csv
+import functools
+import time
+from array import array
+
+from constants import PROFILER_FRAMES
+
+# Top-level phases of one pass through the main loop
+FRAME_PHASES = ("event", "update", "draw")
+
+
+class RingBuffer:
+    """Fixed-size buffer of floats that overwrites its oldest value."""
+
+    def __init__(self, size):
+        self.values = array('d', bytes(8 * size))
+        self.size = size
+        self.index = 0
+        self.count = 0
+
+    def push(self, value):
+        self.values[self.index] = value
+        self.index = (self.index + 1) % self.size
+        self.count = min(self.count + 1, self.size)
+
+    def recent(self):
+        """Values from oldest to newest."""
+        if self.count < self.size:
+            return list(self.values[:self.count])
+        return list(self.values[self.index:]) + list(self.values[:self.index])
+
+    def mean(self):
+        return sum(self.values[:self.count]) / self.count if self.count else 0.0
+
+
+# ------------------------------------------------------------
+# FrameProfiler Class
+# ------------------------------------------------------------
+
+class FrameProfiler:
+    """Collects per-frame timings for named phases into ring buffers.
+
+    All hooks return straight away while the profiler is disabled, so the
+    calls can stay in the main loop permanently.
+    """
+
+    def __init__(self, size=PROFILER_FRAMES):
+        self.size = size
+        self.enabled = False
+        self.frames = RingBuffer(size)     # Seconds between frame starts
+        self.phases = {}                   # Phase name -> RingBuffer of seconds
+        self._current = {}
+        self._frame_start = None
+        self._interval = None
+
+    def toggle(self):
+        """Turn profiling on or off. Old samples are dropped when turning on."""
+        self.enabled = not self.enabled
+        if self.enabled:
+            self.frames = RingBuffer(self.size)
+            self.phases = {}
+            self._current = {}
+            self._frame_start = None
+
+    def begin_frame(self):
+        if not self.enabled:
+            return
+        now = time.perf_counter()
+        self._interval = now - self._frame_start if self._frame_start is not None else None
+        self._frame_start = now
+
+    def end_frame(self):
+        """Store this frame's phase totals (0 for phases that did not run)."""
+        if not self.enabled or self._frame_start is None:
+            return
+        if self._interval is None:
+            self._interval = time.perf_counter() - self._frame_start
+        for name in self._current:
+            if name not in self.phases:
+                # Pad new phases so every buffer lines up frame for frame
+                buffer = RingBuffer(self.size)
+                for _ in range(self.frames.count):
+                    buffer.push(0.0)
+                self.phases[name] = buffer
+        self.frames.push(self._interval)
+        for name, buffer in self.phases.items():
+            buffer.push(self._current.get(name, 0.0))
+        self._current = {}
+
+    def start(self):
+        """Start timing a phase. Pass the result to stop()."""
+        return time.perf_counter() if self.enabled else None
+
+    def stop(self, name, started):
+        if started is None or not self.enabled:
+            return
+        self._current[name] = self._current.get(name, 0.0) + time.perf_counter() - started
+
+    def timed(self, name):
+        """Decorator that records every call of a function as a phase."""
+        def decorate(func):
+            @functools.wraps(func)
+            def wrapper(*args, **kwargs):
+                if not self.enabled:
+                    return func(*args, **kwargs)
+                started = time.perf_counter()
+                try:
+                    return func(*args, **kwargs)
+                finally:
+                    self.stop(name, started)
+            return wrapper
+        return decorate
+
+    def slowest(self, names=None):
+        """Return (name, mean ms) of the slowest phase, optionally among names only."""
+        slowest, slowest_time = None, 0.0
+        for name, buffer in self.phases.items():
+            if names is not None and name not in names:
+                continue
+            mean = buffer.mean()
+            if mean > slowest_time:
+                slowest, slowest_time = name, mean
+        return slowest, slowest_time * 1000
+
+    def overlay_text(self):
+        """One line for the in-game overlay: frame time, FPS and slowest phases."""
+        frame = self.frames.mean()
+        text = f"frame {frame * 1000:.1f} ms  {1 / frame if frame else 0:.0f} FPS"
+        phase, phase_ms = self.slowest(FRAME_PHASES)
+        if phase:
+            text += f"  slowest: {phase} {phase_ms:.2f} ms"
+        function, function_ms = self.slowest([name for name in self.phases if name not in FRAME_PHASES])
+        if function:
+            text += f" ({function} {function_ms:.2f} ms)"
+        return text
+
+    def export_csv(self, path):
+        """Write the buffered frames as CSV, one row per frame, times in ms."""
+        names = sorted(self.phases)
+        columns = [self.frames.recent()] + [self.phases[name].recent() for name in names]
+        with open(path, "w", newline="") as f:
+            writer = csv.writer(f)
+            writer.writerow(["frame", "frame_ms"] + [f"{name}_ms" for name in names])
+            for i, values in enumerate(zip(*columns)):
+                writer.writerow([i] + [f"{value * 1000:.4f}" for value in values])
+        return self.frames.count
+
+
+# ------------------------------------------------------------
+# StartupTimer Class
+# ------------------------------------------------------------
+
+class StartupTimer:
+    """Time from launch to startup milestones such as the first frame.
+
+    start is a perf_counter() value taken as early as possible (main.py takes
+    it before its heavier imports). Each milestone is recorded once.
+    """
+
+    def __init__(self, start=None):
+        self.start = time.perf_counter() if start is None else start
+        self.marks = {}     # Milestone -> seconds since start
+
+    def mark(self, name):
+        """Record a milestone the first time it is reached. Returns True that time."""
+        if name in self.marks:
+            return False
+        self.marks[name] = time.perf_counter() - self.start
+        return True
+
+    def text(self, name):
+        return f"startup: {name.replace('_', ' ')} {self.marks[name] * 1000:.0f} ms"
+
+
+# Shared profiler used by the main loop and drawing functions
+profiler = FrameProfiler()
@@ -0,0 +1,226 @@
+#! /usr/bin/env python3
+
+# ------------------------------------------------------------
+# puzzle_bank.py
+# Memory-mapped on-disk puzzle bank for the Lofi Sudoku Game
+# By: Beck Bishp
+# Last Updated: 10/18/2026
+# ------------------------------------------------------------
+#
+# File layout (all integers little-endian):
+#
+#   magic    4 bytes   b"LSPB"
+#   version  uint16    BANK_VERSION
+#   tiers    uint16    number of difficulty tiers
+#   record   uint32    bytes per record (81)
+#   index    tiers x (uint64 offset, uint64 count)
+#   records  count x 81 bytes per tier, stored back to back
+#
+# Each record byte is one cell: the puzzle digit in the high nibble
+# (0 for a blank) and the solution digit in the low nibble.
+
+import mmap
+import os
+import random
+import shutil
+import struct
+import tempfile
+
+from constants import DIFFICULTY_TIERS
+from board import Board
+from solver import flatten
+
+BANK_MAGIC = b"LSPB"
+BANK_VERSION = 1
+RECORD_SIZE = 81
+
+_HEADER = struct.Struct("<4sHHI")
+_INDEX_ENTRY = struct.Struct("<QQ")
+
+# bytes.translate tables that split a record into its two nibbles
+_HIGH_NIBBLE = bytes(b >> 4 for b in range(256))
+_LOW_NIBBLE = bytes(b & 0x0F for b in range(256))
+
+
+def tier_for_difficulty(difficulty):
+    """Map EASY/MEDIUM/HARD_DIFFICULTY to its tier number in the bank."""
+    return DIFFICULTY_TIERS.index(difficulty)
+
+
+def encode_record(puzzle, solution):
+    """Pack a puzzle and its solution into one 81 byte record."""
+    return bytes((p << 4) | s for p, s in zip(flatten(puzzle), flatten(solution)))
+
+
+def decode_record(record):
+    """Unpack an 81 byte record into (puzzle_board, solution_board) Boards."""
+    record = bytes(record)
+    return Board(record.translate(_HIGH_NIBBLE)), Board(record.translate(_LOW_NIBBLE))
+
+
+# ------------------------------------------------------------
+# PuzzleBank Class
+# ------------------------------------------------------------
+
+class PuzzleBank:
+    """Read-only view of a puzzle bank file.
+
+    The file is memory-mapped and only the header is parsed, so opening a
+    bank of any size is instant and a lookup touches a single record.
+    Opening raises ValueError for a file that is not a bank or is shorter
+    than its index says.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self._map = None
+        self._file = open(path, "rb")
+        try:
+            size = os.fstat(self._file.fileno()).st_size
+            if size < _HEADER.size:
+                raise ValueError(f"{path} is too short to be a puzzle bank")
+            self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+            self.index = self._read_index(size)
+        except BaseException:
+            self.close()
+            raise
+
+    def _read_index(self, size):
+        magic, version, tiers, record_size = _HEADER.unpack_from(self._map, 0)
+        if magic != BANK_MAGIC or version != BANK_VERSION or record_size != RECORD_SIZE:
+            raise ValueError(f"{self.path} is not a version {BANK_VERSION} puzzle bank")
+        records_start = _HEADER.size + tiers * _INDEX_ENTRY.size
+        if size < records_start:
+            raise ValueError(f"{self.path} is too short for its index")
+
+        index = [
+            _INDEX_ENTRY.unpack_from(self._map, _HEADER.size + i * _INDEX_ENTRY.size)
+            for i in range(tiers)
+        ]
+        for tier, (offset, count) in enumerate(index):
+            if offset < records_start or offset + count * RECORD_SIZE > size:
+                raise ValueError(f"{self.path} is too short for the {count} puzzles of tier {tier}")
+        return index
+
+    @classmethod
+    def open_if_exists(cls, path):
+        """Open the bank at path, or return None if there is no file there."""
+        return cls(path) if os.path.exists(path) else None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self):
+        if self._map is not None:
+            self._map.close()
+            self._map = None
+        self._file.close()
+
+    @property
+    def tiers(self):
+        return len(self.index)
+
+    def count(self, tier):
+        """Number of puzzles stored for a tier."""
+        return self.index[tier][1]
+
+    def record(self, tier, i):
+        """Raw 81 byte record i of a tier."""
+        offset, count = self.index[tier]
+        if not 0 <= i < count:
+            raise IndexError(f"tier {tier} has {count} puzzles, no index {i}")
+        start = offset + i * RECORD_SIZE
+        return self._map[start:start + RECORD_SIZE]
+
+    def records(self, tier):
+        """All of a tier's raw records, 81 bytes each, back to back."""
+        offset, count = self.index[tier]
+        return self._map[offset:offset + count * RECORD_SIZE]
+
+    def get(self, tier, i):
+        """Return puzzle i of a tier as (puzzle_board, solution_board)."""
+        return decode_record(self.record(tier, i))
+
+    def random(self, tier, rng=random):
+        """Return a random puzzle from a tier as (puzzle_board, solution_board)."""
+        return self.get(tier, rng.randrange(self.count(tier)))
+
+    def random_boards(self, difficulty):
+        """Puzzle pool generator: a random puzzle for a difficulty constant."""
+        return self.random(tier_for_difficulty(difficulty))
+
+
+# ------------------------------------------------------------
+# BankWriter Class
+# ------------------------------------------------------------
+
+class BankWriter:
+    """Builds a puzzle bank file.
+
+    Records are streamed into one temporary spool file per tier as they are
+    added, and close() writes the header followed by each tier's records.
+    The finished bank replaces the target with an atomic rename. With
+    append=True the records of an existing bank at path are kept.
+    """
+
+    def __init__(self, path, tiers=len(DIFFICULTY_TIERS), append=False):
+        self.path = path
+        self.spools = [tempfile.TemporaryFile() for _ in range(tiers)]
+        self.counts = [0] * tiers
+
+        if append and os.path.exists(path):
+            with PuzzleBank(path) as bank:
+                for tier in range(min(tiers, bank.tiers)):
+                    self.spools[tier].write(bank.records(tier))
+                    self.counts[tier] = bank.count(tier)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, *exc_info):
+        if exc_type is None:
+            self.close()
+        else:
+            self.discard()
+
+    def add(self, tier, puzzle, solution):
+        """Append one puzzle and its solution to a tier."""
+        self.spools[tier].write(encode_record(puzzle, solution))
+        self.counts[tier] += 1
+
+    def add_records(self, tier, records):
+        """Append already encoded records (81 bytes each, back to back) to a tier."""
+        if len(records) % RECORD_SIZE:
+            raise ValueError("records must be a whole number of 81 byte records")
+        self.spools[tier].write(records)
+        self.counts[tier] += len(records) // RECORD_SIZE
+
+    def close(self):
+        """Write the bank file and release the spool files."""
+        index_size = _HEADER.size + len(self.spools) * _INDEX_ENTRY.size
+        directory = os.path.dirname(os.path.abspath(self.path))
+        fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as out:
+                out.write(_HEADER.pack(BANK_MAGIC, BANK_VERSION, len(self.spools), RECORD_SIZE))
+                offset = index_size
+                for count in self.counts:
+                    out.write(_INDEX_ENTRY.pack(offset, count))
+                    offset += count * RECORD_SIZE
+                for spool in self.spools:
+                    spool.seek(0)
+                    shutil.copyfileobj(spool, out)
+            os.replace(tmp_path, self.path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+        finally:
+            self.discard()
+
+    def discard(self):
+        """Drop everything added without touching the bank file."""
+        for spool in self.spools:
+            spool.close()
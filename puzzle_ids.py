@@ -0,0 +1,129 @@
+#! /usr/bin/env python3
+
+# ------------------------------------------------------------
+# puzzle_ids.py
+# Reproducible puzzle IDs and a cache of generated puzzles
+# By: Beck Bishp
+# Last Updated: 10/18/2026
+# ------------------------------------------------------------
+#
+# A puzzle ID is a difficulty letter and a base-36 seed, e.g. "M-4F2K9QZ".
+# The bitmask generator seeded with random.Random(seed) always produces
+# the same puzzle, so an ID is all that is needed to share or replay one.
+# Boards other than 9x9 put their size after the letter, e.g. "H16-4F2K9QZ".
+
+import random
+import secrets
+import threading
+from collections import OrderedDict
+
+from constants import EASY_DIFFICULTY, MEDIUM_DIFFICULTY, HARD_DIFFICULTY
+from constants import PUZZLE_CACHE_SIZE, BOX_SIZE, BOX_SIZES
+from generate_puzzle import generate_boards
+
+SEED_BITS = 40
+ID_LETTERS = {EASY_DIFFICULTY: "E", MEDIUM_DIFFICULTY: "M", HARD_DIFFICULTY: "H"}
+LETTER_DIFFICULTY = {letter: difficulty for difficulty, letter in ID_LETTERS.items()}
+SIZE_BOXES = {str(box * box): box for box in BOX_SIZES if box != BOX_SIZE}
+_BASE36 = "0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZ"
+
+
+def new_seed():
+    # Drawn from the OS rather than the random module, which py-sudoku reseeds
+    return secrets.randbits(SEED_BITS)
+
+
+def make_puzzle_id(difficulty, seed, box=BOX_SIZE):
+    """Encode a difficulty, seed and board size as a short ID.
+
+    Raises ValueError for a seed that does not fit in SEED_BITS bits.
+    """
+    if not 0 <= seed < 1 << SEED_BITS:
+        raise ValueError(f"seed must be from 0 up to 2**{SEED_BITS} - 1, got {seed}")
+    digits = ""
+    while True:
+        seed, digit = divmod(seed, 36)
+        digits = _BASE36[digit] + digits
+        if not seed:
+            break
+    size = "" if box == BOX_SIZE else box * box
+    return f"{ID_LETTERS[difficulty]}{size}-{digits}"
+
+
+def parse_puzzle_id(puzzle_id):
+    """Return (difficulty, seed, box) for an ID. Accepts a leading '#', any
+    case, and no dash on 9x9 IDs (other sizes need it after the size).
+
+    Raises ValueError for anything that is not a puzzle ID.
+    """
+    text = puzzle_id.strip().lstrip("#").upper()
+    difficulty = LETTER_DIFFICULTY.get(text[:1])
+    size, dash, seed_text = text[1:].partition("-")
+    box = SIZE_BOXES.get(size) if dash and size else BOX_SIZE
+    if not dash:
+        seed_text = size
+    if (difficulty is None or box is None or not seed_text
+            or any(char not in _BASE36 for char in seed_text)):
+        raise ValueError(f"not a puzzle ID: {puzzle_id!r}")
+    seed = int(seed_text, 36)
+    if seed >> SEED_BITS:
+        raise ValueError(f"not a puzzle ID: {puzzle_id!r}")
+    return difficulty, seed, box
+
+
+def normalize_puzzle_id(puzzle_id):
+    """The canonical form of an ID as typed by a player. Raises ValueError."""
+    return make_puzzle_id(*parse_puzzle_id(puzzle_id))
+
+
+# ------------------------------------------------------------
+# PuzzleCache Class
+# ------------------------------------------------------------
+
+class PuzzleCache:
+    """Least-recently-used cache of generated puzzles, keyed by puzzle ID.
+
+    get() returns copies, so a cached pair is never changed by the game.
+    Safe to call from the puzzle pool's worker threads.
+    """
+
+    def __init__(self, maxsize=PUZZLE_CACHE_SIZE):
+        self.maxsize = maxsize
+        self.boards = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+    def get(self, puzzle_id):
+        """Return (puzzle_board, solution_board) for an ID, generating it on a miss."""
+        difficulty, seed, box = parse_puzzle_id(puzzle_id)
+        key = make_puzzle_id(difficulty, seed, box)    # Normalized form
+        with self._lock:
+            boards = self.boards.get(key)
+            if boards is not None:
+                self.boards.move_to_end(key)
+                self.hits += 1
+        if boards is None:
+            # Generate outside the lock so other IDs are not held up
+            boards = generate_boards(difficulty, random.Random(seed), box)
+            with self._lock:
+                self.misses += 1
+                self.boards[key] = boards
+                if len(self.boards) > self.maxsize:
+                    self.boards.popitem(last=False)
+        puzzle, solution = boards
+        return puzzle.copy(), solution.copy()
+
+    def clear(self):
+        with self._lock:
+            self.boards.clear()
+
+
+# Shared cache used by the game
+puzzle_cache = PuzzleCache()
+
+
+def seeded_boards(difficulty, box=BOX_SIZE):
+    """Puzzle pool generator: a new seeded puzzle as (puzzle_board, solution_board, puzzle_id)."""
+    puzzle_id = make_puzzle_id(difficulty, new_seed(), box)
+    return puzzle_cache.get(puzzle_id) + (puzzle_id,)
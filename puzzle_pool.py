@@ -0,0 +1,151 @@
+#! /usr/bin/env python3
+
+# ------------------------------------------------------------
+# puzzle_pool.py
+# Background puzzle prefetching for the Lofi Sudoku Game
+# By: Beck Bishp
+# Last Updated: 10/18/2026
+# ------------------------------------------------------------
+
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+
+from constants import EASY_DIFFICULTY, MEDIUM_DIFFICULTY, HARD_DIFFICULTY
+from constants import PREFETCH_DEPTH, PREFETCH_WORKERS, PREFETCH_MAX_FAILURES, BOX_SIZE
+from puzzle_ids import seeded_boards, puzzle_cache
+
+
+# ------------------------------------------------------------
+# PuzzlePool Class
+# ------------------------------------------------------------
+
+class PuzzlePool:
+    """Keeps a queue of ready-made puzzles for each difficulty and board size.
+
+    Workers refill each queue up to depth in the background, so taking a
+    puzzle is a single pop. get() never blocks: it returns None when the
+    queue for that difficulty is still empty. Queues for the default board
+    size are filled from the start; other sizes once they are first asked for.
+
+    generator(difficulty, box) returns (puzzle_board, solution_board, puzzle_id),
+    with puzzle_id None when the puzzle cannot be rebuilt from an ID.
+
+    get_id() makes puzzles asked for by ID on the same workers, so even a
+    big board never holds up the frame loop.
+
+    A failed puzzle is simply tried again, but after PREFETCH_MAX_FAILURES
+    failures in a row the pool switches to fallback (seeded generation by
+    default). If that keeps failing too, error holds the last exception
+    so the game can show it.
+    """
+
+    def __init__(self, difficulties=(EASY_DIFFICULTY, MEDIUM_DIFFICULTY, HARD_DIFFICULTY),
+                 depth=PREFETCH_DEPTH, workers=PREFETCH_WORKERS,
+                 generator=seeded_boards, fallback=seeded_boards,
+                 id_source=puzzle_cache.get):
+        self.difficulties = difficulties
+        self.depth = depth
+        self.workers = workers
+        self.generator = generator
+        self.fallback = fallback
+        self.id_source = id_source    # id_source(puzzle_id) -> (puzzle_board, solution_board)
+        self.queues = {}      # (difficulty, box) -> deque of ready puzzles
+        self.pending = {}     # (difficulty, box) -> puzzles being generated
+        self.last_error = None
+        self.failures = 0     # Failed puzzles since the last one that worked
+        self._id_request = None   # (puzzle_id, future) of the last get_id()
+        self._lock = threading.Lock()
+        self._executor = None
+
+    def start(self):
+        """Start the workers and begin filling every queue."""
+        self._executor = ThreadPoolExecutor(max_workers=self.workers)
+        for difficulty in self.difficulties:
+            self._refill((difficulty, BOX_SIZE))
+
+    def stop(self):
+        """Shut down the workers without waiting for puzzles in progress."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+    def get(self, difficulty, box=BOX_SIZE):
+        """Pop a (puzzle_board, solution_board, puzzle_id) tuple, or None if none are ready."""
+        key = (difficulty, box)
+        try:
+            boards = self.queues[key].popleft()
+        except (KeyError, IndexError):
+            boards = None
+        self._refill(key)
+        return boards
+
+    def get_id(self, puzzle_id):
+        """Return (puzzle_board, solution_board) for a normalized puzzle ID once
+        a worker has made it, or None until then. Never blocks.
+
+        Asking for another ID replaces the request; a puzzle still being
+        made for the old one only ends up in the puzzle cache.
+        """
+        with self._lock:
+            if self._executor is None:
+                return None
+            if self._id_request is None or self._id_request[0] != puzzle_id:
+                self._id_request = (puzzle_id, self._executor.submit(self.id_source, puzzle_id))
+            future = self._id_request[1]
+            if not future.done():
+                return None
+            self._id_request = None
+        error = None if future.cancelled() else future.exception()
+        if future.cancelled() or error is not None:
+            # Asked for again on the next call
+            if error is not None:
+                with self._lock:
+                    self.last_error = error
+                    self.failures += 1
+            return None
+        self.failures = 0
+        return future.result()
+
+    @property
+    def error(self):
+        """The last exception if generation keeps failing, otherwise None."""
+        return self.last_error if self.failures >= PREFETCH_MAX_FAILURES else None
+
+    def ready(self, difficulty, box=BOX_SIZE):
+        """Number of puzzles waiting in the queue for a difficulty and board size."""
+        return len(self.queues.get((difficulty, box), ()))
+
+    def _refill(self, key):
+        with self._lock:
+            if self._executor is None:
+                return
+            queue = self.queues.setdefault(key, deque())
+            missing = self.depth - len(queue) - self.pending.get(key, 0)
+            futures = [self._executor.submit(self.generator, *key) for _ in range(missing)]
+            self.pending[key] = self.pending.get(key, 0) + len(futures)
+        # Callbacks are attached outside the lock because a future that has
+        # already finished runs its callback immediately in this thread.
+        for future in futures:
+            future.add_done_callback(lambda f, k=key: self._on_done(k, f))
+
+    def _on_done(self, key, future):
+        with self._lock:
+            self.pending[key] -= 1
+        if future.cancelled():
+            return
+        error = future.exception()
+        if error is not None:
+            # Leave the slot empty; the next get() will try again, with the
+            # fallback once the generator has failed too often
+            with self._lock:
+                self.last_error = error
+                self.failures += 1
+                if (self.failures >= PREFETCH_MAX_FAILURES and self.fallback is not None
+                        and self.generator is not self.fallback):
+                    self.generator = self.fallback
+                    self.failures = 0
+            return
+        self.failures = 0
+        self.queues[key].append(future.result())
+        self._refill(key)
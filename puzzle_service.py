@@ -0,0 +1,342 @@
+#! /usr/bin/env python3
+
+# ------------------------------------------------------------
+# puzzle_service.py
+# Local asyncio puzzle service (and its client) for the Lofi Sudoku Game
+# By: Beck Bishp
+# Last Updated: 10/18/2026
+#
+# Usage:
+#   python puzzle_service.py [--port 8765] [--workers 4]
+#   python main.py --server              # play with puzzles from the service
+#
+# Protocol: one JSON object per line over TCP, in both directions.
+#   -> {"id": 1, "method": "get_puzzle", "params": {"difficulty": "hard", "seed": 42}}
+#   <- {"id": 1, "result": {"puzzle_id": "H-16", "puzzle": "0040...", "solution": "7341..."}}
+# Methods: get_puzzle(difficulty, seed?, box?), validate(board), solve(board), stats().
+# Seeds run from 0 up to 2**40 - 1 (puzzle_ids.SEED_BITS); others get an error.
+# Boards are strings with one character per cell, '0' (or '.') for blanks:
+# 81 digits for 9x9, or 16, 256 or 625 characters using letters past 9.
+# ------------------------------------------------------------
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import socket
+import time
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+
+import dlx
+from board import Board
+from constants import DIFFICULTY_NAMES, SERVICE_HOST, SERVICE_PORT, BOX_SIZE, BOX_SIZES
+from constants import SERVICE_BATCH_SIZE, SERVICE_BATCH_WINDOW_MS, SERVICE_TIMEOUT, SERVICE_RETRY_AFTER
+from generate_puzzle import generate_boards
+from profiler import RingBuffer
+from puzzle_ids import make_puzzle_id, new_seed
+from solver import Solver
+
+DIFFICULTY_LABELS = {difficulty: name for name, difficulty in DIFFICULTY_NAMES.items()}
+LATENCY_SAMPLES = 1000
+
+
+# ------------------------------------------------------------
+# Request Handlers (run in the worker processes)
+# ------------------------------------------------------------
+
+def get_puzzle(difficulty="medium", seed=None, box=BOX_SIZE):
+    difficulty = DIFFICULTY_NAMES[difficulty]
+    if box not in BOX_SIZES:
+        raise ValueError(f"box must be one of {BOX_SIZES}")
+    if seed is None:
+        seed = new_seed()
+    # Made first so a seed out of range is turned down before generating
+    puzzle_id = make_puzzle_id(difficulty, seed, box)
+    puzzle, solution = generate_boards(difficulty, random.Random(seed), box)
+    return {"puzzle_id": puzzle_id, "puzzle": puzzle.to_text(), "solution": solution.to_text()}
+
+
+def validate(board):
+    """Whether a board has no repeated digits, is complete, and how many
+    solutions it has (counted up to 2)."""
+    board = Board.from_text(board)
+    valid = Solver(board).valid
+    complete = board.is_filled()
+    if not valid:
+        solutions = 0
+    elif complete:
+        solutions = 1
+    else:
+        solutions = dlx.count_solutions(board, limit=2)
+    return {"valid": valid, "complete": complete, "solutions": solutions}
+
+
+def solve(board):
+    """The solution in the same format as the board, or None if there is none."""
+    solution = dlx.solve(Board.from_text(board))
+    return Board.from_rows(solution).to_text() if solution else None
+
+
+BATCHED_METHODS = {"get_puzzle": get_puzzle, "validate": validate, "solve": solve}
+
+
+def _run_batch(method, params_list):
+    """Worker task: handle a batch of requests for one method.
+
+    Returns one (ok, result or error message) pair per request, so a bad
+    request does not fail the rest of its batch.
+    """
+    handler = BATCHED_METHODS[method]
+    results = []
+    for params in params_list:
+        try:
+            results.append((True, handler(**params)))
+        except (KeyError, TypeError, ValueError) as error:
+            results.append((False, f"{type(error).__name__}: {error}"))
+    return results
+
+
+# ------------------------------------------------------------
+# PuzzleService Class
+# ------------------------------------------------------------
+
+class PuzzleService:
+    """Coalesces concurrent requests into batches for a process pool.
+
+    Each method has its own queue. A batcher task takes the first waiting
+    request, collects more for up to batch_window seconds (or batch_size
+    requests), and sends them to a worker as one task.
+    """
+
+    def __init__(self, workers=None, batch_size=SERVICE_BATCH_SIZE,
+                 batch_window=SERVICE_BATCH_WINDOW_MS / 1000):
+        self.workers = workers or os.cpu_count()
+        self.batch_size = batch_size
+        self.batch_window = batch_window
+        self.queues = {}
+        self.served = Counter()
+        self.errors = 0
+        self.batches = 0
+        self.in_flight = 0          # Batches handed to workers and not yet back
+        self.latencies = RingBuffer(LATENCY_SAMPLES)   # Seconds, request to result
+        self._executor = None
+        self._tasks = []
+
+    async def start(self, host=SERVICE_HOST, port=SERVICE_PORT):
+        """Start the workers, batchers and TCP server. Returns the asyncio server."""
+        self._executor = ProcessPoolExecutor(max_workers=self.workers)
+        for method in BATCHED_METHODS:
+            self.queues[method] = asyncio.Queue()
+            self._tasks.append(asyncio.create_task(self._batcher(method)))
+        return await asyncio.start_server(self._handle_client, host, port)
+
+    def close(self):
+        for task in self._tasks:
+            task.cancel()
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+
+    async def call(self, method, params):
+        """Queue one request and wait for its result."""
+        if method == "stats":
+            return self.stats()
+        if method not in BATCHED_METHODS:
+            raise ValueError(f"unknown method: {method!r}")
+        future = asyncio.get_running_loop().create_future()
+        await self.queues[method].put((params, future, time.perf_counter()))
+        return await future
+
+    def stats(self):
+        recent = sorted(self.latencies.recent())
+        latency = {}
+        if recent:
+            latency = {"p50": recent[len(recent) // 2] * 1000,
+                       "p95": recent[int(len(recent) * 0.95)] * 1000,
+                       "max": recent[-1] * 1000}
+        served = sum(self.served.values())
+        return {
+            "queue_depth": {method: queue.qsize() for method, queue in self.queues.items()},
+            "in_flight": self.in_flight,
+            "served": dict(self.served),
+            "errors": self.errors,
+            "batches": self.batches,
+            "mean_batch": served / self.batches if self.batches else 0.0,
+            "latency_ms": latency,
+        }
+
+    async def _batcher(self, method):
+        queue = self.queues[method]
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await queue.get()]
+            deadline = loop.time() + self.batch_window
+            while len(batch) < self.batch_size:
+                if not queue.empty():
+                    batch.append(queue.get_nowait())
+                    continue
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(queue.get(), timeout))
+                except TimeoutError:
+                    break
+            # Dispatch without waiting so the next batch can form meanwhile
+            asyncio.create_task(self._dispatch(method, batch))
+
+    async def _dispatch(self, method, batch):
+        loop = asyncio.get_running_loop()
+        self.batches += 1
+        self.in_flight += 1
+        try:
+            results = await loop.run_in_executor(self._executor, _run_batch, method,
+                                                 [params for params, _, _ in batch])
+        except Exception as error:
+            results = [(False, f"worker failed: {error}")] * len(batch)
+        finally:
+            self.in_flight -= 1
+
+        now = time.perf_counter()
+        for (_, future, queued), (ok, result) in zip(batch, results):
+            self.latencies.push(now - queued)
+            if ok:
+                self.served[method] += 1
+            else:
+                self.errors += 1
+            if not future.done():
+                if ok:
+                    future.set_result(result)
+                else:
+                    future.set_exception(ValueError(result))
+
+    async def _handle_client(self, reader, writer):
+        # Requests on one connection are handled concurrently, so a client
+        # can pipeline several and have them batched together.
+        pending = set()
+        try:
+            while line := await reader.readline():
+                task = asyncio.create_task(self._respond(line, writer))
+                pending.add(task)
+                task.add_done_callback(pending.discard)
+            if pending:
+                await asyncio.wait(pending)
+        finally:
+            writer.close()
+
+    async def _respond(self, line, writer):
+        request_id = None
+        try:
+            request = json.loads(line)
+            request_id = request.get("id")
+            result = await self.call(request["method"], request.get("params") or {})
+            response = {"id": request_id, "result": result}
+        except (KeyError, TypeError, ValueError, AttributeError) as error:
+            response = {"id": request_id, "error": str(error)}
+        writer.write(json.dumps(response).encode() + b"\n")
+        try:
+            await writer.drain()
+        except ConnectionError:
+            pass
+
+
+# ------------------------------------------------------------
+# PuzzleClient Class
+# ------------------------------------------------------------
+
+class ServiceError(Exception):
+    """The service answered with an error."""
+
+
+class PuzzleClient:
+    """Blocking client for the puzzle service, one connection per call.
+
+    Safe to share between the puzzle pool's worker threads.
+    """
+
+    def __init__(self, host=SERVICE_HOST, port=SERVICE_PORT, timeout=SERVICE_TIMEOUT):
+        self.host = host
+        self.port = port
+        self.timeout = timeout
+
+    def call(self, method, **params):
+        """Send one request and return its result. Raises OSError or ServiceError."""
+        with socket.create_connection((self.host, self.port), timeout=self.timeout) as sock:
+            sock.sendall(json.dumps({"id": 1, "method": method, "params": params}).encode() + b"\n")
+            with sock.makefile("rb") as reply:
+                line = reply.readline()
+        if not line:
+            raise ServiceError("connection closed without a reply")
+        response = json.loads(line)
+        if "error" in response:
+            raise ServiceError(response["error"])
+        return response["result"]
+
+    def get_puzzle(self, difficulty, seed=None, box=BOX_SIZE):
+        """Return (puzzle_board, solution_board, puzzle_id) for a difficulty."""
+        params = {"difficulty": DIFFICULTY_LABELS[difficulty]}
+        if box != BOX_SIZE:
+            params["box"] = box
+        if seed is not None:
+            params["seed"] = seed
+        result = self.call("get_puzzle", **params)
+        return Board.from_text(result["puzzle"]), Board.from_text(result["solution"]), result["puzzle_id"]
+
+    def validate(self, board):
+        return self.call("validate", board=board.to_text())
+
+    def solve(self, board):
+        solution = self.call("solve", board=board.to_text())
+        return Board.from_text(solution) if solution else None
+
+    def stats(self):
+        return self.call("stats")
+
+
+def service_source(client, fallback, retry_after=SERVICE_RETRY_AFTER):
+    """Puzzle pool generator that asks the service, and uses fallback (local
+    generation) if it cannot be reached, without retrying for retry_after seconds."""
+    down_until = 0.0
+
+    def boards(difficulty, box=BOX_SIZE):
+        nonlocal down_until
+        if time.monotonic() >= down_until:
+            try:
+                return client.get_puzzle(difficulty, box=box)
+            except (OSError, ServiceError, ValueError):
+                down_until = time.monotonic() + retry_after
+        return fallback(difficulty, box)
+
+    return boards
+
+
+# ------------------------------------------------------------
+# Server Entry Point
+# ------------------------------------------------------------
+
+async def serve(host, port, workers, batch_size, batch_window):
+    service = PuzzleService(workers, batch_size, batch_window)
+    server = await service.start(host, port)
+    print(f"puzzle service on {host}:{port} with {service.workers} workers")
+    try:
+        async with server:
+            await server.serve_forever()
+    finally:
+        service.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Serve Sudoku puzzles as JSON over TCP.")
+    parser.add_argument("--host", default=SERVICE_HOST)
+    parser.add_argument("--port", type=int, default=SERVICE_PORT)
+    parser.add_argument("--workers", type=int, default=os.cpu_count(), help="generator processes")
+    parser.add_argument("--batch", type=int, default=SERVICE_BATCH_SIZE, help="most requests per batch")
+    parser.add_argument("--window-ms", type=float, default=SERVICE_BATCH_WINDOW_MS,
+                        help="how long a batch waits for more requests")
+    args = parser.parse_args()
+
+    try:
+        asyncio.run(serve(args.host, args.port, args.workers, args.batch, args.window_ms / 1000))
+    except KeyboardInterrupt:
+        pass
@@ -0,0 +1,237 @@
+#! /usr/bin/env python3
+
+# ------------------------------------------------------------
+# savegame.py
+# Crash-safe autosave and resume for the Lofi Sudoku Game
+# By: Beck Bishp
+# Last Updated: 10/18/2026
+# ------------------------------------------------------------
+#
+# File layout (all integers little-endian):
+#
+#   magic     4 bytes   b"LSSV"
+#   version   uint16    SAVE_VERSION
+#   box       uint8     box width (3 for 9x9)
+#   id_len    uint8     length of the puzzle ID, 0 if the puzzle has none
+#   moves     uint32    moves in the move log
+#   position  uint32    moves applied (the rest can be redone)
+#   puzzle_id id_len bytes, ASCII
+#   puzzle    cells bytes, one per cell, 0 for blanks
+#   solution  cells bytes
+#   player    cells bytes
+#   notes     cells x uint32, pencil marks with bit d for digit d
+#   log       moves x 3 x uint16: cell index, old value, new value
+
+import os
+import struct
+import sys
+import tempfile
+import threading
+import time
+from array import array
+from collections import namedtuple
+
+from board import Board
+from constants import SAVE_PATH, AUTOSAVE_INTERVAL, BOX_SIZES
+from move_log import MoveLog
+
+SAVE_MAGIC = b"LSSV"
+SAVE_VERSION = 1
+
+_HEADER = struct.Struct("<4sHBBII")
+
+SavedGame = namedtuple("SavedGame", "puzzle_board solution_board player_board notes moves puzzle_id")
+
+
+def _notes_bytes(notes):
+    flat = array('I', (mask for row in notes for mask in row))
+    if sys.byteorder != "little":
+        flat.byteswap()
+    return flat.tobytes()
+
+
+def encode(core):
+    """Snapshot the current game of a GameCore as bytes."""
+    board_state = core.board_state
+    puzzle_id = (core.puzzle_id or "").encode("ascii")
+    moves = board_state.moves
+    return b"".join((
+        _HEADER.pack(SAVE_MAGIC, SAVE_VERSION, core.puzzle_board.box, len(puzzle_id),
+                     len(moves), moves.position),
+        puzzle_id,
+        bytes(core.puzzle_board.cells),
+        bytes(core.solution_board.cells),
+        bytes(board_state.player_board.cells),
+        _notes_bytes(board_state.notes),
+        moves.to_bytes(),
+    ))
+
+
+def decode(data):
+    """Read a snapshot written by encode(). Raises ValueError."""
+    try:
+        magic, version, box, id_len, move_count, position = _HEADER.unpack_from(data, 0)
+    except struct.error:
+        raise ValueError("save file is too short") from None
+    if magic != SAVE_MAGIC or version != SAVE_VERSION:
+        raise ValueError(f"not a version {SAVE_VERSION} save file")
+    if box not in BOX_SIZES:
+        raise ValueError(f"save file has an unknown board size (box {box})")
+    size = box * box
+    cells = size * size
+    offset = _HEADER.size
+    if len(data) != offset + id_len + 3 * cells + 4 * cells + 6 * move_count:
+        raise ValueError("save file has the wrong length")
+
+    puzzle_id = data[offset:offset + id_len].decode("ascii") or None
+    offset += id_len
+    boards = []
+    for _ in range(3):
+        board = Board(data[offset:offset + cells])
+        if max(board.cells) > size:
+            raise ValueError("save file has a cell value past the board size")
+        boards.append(board)
+        offset += cells
+    notes = array('I')
+    notes.frombytes(data[offset:offset + 4 * cells])
+    if sys.byteorder != "little":
+        notes.byteswap()
+    # Bit d marks digit d, so only bits 1 up to size may be set
+    if any(mask & ~((2 << size) - 2) for mask in notes):
+        raise ValueError("save file has a pencil mark past the board size")
+    offset += 4 * cells
+    moves = MoveLog.from_bytes(data[offset:], position)
+    entries = moves.entries
+    if entries and (max(entries[0::3]) >= cells or max(entries[1::3]) > size or max(entries[2::3]) > size):
+        raise ValueError("save file has a move off the board")
+    return SavedGame(*boards, notes, moves, puzzle_id)
+
+
+def load_game(path=SAVE_PATH):
+    """Read the save file, or return None if there is none or it cannot be used."""
+    try:
+        with open(path, "rb") as f:
+            return decode(f.read())
+    except (OSError, ValueError):
+        return None
+
+
+# ------------------------------------------------------------
+# Autosaver Class
+# ------------------------------------------------------------
+
+class Autosaver:
+    """Saves the game in progress from a background thread.
+
+    update() is called once per frame. Every interval seconds, if the game
+    changed since it was started or restored, it encodes a snapshot (a few
+    small copies) and hands it to the writer thread. The thread writes it
+    to a temporary file and renames that over the save file, so a crash
+    mid-write leaves the last save intact. A snapshot handed over while
+    another is being written replaces any that is still waiting, so only
+    the newest is written. The save is removed once the game is won or its
+    solution revealed.
+
+    A game that was saved before and is still resumable is only ever
+    replaced after restore() has loaded it, so starting on another puzzle
+    (e.g. with --puzzle) leaves it for the next launch.
+    """
+
+    def __init__(self, path=SAVE_PATH, interval=AUTOSAVE_INTERVAL):
+        self.path = path
+        self.interval = interval
+        self.saved_key = None       # (game, changes, resumable) of the last snapshot
+        self.saved_at = 0.0
+        self.writes = 0
+        self.last_error = None
+        self._pending = None        # (snapshot bytes or None to remove the file,)
+        self._busy = False
+        self._condition = threading.Condition()
+        self._thread = None
+        # The unfinished game found on disk, if any. Until it is restored
+        # the file belongs to it and is not touched.
+        self.saved_game = load_game(path)
+        self.owns_file = self.saved_game is None
+
+    def restore(self, core):
+        """Load the saved game into core (see GameCore.restore) and take
+        over its file. Returns False if there is no saved game."""
+        if self.saved_game is None:
+            return False
+        core.restore(self.saved_game)
+        self.saved_game = None
+        self.owns_file = True
+        return True
+
+    def update(self, core, force=False, now=None):
+        """Save core's game if it changed and interval has passed (or force)."""
+        board_state = core.board_state
+        # Nothing is saved until the player changes something, so an
+        # untouched board never replaces the last save
+        if board_state is None or not board_state.changes or not self.owns_file:
+            return
+        key = (core.games, board_state.changes, core.can_resume)
+        if key == self.saved_key:
+            return
+        if not core.can_resume:
+            # Nothing left to resume
+            self.saved_key = key
+            self._submit(None)
+            return
+        now = time.monotonic() if now is None else now
+        if not force and now - self.saved_at < self.interval:
+            return
+        self.saved_key = key
+        self.saved_at = now
+        self._submit(encode(core))
+
+    def flush(self, timeout=None):
+        """Wait until everything handed over is on disk. Returns False on timeout."""
+        with self._condition:
+            return self._condition.wait_for(lambda: self._pending is None and not self._busy, timeout)
+
+    def _submit(self, data):
+        with self._condition:
+            self._pending = (data,)
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="autosave", daemon=True)
+                self._thread.start()
+            self._condition.notify_all()
+
+    def _run(self):
+        while True:
+            with self._condition:
+                self._condition.wait_for(lambda: self._pending is not None)
+                (data,), self._pending = self._pending, None
+                self._busy = True
+            try:
+                if data is None:
+                    self._remove()
+                else:
+                    self._write(data)
+            except OSError as error:
+                self.last_error = error
+            finally:
+                with self._condition:
+                    self._busy = False
+                    self._condition.notify_all()
+
+    def _write(self, data):
+        directory = os.path.dirname(os.path.abspath(self.path))
+        fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as out:
+                out.write(data)
+                out.flush()
+                os.fsync(out.fileno())
+            os.replace(tmp_path, self.path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+        self.writes += 1
+
+    def _remove(self):
+        try:
+            os.remove(self.path)
+        except FileNotFoundError:
+            pass
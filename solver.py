@@ -0,0 +1,277 @@
+#! /usr/bin/env python3
+
+# ------------------------------------------------------------
+# solver.py
+# Bitmask constraint engine for the Lofi Sudoku Game
+# By: Beck Bishp
+# Last Updated: 10/18/2026
+# ------------------------------------------------------------
+
+import random
+
+from board import Board, box_size_for, geometry
+from constants import BOX_SIZE
+
+
+# Digit d is stored as bit (1 << d), so a full row/column/box is ALL_DIGITS
+# and bit_length() - 1 recovers the digit.
+ALL_DIGITS = 0b1111111110
+
+
+# Default search budget: more steps than any search will ever take
+UNLIMITED = 1 << 62
+# Search steps solve() and count_solutions() take before giving up (about a
+# second). Hard 9x9 puzzles need well under 20,000, but a contradictory
+# board can keep the search going practically forever.
+SOLVE_NODES = 200_000
+# generate() starts over after this many search steps per cell (boards
+# bigger than 9x9 only)
+RESTART_NODES = 4
+
+
+def all_digits(size):
+    """The ALL_DIGITS mask for a board with size digits."""
+    return (1 << (size + 1)) - 2
+
+
+def flatten(grid):
+    """Convert a Board, a list of rows or a flat list (None or 0 for blanks) into a flat list of ints."""
+    if isinstance(grid, Board):
+        return list(grid.cells)
+    if grid and not isinstance(grid[0], (int, type(None))):
+        return [value or 0 for row in grid for value in row]
+    return [value or 0 for value in grid]
+
+
+def to_rows(cells):
+    """Convert a flat list of ints back into a list of lists."""
+    size = box_size_for(len(cells)) ** 2
+    return [list(cells[i:i + size]) for i in range(0, len(cells), size)]
+
+
+# ------------------------------------------------------------
+# Solver Class
+# ------------------------------------------------------------
+
+class Solver:
+    """Backtracking solver that tracks row, column and box occupancy as bitmasks.
+
+    The next cell is always the one with the fewest candidates (MRV), so most
+    boards are solved with very little backtracking.
+    """
+
+    def __init__(self, grid):
+        cells = flatten(grid)
+        geo = geometry(box_size_for(len(cells)))
+        self.cells = cells
+        self.geometry = geo
+        self.row_of, self.col_of, self.box_of = geo.row_of, geo.col_of, geo.box_of
+        self.all_digits = all_digits(geo.size)
+        self.rows = [0] * geo.size
+        self.cols = [0] * geo.size
+        self.boxes = [0] * geo.size
+        self.empties = []
+        self.valid = True
+        self.nodes_left = UNLIMITED   # Search budget, see search()
+
+        for idx, digit in enumerate(cells):
+            if digit == 0:
+                self.empties.append(idx)
+                continue
+            bit = 1 << digit
+            r, c, b = self.row_of[idx], self.col_of[idx], self.box_of[idx]
+            if (self.rows[r] | self.cols[c] | self.boxes[b]) & bit:
+                self.valid = False
+            self.rows[r] |= bit
+            self.cols[c] |= bit
+            self.boxes[b] |= bit
+
+    def candidates(self, idx):
+        """Return the candidate bitmask for an empty cell."""
+        return self.all_digits & ~(self.rows[self.row_of[idx]] | self.cols[self.col_of[idx]]
+                                   | self.boxes[self.box_of[idx]])
+
+    def place(self, idx, digit):
+        """Put a digit into an empty cell and update the masks."""
+        bit = 1 << digit
+        self.rows[self.row_of[idx]] |= bit
+        self.cols[self.col_of[idx]] |= bit
+        self.boxes[self.box_of[idx]] |= bit
+        self.cells[idx] = digit
+
+    def clear(self, idx):
+        """Empty a filled cell and return the digit that was there."""
+        digit = self.cells[idx]
+        mask = ~(1 << digit)
+        self.rows[self.row_of[idx]] &= mask
+        self.cols[self.col_of[idx]] &= mask
+        self.boxes[self.box_of[idx]] &= mask
+        self.cells[idx] = 0
+        return digit
+
+    def dig(self, idx, max_nodes=UNLIMITED):
+        """Blank a filled cell only if the board keeps a unique solution.
+
+        Assumes the current board is uniquely solvable. Every other solution
+        would have to put a different digit in the dug cell, so each of those
+        digits is tried and the search stops at the first solution it finds.
+        A check that runs out of max_nodes counts as finding one, so the cell
+        is kept. Returns True if the cell was blanked.
+        """
+        digit = self.clear(idx)
+        alternatives = self.candidates(idx) & ~(1 << digit)
+        while alternatives:
+            bit = alternatives & -alternatives
+            alternatives ^= bit
+            self.place(idx, bit.bit_length() - 1)
+            self.nodes_left = max_nodes
+            found_other = self._search(1, None, None)
+            self.clear(idx)
+            if found_other:
+                self.place(idx, digit)
+                return False
+        self.empties.append(idx)
+        return True
+
+    def dig_single(self, idx):
+        """Blank a filled cell only if it could be filled straight back in.
+
+        That is, its digit is the cell's only candidate (a naked single) or
+        the only place left for the digit in one of its units (a hidden
+        single). Either way the board keeps its one solution, and no search
+        is needed to prove it. Returns True if the cell was blanked.
+        """
+        digit = self.clear(idx)
+        bit = 1 << digit
+        forced = self.candidates(idx) == bit
+        if not forced:
+            geo = self.geometry
+            for unit in (geo.rows[self.row_of[idx]], geo.cols[self.col_of[idx]], geo.boxes[self.box_of[idx]]):
+                if not any(self.candidates(other) & bit for other in unit
+                           if other != idx and not self.cells[other]):
+                    forced = True
+                    break
+        if forced:
+            self.empties.append(idx)
+        else:
+            self.place(idx, digit)
+        return forced
+
+    def search(self, limit=1, rng=None, found=None, max_nodes=UNLIMITED):
+        """Count solutions up to limit, appending each one found to found.
+
+        The board is restored to its starting state before returning. When rng
+        is given, candidate digits are tried in a random order. After
+        max_nodes search steps the search gives up and returns limit as if
+        it had found enough solutions (found stays short).
+        """
+        if not self.valid:
+            return 0
+        self.nodes_left = max_nodes
+        return self._search(limit, rng, found)
+
+    def _search(self, limit, rng, found):
+        self.nodes_left -= 1
+        if self.nodes_left < 0:
+            return limit
+        empties = self.empties
+        if not empties:
+            if found is not None:
+                found.append(self.cells[:])
+            return 1
+
+        rows, cols, boxes = self.rows, self.cols, self.boxes
+        row_of, col_of, box_of = self.row_of, self.col_of, self.box_of
+        full = self.all_digits
+
+        # Pick the empty cell with the fewest candidates (MRV)
+        best_i = 0
+        best_mask = 0
+        best_count = 99
+        for i, idx in enumerate(empties):
+            mask = full & ~(rows[row_of[idx]] | cols[col_of[idx]] | boxes[box_of[idx]])
+            count = mask.bit_count()
+            if count < best_count:
+                if count == 0:
+                    return 0
+                best_i, best_mask, best_count = i, mask, count
+                if count == 1:
+                    break
+
+        empties[best_i], empties[-1] = empties[-1], empties[best_i]
+        idx = empties.pop()
+        r, c, b = row_of[idx], col_of[idx], box_of[idx]
+
+        bits = []
+        while best_mask:
+            bit = best_mask & -best_mask
+            bits.append(bit)
+            best_mask ^= bit
+        if rng is not None:
+            rng.shuffle(bits)
+
+        cells = self.cells
+        total = 0
+        for bit in bits:
+            rows[r] |= bit
+            cols[c] |= bit
+            boxes[b] |= bit
+            cells[idx] = bit.bit_length() - 1
+            total += self._search(limit - total, rng, found)
+            rows[r] ^= bit
+            cols[c] ^= bit
+            boxes[b] ^= bit
+            if total >= limit:
+                break
+
+        cells[idx] = 0
+        empties.append(idx)
+        empties[best_i], empties[-1] = empties[-1], empties[best_i]
+        return total
+
+
+# ------------------------------------------------------------
+# Entry Points
+# ------------------------------------------------------------
+
+def solve(grid, rng=None, max_nodes=SOLVE_NODES):
+    """Solve a board of any size. Returns the solved grid as rows, or None if
+    unsolvable or not solved within max_nodes search steps."""
+    found = []
+    Solver(grid).search(1, rng, found, max_nodes)
+    return to_rows(found[0]) if found else None
+
+
+def count_solutions(grid, limit=2, max_nodes=SOLVE_NODES):
+    """Count the solutions of a board, stopping early once limit is reached.
+
+    Returns limit if the count is not settled within max_nodes search steps.
+    """
+    return Solver(grid).search(limit, max_nodes=max_nodes)
+
+
+def generate(rng=random, box=BOX_SIZE):
+    """Generate a random complete valid grid with box x box boxes (9x9 by default)."""
+    size = box * box
+    while True:
+        cells = [0] * (size * size)
+
+        # The diagonal boxes never share a row or column, so they can be
+        # filled independently before the solver takes over. (On 4x4 boards
+        # two filled diagonal boxes can leave no solution, so only one is.)
+        for diagonal in range(box if box > 2 else 1):
+            digits = list(range(1, size + 1))
+            rng.shuffle(digits)
+            top = left = diagonal * box
+            for i, digit in enumerate(digits):
+                cells[(top + i // box) * size + left + i % box] = digit
+
+        # A random fill is quick or very slow depending on the early choices,
+        # which matters from 16x16 up, so there a fill that takes too long is
+        # abandoned and started over from new diagonal boxes. 9x9 fills run
+        # to the end, so seeded 9x9 grids (and puzzle IDs) stay the same.
+        found = []
+        max_nodes = RESTART_NODES * size * size if box > BOX_SIZE else UNLIMITED
+        Solver(cells).search(1, rng, found, max_nodes=max_nodes)
+        if found:
+            return to_rows(found[0])
@@ -0,0 +1,52 @@
+#! /usr/bin/env python3
+
+# ------------------------------------------------------------
+# tests/test_background.py
+# Tests for the animated background's quality levels
+# By: Beck Bishp
+# Last Updated: 10/18/2026
+# ------------------------------------------------------------
+
+import os
+import unittest
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+import pygame
+
+from background import LofiBackground, QUALITY_LEVELS
+from constants import BACKGROUND_RECOVER_SECONDS, BACKGROUND_SLOW_FRAMES, IDLE_TIMEOUT_MS
+
+
+class QualityLevelTests(unittest.TestCase):
+
+    def setUp(self):
+        pygame.init()
+        self.addCleanup(pygame.quit)
+        pygame.display.set_mode((200, 200))
+        self.background = LofiBackground((200, 200))
+
+    def drop_to_still(self):
+        for _ in range(BACKGROUND_SLOW_FRAMES * len(QUALITY_LEVELS)):
+            self.background.end_frame(self.background.budget * 2, now=0.0)
+        self.assertFalse(self.background.animating)
+
+    def test_recovers_while_idle(self):
+        self.drop_to_still()
+        # Standing still, the loop only wakes once every IDLE_TIMEOUT_MS
+        now = 0.0
+        while not self.background.animating:
+            now += IDLE_TIMEOUT_MS / 1000
+            self.background.end_frame(0.0, now=now)
+            self.assertLess(now, BACKGROUND_RECOVER_SECONDS * 3)
+
+    def test_slow_frame_restarts_the_wait(self):
+        self.drop_to_still()
+        level = self.background.level
+        self.background.end_frame(0.0, now=0.0)
+        self.background.end_frame(self.background.budget * 2, now=BACKGROUND_RECOVER_SECONDS / 2)
+        self.background.end_frame(0.0, now=BACKGROUND_RECOVER_SECONDS)
+        self.assertEqual(self.background.level, level)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,60 @@
+#! /usr/bin/env python3
+
+# ------------------------------------------------------------
+# tests/test_batch_validator.py
+# Tests for the NumPy batch validator
+# By: Beck Bishp
+# Last Updated: 10/18/2026
+# ------------------------------------------------------------
+
+import random
+import unittest
+
+try:
+    import numpy as np
+    import batch_validator
+except ImportError:     # NumPy is optional (uv sync --extra batch)
+    np = batch_validator = None
+
+from constants import MEDIUM_DIFFICULTY
+from generate_puzzle import generate_boards
+
+
+@unittest.skipIf(batch_validator is None, "needs NumPy")
+class OutOfRangeValueTests(unittest.TestCase):
+    """Values past the board size must never pass as digits."""
+
+    def pair(self, box=3):
+        puzzle, solution = generate_boards(MEDIUM_DIFFICULTY, random.Random(2026), box)
+        return batch_validator.as_stack([puzzle]).copy(), batch_validator.as_stack([solution]).copy()
+
+    def test_good_pair_is_ok(self):
+        self.assertTrue(batch_validator.check_pairs(*self.pair()).ok[0])
+
+    def test_solution_value_past_size_fails(self):
+        for value in (10, 12, 15, 200):
+            puzzles, solutions = self.pair()
+            solutions[0, 4, 4] = value
+            puzzles[0, 4, 4] = 0
+            report = batch_validator.check_pairs(puzzles, solutions)
+            self.assertFalse(report.solution_valid[0], value)
+            self.assertFalse(report.solution_complete[0], value)
+            self.assertFalse(report.ok[0], value)
+
+    def test_puzzle_value_past_size_fails(self):
+        puzzles, solutions = self.pair()
+        blank = tuple(np.argwhere(puzzles[0] == 0)[0])
+        puzzles[(0, *blank)] = 12
+        self.assertFalse(batch_validator.units_valid(puzzles)[0])
+        self.assertFalse(batch_validator.check_pairs(puzzles, solutions).ok[0])
+
+    def test_bigger_board_value_past_size_fails(self):
+        puzzles, solutions = self.pair(box=4)
+        self.assertTrue(batch_validator.check_pairs(puzzles, solutions).ok[0])
+        solutions[0, 0, 0] = 17
+        puzzles[0, 0, 0] = 0
+        self.assertFalse(batch_validator.check_pairs(puzzles, solutions).ok[0])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,114 @@
+#! /usr/bin/env python3
+
+# ------------------------------------------------------------
+# tests/test_board_renderer.py
+# Tests for the playing screen's dirty cell redraws
+# By: Beck Bishp
+# Last Updated: 10/18/2026
+# ------------------------------------------------------------
+
+import os
+import random
+import unittest
+from unittest import mock
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+import pygame
+
+import main
+from board_renderer import BoardRenderer
+from board_state import BoardState
+from constants import MEDIUM_DIFFICULTY, CELL_SIZE
+from game_core import GameCore, GameEvent, MENU, RESUME, TOGGLE_HINTS
+from generate_puzzle import generate_boards
+
+
+class DirtyCellTests(unittest.TestCase):
+
+    def setUp(self):
+        pygame.init()
+        self.addCleanup(pygame.quit)
+        self.surface = pygame.display.set_mode((CELL_SIZE * 11, CELL_SIZE * 11))
+        puzzle, solution = generate_boards(MEDIUM_DIFFICULTY, random.Random(2026))
+        self.state = BoardState(puzzle, solution)
+        self.renderer = BoardRenderer(pygame.font.Font('freesansbold.ttf', 32), (CELL_SIZE, CELL_SIZE))
+        self.renderer.reset(self.surface, puzzle)
+        self.blanks = [divmod(idx, puzzle.size) for idx, value in enumerate(puzzle.cells) if not value]
+        self.blank = self.blanks[0]
+
+    def frame(self, selected_cell=None, show_hints=True):
+        """Draw a frame and return (dirty rects, cells looked at)."""
+        with mock.patch.object(self.renderer, "_cell_key", wraps=self.renderer._cell_key) as cell_key:
+            dirty = self.renderer.draw_board(self.surface, self.state, selected_cell, show_hints)
+        return dirty, cell_key.call_count
+
+    def test_first_frame_looks_at_every_cell(self):
+        _, cells = self.frame()
+        self.assertEqual(cells, 81)
+
+    def test_idle_frame_touches_no_cells(self):
+        self.frame(self.blank)
+        self.assertEqual(self.frame(self.blank), ([], 0))
+
+    def test_move_redraws_only_its_peers(self):
+        self.frame()
+        self.state.move(*self.blank, 1)
+        dirty, cells = self.frame()
+        self.assertEqual(cells, 21)     # The cell and its 20 peers
+        self.assertIn(self.renderer._cell_rect(*self.blank), dirty)
+        self.assertEqual(self.frame(), ([], 0))
+
+    def test_selection_redraws_old_and_new_cell(self):
+        old, new = self.blanks[0], self.blanks[-1]
+        self.frame(old)
+        dirty, cells = self.frame(new)
+        self.assertEqual(cells, 2)
+        self.assertCountEqual(dirty, [self.renderer._cell_rect(*old), self.renderer._cell_rect(*new)])
+
+    def test_hints_switch_looks_at_every_cell(self):
+        self.frame()
+        _, cells = self.frame(show_hints=False)
+        self.assertEqual(cells, 81)
+
+
+
+class HintsLabelTests(unittest.TestCase):
+    """The hints setting can change in the menu while a game is kept for RESUME."""
+
+    def setUp(self):
+        pygame.init()
+        self.addCleanup(pygame.quit)
+        self.surface = pygame.display.set_mode((CELL_SIZE * 11, CELL_SIZE * 11))
+        self.font = pygame.font.Font('freesansbold.ttf', 18)
+        self.rect = pygame.Rect(10, CELL_SIZE * 11 - 30, 150, 20)
+        self.boards = generate_boards(MEDIUM_DIFFICULTY, random.Random(2026))
+
+    def label(self, show_hints, renderer=None):
+        """Pixels of the label drawn with show_hints, after any earlier frames of renderer."""
+        if renderer is None:
+            renderer = BoardRenderer(self.font, (CELL_SIZE, CELL_SIZE))
+            renderer.reset(self.surface, self.boards[0])
+        main.draw_hints_status(self.surface, renderer, self.font, self.rect, show_hints)
+        return pygame.image.tobytes(self.surface.subsurface(self.rect), "RGB")
+
+    def test_label_follows_hints_toggled_before_resume(self):
+        core = GameCore(lambda difficulty, box: self.boards + (None,), lambda puzzle_id: None)
+        core.start_game(*self.boards)
+        renderer = BoardRenderer(self.font, (CELL_SIZE, CELL_SIZE))
+        renderer.reset(self.surface, core.puzzle_board)
+        shown_on = self.label(core.show_hints, renderer)
+
+        core.step([GameEvent(MENU), GameEvent(TOGGLE_HINTS), GameEvent(RESUME)])
+        self.assertFalse(core.show_hints)
+        # Same puzzle board, so the renderer is only invalidated, not reset
+        renderer.invalidate()
+        renderer.draw_board(self.surface, core.board_state, None, core.show_hints)
+        shown_off = self.label(core.show_hints, renderer)
+
+        self.assertNotEqual(shown_off, shown_on)
+        self.assertEqual(shown_off, self.label(False))
+        self.assertEqual(shown_on, self.label(True))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,76 @@
+#! /usr/bin/env python3
+
+# ------------------------------------------------------------
+# tests/test_dlx.py
+# Tests for the Dancing Links solver against the bitmask solver
+# By: Beck Bishp
+# Last Updated: 10/18/2026
+# ------------------------------------------------------------
+
+import random
+import unittest
+
+import dlx
+import solver
+from constants import EASY_DIFFICULTY, HARD_DIFFICULTY
+from generate_puzzle import generate_boards
+from solver import to_rows
+
+# A 9x9 board with no solution that is not given away by a repeated digit
+# (the "no solution" board of benchmarks/solvers.py)
+NO_SOLUTION = "000005080000601043000000000010500000000106000300000005530000061000000004000000000"
+
+
+def cells(text):
+    return [int(char) for char in text]
+
+
+class DlxTests(unittest.TestCase):
+
+    def test_agrees_with_bitmask_solver(self):
+        for seed in range(20):
+            for box in (2, 3, 4):
+                difficulty = HARD_DIFFICULTY if seed % 2 else EASY_DIFFICULTY
+                puzzle, solution = generate_boards(difficulty, random.Random(seed), box)
+                expected = to_rows(list(solution.cells))
+                self.assertEqual(dlx.solve(puzzle), expected, (seed, box))
+                self.assertEqual(solver.solve(puzzle), expected, (seed, box))
+
+    def test_accepts_rows_and_flat_cells(self):
+        puzzle, solution = generate_boards(HARD_DIFFICULTY, random.Random(5))
+        rows = to_rows(list(puzzle.cells))
+        self.assertEqual(dlx.solve(rows), to_rows(list(solution.cells)))
+        self.assertEqual(dlx.solve(list(puzzle.cells)), to_rows(list(solution.cells)))
+
+    def test_count_solutions_unique(self):
+        for seed in range(5):
+            puzzle, _ = generate_boards(HARD_DIFFICULTY, random.Random(seed))
+            self.assertEqual(dlx.count_solutions(puzzle, limit=2), 1)
+
+    def test_count_solutions_several(self):
+        puzzle, solution = generate_boards(EASY_DIFFICULTY, random.Random(1))
+        self.assertEqual(dlx.count_solutions([0] * 81, limit=2), 2)
+        # Only one given left: many ways to finish it
+        sparse = [0] * 81
+        first = next(idx for idx, value in enumerate(puzzle.cells) if value)
+        sparse[first] = puzzle.cells[first]
+        self.assertEqual(dlx.count_solutions(sparse, limit=2), 2)
+        self.assertEqual(dlx.count_solutions(sparse, limit=5), 5)
+
+    def test_count_solutions_unsolvable(self):
+        self.assertEqual(dlx.count_solutions(cells(NO_SOLUTION), limit=2), 0)
+        self.assertIsNone(dlx.solve(cells(NO_SOLUTION)))
+        # Two 5s in the first row
+        clash = [0] * 81
+        clash[0] = clash[8] = 5
+        self.assertEqual(dlx.count_solutions(clash, limit=2), 0)
+        self.assertIsNone(dlx.solve(clash))
+
+    def test_solved_board_counts_once(self):
+        _, solution = generate_boards(EASY_DIFFICULTY, random.Random(2))
+        self.assertEqual(dlx.count_solutions(solution, limit=2), 1)
+        self.assertEqual(dlx.solve(solution), to_rows(list(solution.cells)))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,44 @@
+#! /usr/bin/env python3
+
+# ------------------------------------------------------------
+# tests/test_frame_scheduler.py
+# Tests for counting main loop wakeups
+# By: Beck Bishp
+# Last Updated: 10/18/2026
+# ------------------------------------------------------------
+
+import os
+import unittest
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+import pygame
+
+from frame_scheduler import FrameScheduler
+
+
+class WakeupTests(unittest.TestCase):
+
+    def setUp(self):
+        pygame.display.init()
+        self.addCleanup(pygame.display.quit)
+        pygame.display.set_mode((100, 100))
+        pygame.event.clear()
+
+    def test_idle_waits_count_as_wakeups(self):
+        scheduler = FrameScheduler(timeout_ms=10)
+        for _ in range(3):
+            self.assertEqual(scheduler.next_events(), [])
+        self.assertEqual(scheduler.total_wakeups, 3)
+        self.assertEqual(scheduler.wakeups_per_second(), 3)
+        self.assertEqual(scheduler.text(), "wakeups: 3 total, 3 in the last second")
+
+    def test_input_wakes_the_loop_with_the_event(self):
+        scheduler = FrameScheduler(timeout_ms=1000)
+        pygame.event.post(pygame.event.Event(pygame.USEREVENT))
+        events = scheduler.next_events()
+        self.assertEqual([event.type for event in events], [pygame.USEREVENT])
+        self.assertEqual(scheduler.total_wakeups, 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,119 @@
+#! /usr/bin/env python3
+
+# ------------------------------------------------------------
+# tests/test_game_core.py
+# Tests that step the headless game core through whole games
+# By: Beck Bishp
+# Last Updated: 10/18/2026
+# ------------------------------------------------------------
+
+import random
+import unittest
+
+from constants import MEDIUM_DIFFICULTY, STATE_MENU, STATE_PLAYING, STATE_LOADING, STATE_GAME_OVER
+from game_core import GameCore, GameEvent
+from game_core import TOGGLE_HINTS, START, PLAY_ID, RESUME, SELECT, DIGIT, MENU
+from generate_puzzle import generate_boards
+
+
+class GameCoreTests(unittest.TestCase):
+
+    def setUp(self):
+        self.boards = generate_boards(MEDIUM_DIFFICULTY, random.Random(2026))
+        self.id_requests = []       # IDs puzzle_by_id was polled with
+        self.id_ready_after = 0     # Polls that return None before the boards
+
+    def next_puzzle(self, difficulty, box):
+        return self.boards + ("M-NEXT",)
+
+    def puzzle_by_id(self, puzzle_id):
+        self.id_requests.append(puzzle_id)
+        if len(self.id_requests) <= self.id_ready_after:
+            return None
+        return tuple(board.copy() for board in self.boards)
+
+    def core(self, start_id=None):
+        return GameCore(self.next_puzzle, self.puzzle_by_id, start_id)
+
+    def blanks(self, core):
+        return [divmod(idx, core.puzzle_board.size)
+                for idx, value in enumerate(core.puzzle_board.cells) if not value]
+
+    def test_start_play_and_win(self):
+        core = self.core()
+        self.assertEqual(core.step([GameEvent(START)]), STATE_PLAYING)
+        self.assertEqual(core.puzzle_id, "M-NEXT")
+        *rest, last = self.blanks(core)
+        for cell in rest:
+            core.step([GameEvent(SELECT, cell), GameEvent(DIGIT, core.solution_board[cell])])
+        self.assertEqual(core.state, STATE_PLAYING)
+        # A wrong digit fills the board without winning
+        wrong = core.solution_board[last] % core.puzzle_board.size + 1
+        self.assertEqual(core.step([GameEvent(SELECT, last), GameEvent(DIGIT, wrong)]), STATE_PLAYING)
+        self.assertEqual(core.step([GameEvent(DIGIT, core.solution_board[last])]), STATE_GAME_OVER)
+        self.assertTrue(core.game_won)
+        self.assertFalse(core.can_resume)
+
+    def test_given_cells_cannot_be_selected(self):
+        core = self.core()
+        core.step([GameEvent(START)])
+        given = next(divmod(idx, 9) for idx, value in enumerate(core.puzzle_board.cells) if value)
+        core.step([GameEvent(SELECT, given), GameEvent(DIGIT, 1)])
+        self.assertIsNone(core.selected_cell)
+        self.assertEqual(core.board_state.changes, 0)
+
+    def test_play_id_loads_while_polled(self):
+        self.id_ready_after = 2
+        core = self.core()
+        self.assertEqual(core.step([GameEvent(PLAY_ID, " #m-2cb ")]), STATE_LOADING)
+        self.assertEqual(core.step([]), STATE_LOADING)
+        self.assertEqual(core.step([]), STATE_PLAYING)
+        self.assertEqual(self.id_requests, ["M-2CB"] * 3)
+        self.assertEqual(core.puzzle_id, "M-2CB")
+        self.assertIsNone(core.requested_id)
+
+    def test_start_id_loads_on_first_update(self):
+        core = self.core("M-2CB")
+        self.assertEqual(core.state, STATE_LOADING)
+        self.assertEqual(core.step([]), STATE_PLAYING)
+        self.assertEqual(core.puzzle_id, "M-2CB")
+
+    def test_bad_play_id_stays_in_menu(self):
+        core = self.core()
+        self.assertEqual(core.step([GameEvent(PLAY_ID, "not an id")]), STATE_MENU)
+        self.assertTrue(core.id_error)
+        self.assertEqual(self.id_requests, [])
+
+    def test_menu_while_loading_drops_the_id_request(self):
+        self.id_ready_after = 100
+        core = self.core()
+        core.step([GameEvent(PLAY_ID, "M-2CB")])
+        self.assertEqual(core.step([GameEvent(MENU)]), STATE_MENU)
+        self.assertIsNone(core.requested_id)
+        # Start now takes the next puzzle instead of the abandoned ID
+        polls = len(self.id_requests)
+        self.assertEqual(core.step([GameEvent(START)]), STATE_PLAYING)
+        self.assertEqual(core.puzzle_id, "M-NEXT")
+        self.assertEqual(len(self.id_requests), polls)
+
+    def test_hints_toggled_in_menu_apply_on_resume(self):
+        core = self.core()
+        core.step([GameEvent(START)])
+        cell = self.blanks(core)[0]
+        core.step([GameEvent(SELECT, cell), GameEvent(DIGIT, core.solution_board[cell])])
+        board_state = core.board_state
+        self.assertEqual(core.step([GameEvent(MENU), GameEvent(TOGGLE_HINTS)]), STATE_MENU)
+        self.assertEqual(core.step([GameEvent(RESUME)]), STATE_PLAYING)
+        self.assertFalse(core.show_hints)
+        self.assertIs(core.board_state, board_state)
+        self.assertEqual(core.board_state.filled, 1)
+
+    def test_missing_callback_raises_value_error(self):
+        with self.assertRaises(ValueError):
+            GameCore(self.next_puzzle, None)
+        with self.assertRaises(ValueError):
+            GameCore(None, self.puzzle_by_id)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,45 @@
+#! /usr/bin/env python3
+
+# ------------------------------------------------------------
+# tests/test_grader.py
+# Tests for the puzzle shapes the difficulty grader accepts
+# By: Beck Bishp
+# Last Updated: 10/18/2026
+# ------------------------------------------------------------
+
+import random
+import unittest
+
+from board import Board
+from constants import MEDIUM_DIFFICULTY
+from generate_puzzle import generate_boards
+from grader import grade
+
+
+class PuzzleShapeTests(unittest.TestCase):
+
+    def test_board_rows_and_cells_grade_the_same(self):
+        puzzle, _ = generate_boards(MEDIUM_DIFFICULTY, random.Random(2026))
+        rows = [[puzzle[row, col] or None for col in range(9)] for row in range(9)]
+        expected = grade(puzzle)
+        self.assertTrue(expected.solved)
+        self.assertEqual(grade(rows), expected)
+        self.assertEqual(grade(list(puzzle.cells)), expected)
+
+    def test_other_sizes_raise_value_error(self):
+        for box in (2, 4, 5):
+            puzzle, _ = generate_boards(MEDIUM_DIFFICULTY, random.Random(box), box)
+            rows = [list(puzzle.cells[i:i + puzzle.size]) for i in range(0, len(puzzle.cells), puzzle.size)]
+            for shape in (puzzle, rows, list(puzzle.cells)):
+                with self.assertRaisesRegex(ValueError, "9x9 only"):
+                    grade(shape)
+
+    def test_wrong_cell_count_raises_value_error(self):
+        with self.assertRaises(ValueError):
+            grade([0] * 80)
+        with self.assertRaises(ValueError):
+            grade(Board(box=2))
+
+
+if __name__ == "__main__":
+    unittest.main()
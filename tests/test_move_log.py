@@ -0,0 +1,74 @@
+#! /usr/bin/env python3
+
+# ------------------------------------------------------------
+# tests/test_move_log.py
+# Tests for the undo/redo move log
+# By: Beck Bishp
+# Last Updated: 10/18/2026
+# ------------------------------------------------------------
+
+import unittest
+
+from move_log import MoveLog
+
+
+class MoveLogTests(unittest.TestCase):
+
+    def log(self):
+        log = MoveLog()
+        log.record(0, 0, 5)
+        log.record(10, 0, 3)
+        log.record(10, 3, 4)
+        return log
+
+    def test_undo_and_redo_walk_the_moves(self):
+        log = self.log()
+        self.assertEqual(log.undo(), (10, 3, 4))
+        self.assertEqual(log.undo(), (10, 0, 3))
+        self.assertEqual(log.redo(), (10, 0, 3))
+        self.assertEqual((log.position, len(log)), (2, 3))
+        self.assertEqual(log.redo(), (10, 3, 4))
+        self.assertIsNone(log.redo())
+
+    def test_undo_past_the_start_returns_none(self):
+        log = self.log()
+        for _ in range(3):
+            log.undo()
+        self.assertFalse(log.can_undo())
+        self.assertIsNone(log.undo())
+        self.assertEqual(log.position, 0)
+
+    def test_recording_after_undo_drops_the_redo_moves(self):
+        log = self.log()
+        log.undo()
+        log.undo()
+        log.record(20, 0, 9)
+        self.assertEqual(len(log), 2)
+        self.assertFalse(log.can_redo())
+        self.assertEqual(log.undo(), (20, 0, 9))
+        self.assertEqual(log.undo(), (0, 0, 5))
+
+    def test_bytes_round_trip_keeps_undo_and_redo(self):
+        log = self.log()
+        log.undo()
+        copy = MoveLog.from_bytes(log.to_bytes(), log.position)
+        self.assertEqual(list(copy.entries), list(log.entries))
+        self.assertEqual(copy.position, 2)
+        self.assertEqual(copy.redo(), (10, 3, 4))
+        self.assertEqual(copy.undo(), (10, 3, 4))
+        self.assertEqual(copy.undo(), (10, 0, 3))
+
+    def test_bytes_are_little_endian(self):
+        log = MoveLog()
+        log.record(0x0102, 0, 7)
+        self.assertEqual(log.to_bytes(), b"\x02\x01\x00\x00\x07\x00")
+
+    def test_bad_bytes_raise_value_error(self):
+        data = self.log().to_bytes()
+        for bad, position in ((data[:-2], 3), (data, 4), (data, -1)):
+            with self.assertRaises(ValueError):
+                MoveLog.from_bytes(bad, position)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,61 @@
+#! /usr/bin/env python3
+
+# ------------------------------------------------------------
+# tests/test_puzzle_bank.py
+# Tests for opening damaged puzzle bank files
+# By: Beck Bishp
+# Last Updated: 10/18/2026
+# ------------------------------------------------------------
+
+import os
+import random
+import tempfile
+import unittest
+
+from constants import EASY_DIFFICULTY
+from generate_puzzle import generate_boards
+from puzzle_bank import PuzzleBank, BankWriter, RECORD_SIZE
+
+
+class DamagedBankTests(unittest.TestCase):
+
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.path = os.path.join(directory.name, "bank.bin")
+
+    def write(self, data):
+        with open(self.path, "wb") as f:
+            f.write(data)
+
+    def good_bank(self):
+        with BankWriter(self.path) as writer:
+            for tier in range(3):
+                writer.add(tier, *generate_boards(EASY_DIFFICULTY, random.Random(tier)))
+        with open(self.path, "rb") as f:
+            return f.read()
+
+    def test_good_bank_opens(self):
+        self.good_bank()
+        with PuzzleBank(self.path) as bank:
+            self.assertEqual([bank.count(tier) for tier in range(bank.tiers)], [1, 1, 1])
+
+    def test_empty_and_short_files_raise_value_error(self):
+        for data in (b"", b"LSPB\x01\x00", b"LSPB\x01\x00\x03\x00Q\x00\x00\x00"):
+            self.write(data)
+            with self.assertRaises(ValueError):
+                PuzzleBank(self.path)
+
+    def test_truncated_records_raise_value_error(self):
+        self.write(self.good_bank()[:-RECORD_SIZE // 2])
+        with self.assertRaises(ValueError):
+            PuzzleBank(self.path)
+
+    def test_not_a_bank_raises_value_error(self):
+        self.write(b"not a puzzle bank at all, just some text")
+        with self.assertRaises(ValueError):
+            PuzzleBank(self.path)
+
+
+if __name__ == "__main__":
+    unittest.main()
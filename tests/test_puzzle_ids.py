@@ -0,0 +1,119 @@
+#! /usr/bin/env python3
+
+# ------------------------------------------------------------
+# tests/test_puzzle_ids.py
+# Tests for puzzle IDs and the puzzle cache
+# By: Beck Bishp
+# Last Updated: 10/18/2026
+# ------------------------------------------------------------
+
+import hashlib
+import os
+import subprocess
+import sys
+import unittest
+
+from constants import EASY_DIFFICULTY, MEDIUM_DIFFICULTY, HARD_DIFFICULTY
+from puzzle_ids import SEED_BITS, PuzzleCache
+from puzzle_ids import make_puzzle_id, parse_puzzle_id, normalize_puzzle_id
+
+# SHA-1 of the puzzle and solution cells of each ID. Shared IDs must keep
+# giving the same puzzle, so these must never change (the 9x9 ones are the
+# same as before board sizes became a setting).
+PINNED_BOARDS = {
+    "E-0": "495e2842d4fe4c5b35030e977f6c3ca79a37e7ee",
+    "M-2CB": "a0863c432f4f23a93e191206983cf123b9afd242",
+    "H-ZZZZZZZ": "4da182f8b144498d4a12b0e05d8fdf8bff0e6eb1",
+    "E4-1F": "146e14c72987230c4061ec694b015b720d3199e9",
+    "M16-7": "d354d71d20d7d893d3c10455c218fc6ea5758dff",
+}
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def boards_digest(boards):
+    puzzle, solution = boards
+    return hashlib.sha1(bytes(puzzle.cells) + bytes(solution.cells)).hexdigest()
+
+
+class PuzzleIdTests(unittest.TestCase):
+
+    def test_make_and_parse_round_trip(self):
+        for difficulty in (EASY_DIFFICULTY, MEDIUM_DIFFICULTY, HARD_DIFFICULTY):
+            for box in (2, 3, 4, 5):
+                for seed in (0, 1, 35, 36, 123456789, (1 << SEED_BITS) - 1):
+                    puzzle_id = make_puzzle_id(difficulty, seed, box)
+                    self.assertEqual(parse_puzzle_id(puzzle_id), (difficulty, seed, box))
+                    self.assertEqual(normalize_puzzle_id(puzzle_id), puzzle_id)
+
+    def test_ids_as_typed_are_normalized(self):
+        self.assertEqual(make_puzzle_id(MEDIUM_DIFFICULTY, 3035), "M-2CB")
+        self.assertEqual(make_puzzle_id(HARD_DIFFICULTY, 7, 4), "H16-7")
+        for typed in ("M-2CB", "m-2cb", " #M-2CB ", "M2CB", "#m2cb"):
+            self.assertEqual(normalize_puzzle_id(typed), "M-2CB")
+        self.assertEqual(normalize_puzzle_id("#h16-7"), "H16-7")
+        # Without a dash the digits are all seed, so this is a 9x9 ID
+        self.assertEqual(parse_puzzle_id("M16"), (MEDIUM_DIFFICULTY, int("16", 36), 3))
+
+    def test_seed_bounds(self):
+        largest = (1 << SEED_BITS) - 1
+        self.assertEqual(make_puzzle_id(EASY_DIFFICULTY, largest), "E-E13WU1OF")
+        self.assertEqual(parse_puzzle_id("E-E13WU1OF")[1], largest)
+        for seed in (-1, 1 << SEED_BITS):
+            with self.assertRaises(ValueError):
+                make_puzzle_id(EASY_DIFFICULTY, seed)
+        # 2**SEED_BITS in base 36
+        self.assertEqual(int("E13WU1OG", 36), 1 << SEED_BITS)
+        with self.assertRaises(ValueError):
+            parse_puzzle_id("E-E13WU1OG")
+
+    def test_bad_ids_raise_value_error(self):
+        for bad in ("", "#", "X-12", "M-", "M-12!", "M9-12", "M16-", "M-1 2"):
+            with self.assertRaises(ValueError, msg=bad):
+                parse_puzzle_id(bad)
+
+
+class SameBoardsTests(unittest.TestCase):
+
+    def test_ids_give_pinned_boards(self):
+        cache = PuzzleCache()
+        for puzzle_id, digest in PINNED_BOARDS.items():
+            self.assertEqual(boards_digest(cache.get(puzzle_id)), digest, puzzle_id)
+
+    def test_ids_give_same_boards_in_a_new_process(self):
+        script = ("import hashlib\n"
+                  "from puzzle_ids import puzzle_cache\n"
+                  "for puzzle_id in %r:\n"
+                  "    puzzle, solution = puzzle_cache.get(puzzle_id)\n"
+                  "    print(hashlib.sha1(bytes(puzzle.cells) + bytes(solution.cells)).hexdigest())\n"
+                  % list(PINNED_BOARDS))
+        env = dict(os.environ, PYTHONHASHSEED="12345")
+        output = subprocess.run([sys.executable, "-c", script], cwd=ROOT, env=env,
+                                capture_output=True, text=True, check=True).stdout
+        self.assertEqual(output.split(), list(PINNED_BOARDS.values()))
+
+
+class PuzzleCacheTests(unittest.TestCase):
+
+    def test_least_recently_used_is_evicted(self):
+        cache = PuzzleCache(maxsize=2)
+        cache.get("E-1")
+        cache.get("E-2")
+        cache.get("e1")                 # Same puzzle as E-1, now the most recent
+        cache.get("E-3")                # Evicts E-2
+        self.assertEqual(list(cache.boards), ["E-1", "E-3"])
+        self.assertEqual((cache.hits, cache.misses), (1, 3))
+        cache.get("E-2")
+        self.assertEqual(list(cache.boards), ["E-3", "E-2"])
+        self.assertEqual(cache.misses, 4)
+
+    def test_get_returns_copies(self):
+        cache = PuzzleCache()
+        puzzle, solution = cache.get("M-2CB")
+        puzzle.cells[0] = solution.cells[0] = 0
+        again = cache.get("M-2CB")
+        self.assertEqual(boards_digest(again), PINNED_BOARDS["M-2CB"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,136 @@
+#! /usr/bin/env python3
+
+# ------------------------------------------------------------
+# tests/test_savegame.py
+# Tests for save files and the autosaver
+# By: Beck Bishp
+# Last Updated: 10/18/2026
+# ------------------------------------------------------------
+
+import os
+import random
+import tempfile
+import unittest
+
+from constants import MEDIUM_DIFFICULTY
+from game_core import GameCore
+from generate_puzzle import generate_boards
+from savegame import Autosaver, decode, encode, load_game, _HEADER
+
+
+def playing_core(seed=2026, box=3, puzzle_id="M-2CB"):
+    """A GameCore playing a fixed puzzle, with a few moves and pencil marks."""
+    core = GameCore(lambda difficulty, box: None, lambda puzzle_id: None)
+    core.start_game(*generate_boards(MEDIUM_DIFFICULTY, random.Random(seed), box), puzzle_id)
+    state = core.board_state
+    blanks = [divmod(idx, state.size) for idx, value in enumerate(core.puzzle_board.cells) if not value]
+    state.move(*blanks[0], 1)
+    state.move(*blanks[1], state.size)
+    state.move(*blanks[1], 2)
+    state.undo()
+    state.toggle_note(*blanks[2], 3)
+    state.toggle_note(*blanks[2], state.size)
+    return core
+
+
+class SaveFileTests(unittest.TestCase):
+
+    def test_round_trip(self):
+        for box in (2, 3, 4):
+            core = playing_core(box=box)
+            saved = decode(encode(core))
+            state = core.board_state
+            self.assertEqual(saved.puzzle_board, core.puzzle_board)
+            self.assertEqual(saved.solution_board, core.solution_board)
+            self.assertEqual(saved.player_board, state.player_board)
+            self.assertEqual(list(saved.notes), [mask for row in state.notes for mask in row])
+            self.assertEqual(list(saved.moves.entries), list(state.moves.entries))
+            self.assertEqual(saved.moves.position, state.moves.position)
+            self.assertEqual(saved.puzzle_id, "M-2CB")
+
+    def test_restored_game_plays_on(self):
+        core = playing_core()
+        other = GameCore(lambda difficulty, box: None, lambda puzzle_id: None)
+        other.restore(decode(encode(core)))
+        self.assertTrue(other.can_resume)
+        self.assertEqual(other.board_state.filled, core.board_state.filled)
+        self.assertEqual(other.board_state.notes, core.board_state.notes)
+        self.assertEqual(other.board_state.redo(), core.board_state.redo())
+        self.assertEqual(other.board_state.player_board, core.board_state.player_board)
+
+    def test_truncated_or_padded_saves_are_rejected(self):
+        data = encode(playing_core())
+        for bad in (b"", data[:_HEADER.size - 1], data[:_HEADER.size], data[:-1], data + b"\x00"):
+            with self.assertRaises(ValueError):
+                decode(bad)
+
+    def test_corrupt_saves_are_rejected(self):
+        data = encode(playing_core())
+        cells_start = _HEADER.size + len("M-2CB")
+        corrupt = {
+            "magic": b"XXXX" + data[4:],
+            "version": data[:4] + b"\x09\x00" + data[6:],
+            "box": data[:6] + b"\x07" + data[7:],
+            "cell value": data[:cells_start] + b"\x0a" + data[cells_start + 1:],
+            "move cell": data[:-6] + b"\x51\x00" + data[-4:],
+            "move value": data[:-2] + b"\x0a\x00",
+        }
+        for name, bad in corrupt.items():
+            with self.assertRaises(ValueError, msg=name):
+                decode(bad)
+
+
+class AutosaverTests(unittest.TestCase):
+
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.path = os.path.join(directory.name, "autosave.bin")
+
+    def save(self, core):
+        saver = Autosaver(self.path)
+        saver.update(core, force=True)
+        self.assertTrue(saver.flush(timeout=5))
+        return saver
+
+    def test_nothing_is_saved_before_a_move(self):
+        core = GameCore(lambda difficulty, box: None, lambda puzzle_id: None)
+        core.start_game(*generate_boards(MEDIUM_DIFFICULTY, random.Random(1)))
+        self.save(core)
+        self.assertFalse(os.path.exists(self.path))
+
+    def test_unfinished_save_is_not_overwritten(self):
+        self.save(playing_core(puzzle_id="M-2CB"))
+        saver = Autosaver(self.path)
+        self.assertFalse(saver.owns_file)
+        # Another game played without restoring the saved one
+        other = playing_core(seed=7, puzzle_id="M-7")
+        saver.update(other, force=True)
+        self.assertTrue(saver.flush(timeout=5))
+        self.assertEqual(load_game(self.path).puzzle_id, "M-2CB")
+
+    def test_restore_takes_over_the_save(self):
+        self.save(playing_core(puzzle_id="M-2CB"))
+        saver = Autosaver(self.path)
+        core = GameCore(lambda difficulty, box: None, lambda puzzle_id: None)
+        self.assertTrue(saver.restore(core))
+        self.assertTrue(saver.owns_file)
+        self.assertFalse(saver.restore(core))
+        core.board_state.redo()
+        saver.update(core, force=True)
+        self.assertTrue(saver.flush(timeout=5))
+        self.assertEqual(load_game(self.path).moves.position, core.board_state.moves.position)
+
+    def test_finished_game_removes_the_save(self):
+        core = playing_core()
+        saver = self.save(core)
+        self.assertTrue(os.path.exists(self.path))
+        core.board_state.fill_solution()
+        core.solution_revealed = True
+        saver.update(core)
+        self.assertTrue(saver.flush(timeout=5))
+        self.assertFalse(os.path.exists(self.path))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,51 @@
+#! /usr/bin/env python3
+
+# ------------------------------------------------------------
+# tests/test_solver.py
+# Tests for seeded grid generation
+# By: Beck Bishp
+# Last Updated: 10/18/2026
+# ------------------------------------------------------------
+
+import random
+import unittest
+
+from board import Board
+from constants import MEDIUM_DIFFICULTY
+from generate_puzzle import generate_boards
+from puzzle_ids import make_puzzle_id, puzzle_cache
+import solver
+
+# 9x9 grids from solver.generate(random.Random(seed)). Puzzle IDs are a
+# seed, so these must never change. Seeds 3035, 3339 and 6958 run past the
+# restart budget used for bigger boards.
+PINNED_GRIDS = {
+    0: "862451739453796281197283645726314598584972163319568427675829314238145976941637852",
+    3035: "278536941541289376369147582954321867683475129712968435435792618897614253126853794",
+    3339: "645897123721435896938216457157683249469521378283749561512968734876354912394172685",
+    6958: "752148396968723541143695287534812769691357824287469153479281635326574918815936472",
+}
+
+# generate_boards(MEDIUM_DIFFICULTY, random.Random(3035)), i.e. puzzle M-2CB
+PINNED_PUZZLE = "270036000001200376300100082904320000000400120712060000435700008000614003000850700"
+
+
+class SeededGenerationTests(unittest.TestCase):
+
+    def test_9x9_grids_are_pinned(self):
+        for seed, expected in PINNED_GRIDS.items():
+            grid = solver.generate(random.Random(seed))
+            self.assertEqual("".join(str(value) for row in grid for value in row), expected, seed)
+
+    def test_9x9_puzzle_is_pinned(self):
+        puzzle, solution = generate_boards(MEDIUM_DIFFICULTY, random.Random(3035))
+        self.assertEqual(puzzle.to_text(), PINNED_PUZZLE)
+        self.assertEqual(solution.to_text(), PINNED_GRIDS[3035])
+
+    def test_puzzle_id_rebuilds_pinned_puzzle(self):
+        puzzle, _ = puzzle_cache.get(make_puzzle_id(MEDIUM_DIFFICULTY, 3035))
+        self.assertEqual(puzzle, Board.from_text(PINNED_PUZZLE))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,83 @@
+#! /usr/bin/env python3
+
+# ------------------------------------------------------------
+# text_cache.py
+# Cache of rendered text surfaces for the Lofi Sudoku Game
+# By: Beck Bishp
+# Last Updated: 10/18/2026
+# ------------------------------------------------------------
+
+from collections import OrderedDict
+
+import pygame
+
+from board import SYMBOLS
+from constants import TEXT_CACHE_SIZE, NUM_CELLS
+
+
+def _prepare(surface):
+    # Converting to the display format makes every later blit cheaper, but
+    # is only possible once a display mode has been set.
+    if pygame.display.get_surface() is not None:
+        return surface.convert_alpha()
+    return surface
+
+
+# ------------------------------------------------------------
+# TextCache Class
+# ------------------------------------------------------------
+
+class TextCache:
+    """Least-recently-used cache of rendered text.
+
+    render() takes the same arguments as Font.render() and only rasterizes
+    text the first time a (font, text, antialias, color) combination is seen.
+    """
+
+    def __init__(self, maxsize=TEXT_CACHE_SIZE):
+        self.maxsize = maxsize
+        self.surfaces = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def render(self, font, text, antialias, color):
+        """Return the rendered surface for text, from the cache when possible."""
+        key = (font, text, antialias, tuple(color))
+        surface = self.surfaces.get(key)
+        if surface is not None:
+            self.surfaces.move_to_end(key)
+            self.hits += 1
+            return surface
+
+        self.misses += 1
+        surface = _prepare(font.render(text, antialias, color))
+        self.surfaces[key] = surface
+        if len(self.surfaces) > self.maxsize:
+            self.surfaces.popitem(last=False)
+        return surface
+
+    def clear(self):
+        self.surfaces.clear()
+
+
+# Shared cache used by all drawing code
+text_cache = TextCache()
+
+
+# ------------------------------------------------------------
+# DigitAtlas Class
+# ------------------------------------------------------------
+
+class DigitAtlas:
+    """Digits 1 up to count (letters past 9) pre-rendered once in each of a fixed set of colors."""
+
+    def __init__(self, font, colors, count=NUM_CELLS):
+        self.glyphs = {
+            (digit, tuple(color)): _prepare(font.render(SYMBOLS[digit], True, color))
+            for digit in range(1, count + 1)
+            for color in colors
+        }
+
+    def get(self, digit, color):
+        """Return the surface for a digit in one of the atlas colors."""
+        return self.glyphs[digit, tuple(color)]
@@ -0,0 +1,60 @@
+#! /usr/bin/env python3
+
+# ------------------------------------------------------------
+# transforms.py
+# Validity-preserving symmetry transforms of Sudoku grids
+# By: Beck Bishp
+# Last Updated: 10/18/2026
+# ------------------------------------------------------------
+#
+# Relabeling the digits, shuffling rows within a band, columns within a
+# stack, the bands, the stacks, and transposing all map a valid grid to
+# another valid grid: 9! * 6^8 * 2 (about 1.2 trillion) variants of one
+# 9x9 grid, and far more on the bigger boards.
+#
+# A puzzle and its solution transformed the same way stay a pair, with the
+# same number of solutions and needing the same techniques.
+
+import random
+
+from board import Board
+from constants import BOX_SIZE
+
+
+def _line_order(rng, box=BOX_SIZE):
+    """A random order of box * box lines that keeps each band (or stack) together."""
+    bands = rng.sample(range(box), box)
+    return [band * box + line for band in bands for line in rng.sample(range(box), box)]
+
+
+def random_transform(rng=random, box=BOX_SIZE):
+    """Pick a random transform for a board with box x box boxes. Returns (cell_map, digit_table).
+
+    cell_map[i] is the source index of target cell i, and digit_table is a
+    bytes.translate table that relabels the digits and leaves 0 (blank) alone.
+    """
+    size = box * box
+    rows = _line_order(rng, box)
+    cols = _line_order(rng, box)
+    if rng.random() < 0.5:
+        cell_map = [rows[r] * size + cols[c] for r in range(size) for c in range(size)]
+    else:
+        cell_map = [rows[c] * size + cols[r] for r in range(size) for c in range(size)]
+
+    digits = rng.sample(range(1, size + 1), size)
+    table = bytearray(range(256))
+    table[1:size + 1] = digits
+    return cell_map, bytes(table)
+
+
+def apply_transform(board, transform):
+    """Return a new Board with the transform applied, in one pass over the cells."""
+    cell_map, digit_table = transform
+    cells = board.cells
+    return Board(bytes([cells[i] for i in cell_map]).translate(digit_table))
+
+
+def transform_pair(puzzle, solution, rng=random):
+    """Apply the same random transform to a puzzle and its solution."""
+    transform = random_transform(rng, puzzle.box)
+    return apply_transform(puzzle, transform), apply_transform(solution, transform)